@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Cache backend benchmark
+
+Measures the cost of a single mark_processed call for each Cache backend while
+the cache already holds a growing number of processed IDs. The file-based JSON
+cache rewrites the whole ID set on every mark, so its cost grows with the cache;
+the SQLite and journal backends write one row or line and should stay flat.
+The journal backend additionally rewrites its snapshot once every
+CACHE_COMPACT_RECORDS changes, in a background thread.
+
+Usage:
+    python scripts/bench_cache.py [--sizes 1000 10000 100000] [--marks 200] [--backends json sqlite journal]
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+
+from bawue_scraper.adapters.cache_manager import CacheManager
+from bawue_scraper.adapters.journal_cache import JournalCache
+from bawue_scraper.adapters.sqlite_cache import SqliteCache
+from bawue_scraper.config import Config
+from bawue_scraper.ports.cache import Cache
+
+BACKENDS: dict[str, Callable[[Config], Cache]] = {
+    "json": CacheManager,
+    "sqlite": SqliteCache,
+    "journal": JournalCache,
+}
+
+
+def measure(factory: Callable[[Config], Cache], size: int, marks: int) -> float:
+    """Return the mean seconds per mark_processed on a cache pre-filled with ``size`` IDs."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = factory(Config(cache_dir=cache_dir))
+        cache.mark_processed_many(f"V-{i:07d}" for i in range(size))
+        # Let the journal backend finish compacting the pre-filled IDs before timing
+        cache.flush()
+        start = time.perf_counter()
+        for i in range(marks):
+            cache.mark_processed(f"N-{i:07d}")
+        cache.flush()
+        return (time.perf_counter() - start) / marks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="IDs already cached")
+    parser.add_argument("--marks", type=int, default=200, help="mark_processed calls per measurement (default: 200)")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    args = parser.parse_args()
+
+    print(f"{'backend':<10} " + " ".join(f"{size:>12,}" for size in args.sizes) + "   (µs per mark_processed)")
+    for name in args.backends:
+        costs = [measure(BACKENDS[name], size, args.marks) for size in args.sizes]
+        print(f"{name:<10} " + " ".join(f"{cost * 1e6:>12.1f}" for cost in costs))
+
+
+if __name__ == "__main__":
+    main()
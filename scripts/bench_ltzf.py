@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Submission benchmark against the local LTZF stand-in
+
+Starts bawue_scraper.testing.fake_ltzf in-process, submits synthetic Vorgänge
+through the real LtzfClient with an AIMD-limited thread pool (as the orchestrator
+does with LTZF_SUBMIT_CONCURRENCY) and reports throughput, latency percentiles,
+transport counters and the responses the server sent. Backoff delays are
+scaled down so that fault-injection runs finish quickly.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_ltzf.py [--vorgaenge 200] [--concurrency 8]
+        [--latency-ms 20] [--error-rate 0.05] [--rate-limit-rate 0.02] [--drop-rate 0.01]
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from bench_serialization import synthetic_vorgang
+
+from bawue_scraper.adapters.http_transport import RetryPolicy
+from bawue_scraper.adapters.ltzf_client import LtzfClient
+from bawue_scraper.adapters.sqlite_outbox import SqliteOutbox
+from bawue_scraper.concurrency import AimdLimiter
+from bawue_scraper.config import Config
+from bawue_scraper.testing.fake_ltzf import FakeLtzfServer, Faults
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vorgaenge", type=int, default=200, help="Vorgänge to submit (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Max concurrent submissions (default: 8)")
+    parser.add_argument("--volltext-kb", type=float, default=64, help="volltext per Dokument (default: 64)")
+    parser.add_argument("--compression", choices=["none", "gzip", "deflate"], default="none")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Server latency per PUT (default: 20)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra server latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of PUTs answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of PUTs answered with 429")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of PUTs dropped without response")
+    parser.add_argument("--backoff-scale", type=float, default=0.01, help="Factor for retry delays (default: 0.01)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Retry and fault logs would drown the report
+    logging.basicConfig(level=logging.CRITICAL)
+    scale = args.backoff_scale
+    faults = Faults(
+        latency_s=args.latency_ms / 1000,
+        latency_jitter_s=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_s=10 * scale,
+        drop_rate=args.drop_rate,
+    )
+    default = RetryPolicy()
+    policy = RetryPolicy(
+        connection_backoff_s=tuple(s * scale for s in default.connection_backoff_s),
+        server_error_backoff_s=tuple(s * scale for s in default.server_error_backoff_s),
+        rate_limit_default_s=default.rate_limit_default_s * scale,
+        max_retry_after_s=default.max_retry_after_s * scale,
+    )
+    template = synthetic_vorgang(2, args.volltext_kb / 1024)
+    vorgaenge = [template.model_copy(update={"api_id": uuid4()}) for _ in range(args.vorgaenge)]
+
+    with FakeLtzfServer(faults=faults, seed=args.seed) as server, tempfile.TemporaryDirectory() as cache_dir:
+        config = Config(
+            ltzf_api_url=server.url,
+            ltzf_api_key="bench",
+            ltzf_submit_concurrency=args.concurrency,
+            ltzf_request_compression=args.compression,
+            circuit_breaker_threshold=10**6,
+            cache_dir=cache_dir,
+        )
+        outbox = SqliteOutbox(config)
+        client = LtzfClient(config, outbox, retry_policy=policy)
+        limiter = AimdLimiter(args.concurrency)
+        latencies: list[float] = []
+
+        def submit(vorgang) -> bool:
+            limiter.acquire()
+            started = time.monotonic()
+            ok = False
+            try:
+                ok = client.submit_vorgang(vorgang)
+            finally:
+                latency = time.monotonic() - started
+                latencies.append(latency)
+                limiter.release(latency, ok)
+            return ok
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(submit, vorgaenge))
+        elapsed = time.monotonic() - started
+
+        print(f"{args.vorgaenge} Vorgänge, concurrency <= {args.concurrency}, server latency {args.latency_ms:g} ms")
+        print(f"elapsed         {elapsed:.2f} s")
+        print(f"throughput      {args.vorgaenge / elapsed:.1f} Vorgänge/s")
+        print(f"latency p50     {statistics.median(latencies) * 1000:.1f} ms")
+        print(f"latency p95     {statistics.quantiles(latencies, n=20)[-1] * 1000:.1f} ms")
+        print(f"accepted        {sum(results)} (stored {len(server.vorgaenge)}, outbox {outbox.count()})")
+        print(f"final limit     {limiter.limit}")
+        print(f"client          {client.counters()}")
+        print(f"server statuses {dict(sorted(server.status_counts().items()))}")
+
+
+if __name__ == "__main__":
+    main()
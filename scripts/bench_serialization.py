@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Serialisation benchmark for Vorgang request bodies
+
+Compares the previous path (model_dump to a dict tree, then the stdlib json
+encoder, then encode to UTF-8) with the direct pydantic-core path used by
+LtzfClient (domain.serialization.to_json_bytes) and the incremental path used
+for streamed request bodies (iter_json_chunks) on synthetic Vorgänge with
+large volltext documents. Reports wall time, CPU time and peak traced memory.
+
+Usage:
+    python scripts/bench_serialization.py [--documents 8] [--volltext-mb 1.0] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from uuid import uuid4
+
+from bawue_scraper.domain.enums import Dokumententyp, Stationstyp, Vorgangstyp
+from bawue_scraper.domain.models import Autor, Dokument, Gremium, Station, Vorgang
+from bawue_scraper.domain.serialization import iter_json_chunks, to_json_bytes
+
+# Typical parliamentary prose including umlauts, so non-ASCII encoding is exercised
+SAMPLE_TEXT = "Der Landtag wolle beschließen, die Landesregierung zu ersuchen, über Maßnahmen zu berichten. "
+
+
+def synthetic_vorgang(documents: int, volltext_mb: float) -> Vorgang:
+    """Build a Vorgang with ``documents`` Drucksachen of roughly ``volltext_mb`` MB volltext each."""
+    volltext_chars = int(volltext_mb * 1024 * 1024)
+    now = datetime(2026, 2, 4, 12, 0)
+    autor = Autor(organisation="Fraktion GRÜNE")
+    dokumente = [
+        Dokument(
+            titel=f"Drucksache 17/{10000 + i}",
+            volltext=(SAMPLE_TEXT * (volltext_chars // len(SAMPLE_TEXT) + 1))[:volltext_chars] + str(i),
+            hash=f"{i:064x}",
+            typ=Dokumententyp.ENTWURF,
+            zp_modifiziert=now,
+            zp_referenz=now,
+            link=f"https://www.landtag-bw.de/files/live/sites/LTBW/files/dokumente/WP17/Drucksachen/{i}.pdf",
+            autoren=[autor],
+        )
+        for i in range(documents)
+    ]
+    station = Station(
+        typ=Stationstyp.PARL_INITIATIV,
+        zp_start=now,
+        dokumente=dokumente,
+        gremium=Gremium(name="Plenum"),
+    )
+    return Vorgang(
+        api_id=uuid4(),
+        titel="Gesetz zur Änderung des Landesverwaltungsgesetzes",
+        typ=Vorgangstyp.GG_LAND_PARL,
+        wahlperiode=17,
+        verfassungsaendernd=False,
+        initiatoren=[autor],
+        stationen=[station],
+        ids=["V-1"],
+    )
+
+
+def dict_path(vorgang: Vorgang) -> bytes:
+    """The previous path: dict tree, stdlib json, then UTF-8 encoding."""
+    return json.dumps(vorgang.model_dump(mode="json", exclude_none=True), ensure_ascii=False).encode("utf-8")
+
+
+def streamed_path(vorgang: Vorgang) -> int:
+    """The streamed-body path: each chunk is dropped once counted, as when it has been sent."""
+    return sum(len(chunk) for chunk in iter_json_chunks(vorgang))
+
+
+def measure(fn: Callable[[Vorgang], int], vorgang: Vorgang, repeat: int) -> tuple[float, float, int, int]:
+    """Return best wall time, best CPU time, peak traced bytes and body size."""
+    wall, cpu = [], []
+    for _ in range(repeat):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        fn(vorgang)
+        wall.append(time.perf_counter() - wall_start)
+        cpu.append(time.process_time() - cpu_start)
+
+    tracemalloc.start()
+    size = fn(vorgang)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(wall), min(cpu), peak, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=8, help="Dokumente per Vorgang (default: 8)")
+    parser.add_argument("--volltext-mb", type=float, default=1.0, help="volltext size per Dokument (default: 1.0)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    vorgang = synthetic_vorgang(args.documents, args.volltext_mb)
+    assert json.loads(dict_path(vorgang)) == json.loads(to_json_bytes(vorgang)), "paths produce different payloads"
+    assert b"".join(iter_json_chunks(vorgang)) == to_json_bytes(vorgang), "streamed body differs"
+
+    print(f"Vorgang with {args.documents} Dokumente x {args.volltext_mb} MB volltext")
+    print(f"{'path':<28} {'wall ms':>9} {'cpu ms':>9} {'peak MB':>9} {'body MB':>9}")
+    paths: list[tuple[str, Callable[[Vorgang], int]]] = [
+        ("model_dump + json.dumps", lambda v: len(dict_path(v))),
+        ("to_json_bytes", lambda v: len(to_json_bytes(v))),
+        ("iter_json_chunks", streamed_path),
+    ]
+    for name, fn in paths:
+        wall, cpu, peak, size = measure(fn, vorgang, args.repeat)
+        print(f"{name:<28} {wall * 1000:>9.1f} {cpu * 1000:>9.1f} {peak / 2**20:>9.1f} {size / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,48 @@
 
 import argparse
 import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from collections.abc import Callable
 from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import requests
 
 from bawue_scraper.adapters.cache_manager import CacheManager
+from bawue_scraper.adapters.checkpoint_file import FileCheckpoint
 from bawue_scraper.adapters.ics_adapter import IcsAdapter
+from bawue_scraper.adapters.journal_cache import JournalCache
 from bawue_scraper.adapters.logging_ltzf_client import LoggingLtzfClient
 from bawue_scraper.adapters.ltzf_client import LtzfClient
+from bawue_scraper.adapters.ndjson_sink import NdjsonFileSink
 from bawue_scraper.adapters.parlis_adapter import ParlisAdapter
 from bawue_scraper.adapters.pdf_extractor import PdfExtractor
+from bawue_scraper.adapters.rate_limiters import SqliteRateLimiter
+from bawue_scraper.adapters.run_locks import FileRunLock, SqliteRunLock
+from bawue_scraper.adapters.sqlite_cache import SqliteCache
+from bawue_scraper.adapters.sqlite_fingerprint_store import SqliteFingerprintStore
+from bawue_scraper.adapters.sqlite_outbox import SqliteOutbox
+from bawue_scraper.adapters.sqlite_revalidation_store import SqliteRevalidationStore
+from bawue_scraper.adapters.sqlite_work_queue import SqliteWorkQueue
+from bawue_scraper.bootstrap import bootstrap_cache
+from bawue_scraper.bulk_upload import export_files, upload_exports
 from bawue_scraper.config import Config
+from bawue_scraper.leader import LeaderLease
 from bawue_scraper.orchestrator import DEFAULT_VORGANGSTYPEN, Orchestrator
+from bawue_scraper.ports.cache import Cache
+from bawue_scraper.ports.run_lock import RunLock
+from bawue_scraper.scheduler import Scheduler
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+# EX_TEMPFAIL: the run did not finish (drained on SIGTERM/SIGINT, lost or could not get the run lock);
+# the remaining work resumes on the next run
+EXIT_DRAINED = 75
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -43,40 +75,197 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Only scrape and submit Vorgänge (skip calendar)",
     )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Stop starting new work after this many seconds (per cycle with --daemon); "
+        "unfinished Vorgangstypen are resumed next run",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and scrape at SCRAPE_INTERVAL_HOURS (per-type cadences via VORGANGSTYP_INTERVAL_HOURS)",
+    )
     parser.add_argument(
         "--log-level",
         default=None,
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Override the log level from config",
     )
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser(
+        "plan",
+        help="Enqueue search units per Vorgangstyp and monthly window into the shared work queue and exit",
+    )
+    worker = subparsers.add_parser(
+        "worker",
+        help="Lease and process units from the shared work queue",
+    )
+    worker.add_argument(
+        "--worker-id",
+        default=None,
+        help="Lease owner identifier (default: <hostname>-<pid>)",
+    )
+    worker.add_argument(
+        "--exit-when-empty",
+        action="store_true",
+        help="Exit once no units are pending or leased instead of polling for new work",
+    )
+    subparsers.add_parser(
+        "replay",
+        help="Resubmit payloads queued in the outbox while LTZF was unreachable and exit",
+    )
+    subparsers.add_parser(
+        "bootstrap",
+        help="Mark the Vorgänge LTZF already holds for this Wahlperiode as processed (warm start) and exit",
+    )
+    upload = subparsers.add_parser(
+        "upload",
+        help="Submit NDJSON exports written with LTZF_MODE=file to LTZF_API_URL in parallel and exit",
+    )
+    upload.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Export files to upload (default: all finished files in EXPORT_DIR, oldest first)",
+    )
+    upload.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum concurrent submissions, adapted to the backend's response (default: 8)",
+    )
     return parser
 
 
-def main(argv: list[str] | None = None) -> None:
-    """Main entry point."""
+def _install_stop_handlers(stop: Callable[[], None]) -> dict:
+    """Route SIGTERM and SIGINT to a graceful stop.
+
+    A second signal falls back to the previous handler, so a repeated Ctrl-C or
+    SIGTERM still terminates immediately.
+
+    Returns:
+        The previous handlers, for :func:`_restore_handlers`.
+    """
+    previous = {}
+
+    def handler(signum: int, frame: object) -> None:
+        logger.warning("Received %s, draining in-flight work before exiting", signal.Signals(signum).name)
+        signal.signal(signum, previous[signum])
+        stop()
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        previous[signum] = signal.signal(signum, handler)
+    return previous
+
+
+def _restore_handlers(previous: dict) -> None:
+    for signum, handler in previous.items():
+        signal.signal(signum, handler)
+
+
+def _build_run_lock(config: Config) -> RunLock | None:
+    if config.run_lock_backend == "sqlite":
+        return SqliteRunLock(config)
+    if config.run_lock_backend == "file":
+        return FileRunLock(config)
+    return None
+
+
+def _build_cache(config: Config) -> Cache:
+    if config.cache_backend == "sqlite":
+        return SqliteCache(config)
+    if config.cache_backend == "journal":
+        return JournalCache(config)
+    return CacheManager(config)
+
+
+def _upload(config: Config, paths: list[Path], concurrency: int) -> int:
+    """Upload NDJSON exports to the backend.
+
+    Uploads touch no scraper state, so neither the cache nor the PARLIS adapter is
+    built and no run lock is taken; they always go to the backend, whatever
+    LTZF_MODE says.
+
+    Returns:
+        EXIT_OK, or EXIT_DRAINED after a graceful stop on SIGTERM/SIGINT.
+    """
+    stopping = threading.Event()
+    upload_config = config.model_copy(update={"ltzf_submit_concurrency": concurrency})
+    previous_handlers = _install_stop_handlers(stopping.set)
+    try:
+        upload_exports(
+            paths or export_files(Path(config.export_dir)),
+            LtzfClient(upload_config, outbox=SqliteOutbox(config)),
+            concurrency=concurrency,
+            stop=stopping,
+        )
+    finally:
+        _restore_handlers(previous_handlers)
+    if stopping.is_set():
+        logger.warning("Stopped after draining; exiting with code %d", EXIT_DRAINED)
+        return EXIT_DRAINED
+    return EXIT_OK
+
+
+def _default_owner() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point.
+
+    Returns:
+        The process exit code: EXIT_OK, or EXIT_DRAINED after a graceful stop on SIGTERM/SIGINT
+        or when another process holds the run lock.
+    """
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.daemon and (args.command or args.date_from or args.date_to):
+        parser.error("--daemon scrapes a rolling lookback window and cannot be combined with dates or commands")
 
     config = Config()  # type: ignore[call-arg]  # pydantic-settings populates fields from env
-
     log_level = args.log_level or config.log_level
     logging.basicConfig(
         level=getattr(logging, log_level),
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
+    if args.command == "upload":
+        return _upload(config, args.paths, args.concurrency)
 
-    # Wire up adapters
-    parlis = ParlisAdapter(config)
+    # The journal cache never reloads and rotates its files under other writers, so it needs the run lock
+    if config.cache_backend == "journal" and (args.command == "worker" or config.run_lock_backend == "none"):
+        parser.error(
+            "CACHE_BACKEND=journal is only safe for a single process; use json or sqlite "
+            "for workers and with RUN_LOCK_BACKEND=none"
+        )
+
+    # Wire up adapters (workers share the PARLIS rate limit through the cache directory)
+    if args.command == "worker":
+        parlis = ParlisAdapter(config, rate_limiter=SqliteRateLimiter(config))
+    else:
+        parlis = ParlisAdapter(config)
     pdf_extractor = PdfExtractor(config)
     ics = IcsAdapter(config)
-    cache = CacheManager(config)
+    cache = _build_cache(config)
+    revalidation = None
+    if config.revalidate_interval_days or config.revalidate_answer_due_days > 0:
+        revalidation = SqliteRevalidationStore(config)
 
+    # Fingerprints are only recorded for real submissions, so a dry run never suppresses a later live one
+    fingerprints = None
     if config.ltzf_mode == "live":
-        ltzf = LtzfClient(config)
-        logging.getLogger(__name__).info("LTZF mode: live (submitting to %s)", config.ltzf_api_url)
+        ltzf = LtzfClient(config, outbox=SqliteOutbox(config))
+        fingerprints = SqliteFingerprintStore(config)
+        logger.info("LTZF mode: live (submitting to %s)", config.ltzf_api_url)
+    elif config.ltzf_mode == "file":
+        ltzf = NdjsonFileSink(config)
+        logger.info("LTZF mode: file (writing NDJSON exports to %s)", config.export_dir)
     else:
         ltzf = LoggingLtzfClient()
-        logging.getLogger(__name__).info("LTZF mode: dry-run (logging only, set LTZF_MODE=live to submit)")
+        logger.info("LTZF mode: dry-run (logging only, set LTZF_MODE=live to submit)")
 
     orchestrator = Orchestrator(
         config=config,
@@ -85,6 +274,9 @@ def main(argv: list[str] | None = None) -> None:
         calendar_source=ics,
         ltzf_api=ltzf,
         cache=cache,
+        checkpoint=FileCheckpoint(config),
+        fingerprints=fingerprints,
+        revalidation=revalidation,
     )
 
     # Build override kwargs from CLI args
@@ -95,18 +287,87 @@ def main(argv: list[str] | None = None) -> None:
         overrides["date_from"] = datetime.strptime(args.date_from, "%d.%m.%Y").date()
     if args.date_to:
         overrides["date_to"] = datetime.strptime(args.date_to, "%d.%m.%Y").date()
+    if args.time_budget is not None:
+        overrides["time_budget_s"] = args.time_budget
 
-    if args.kalender_only:
-        orchestrator.run_kalender()
-    elif args.vorgaenge_only:
-        orchestrator.run_vorgaenge(
-            vorgangstypen=overrides.get("vorgangstypen", DEFAULT_VORGANGSTYPEN),
-            date_from=overrides.get("date_from", date.today() - timedelta(days=config.scrape_lookback_days)),
-            date_to=overrides.get("date_to", date.today()),
-        )
-    else:
-        orchestrator.run(**overrides)
+    scheduler: Scheduler | None = None
+    stopping = threading.Event()
+
+    def stop() -> None:
+        stopping.set()
+        orchestrator.request_stop()
+        if scheduler is not None:
+            scheduler.stop()
+
+    # Workers coordinate through the work queue; every other mode elects a single active runner
+    run_lock = _build_run_lock(config) if args.command != "worker" else None
+    leader = LeaderLease(run_lock, _default_owner(), config.run_lock_lease_s, on_lost=stop) if run_lock else None
+
+    previous_handlers = _install_stop_handlers(stop)
+    try:
+        if leader is not None and not leader.acquire():
+            if not args.daemon:
+                logger.warning("Another process holds the run lock in %s, exiting", config.cache_dir)
+                return EXIT_DRAINED
+            if not leader.wait(stopping):
+                return EXIT_DRAINED
+        if args.daemon:
+            scheduler = Scheduler(
+                config,
+                orchestrator,
+                vorgangstypen=overrides.get("vorgangstypen", DEFAULT_VORGANGSTYPEN),
+                include_vorgaenge=not args.kalender_only,
+                include_kalender=not args.vorgaenge_only,
+                time_budget_s=overrides.get("time_budget_s"),
+            )
+            try:
+                scheduler.run_forever()
+            except KeyboardInterrupt:
+                logger.info("Daemon interrupted, exiting.")
+        elif args.command == "plan":
+            orchestrator.plan_work(
+                SqliteWorkQueue(config),
+                vorgangstypen=overrides.get("vorgangstypen", DEFAULT_VORGANGSTYPEN),
+                date_from=overrides.get("date_from", date.today() - timedelta(days=config.scrape_lookback_days)),
+                date_to=overrides.get("date_to", date.today()),
+            )
+        elif args.command == "worker":
+            orchestrator.run_worker(
+                SqliteWorkQueue(config),
+                worker_id=args.worker_id or _default_owner(),
+                exit_when_empty=args.exit_when_empty,
+            )
+        elif args.command == "replay":
+            logger.info("Replayed %d outbox entries", ltzf.replay_pending())
+        elif args.command == "bootstrap":
+            # The read API is public, so this works in every LTZF_MODE
+            try:
+                bootstrap_cache(LtzfClient(config).iter_vorgaenge(config.wahlperiode), cache)
+            except requests.RequestException as e:
+                logger.error("Bootstrap aborted, the Vorgänge read so far are kept: %s", e)
+                return EXIT_DRAINED
+        elif args.kalender_only:
+            orchestrator.run_kalender()
+        elif args.vorgaenge_only:
+            orchestrator.run_vorgaenge(
+                vorgangstypen=overrides.get("vorgangstypen", DEFAULT_VORGANGSTYPEN),
+                date_from=overrides.get("date_from", date.today() - timedelta(days=config.scrape_lookback_days)),
+                date_to=overrides.get("date_to", date.today()),
+                time_budget_s=overrides.get("time_budget_s"),
+            )
+        else:
+            orchestrator.run(**overrides)
+    finally:
+        ltzf.flush()
+        if leader is not None:
+            leader.release()
+        _restore_handlers(previous_handlers)
+
+    if orchestrator.stop_requested:
+        logger.warning("Stopped after draining; exiting with code %d", EXIT_DRAINED)
+        return EXIT_DRAINED
+    return EXIT_OK
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,10 +1,15 @@
 """File-based cache manager for tracking processed Vorgänge."""
 
+import fcntl
 import json
 import logging
 import os
 import tempfile
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 from bawue_scraper.config import Config
 from bawue_scraper.ports.cache import Cache
@@ -12,50 +17,224 @@ from bawue_scraper.ports.cache import Cache
 logger = logging.getLogger(__name__)
 
 
+def processed_from_json(data: Any) -> dict[str, str | None]:
+    """Read the ``processed.json`` format: an object of IDs to source fingerprints, or a plain list of IDs.
+
+    Raises:
+        TypeError: If the data is neither.
+    """
+    if isinstance(data, dict):
+        return {str(vorgang_id): fingerprint for vorgang_id, fingerprint in data.items()}
+    if isinstance(data, list):
+        return dict.fromkeys(map(str, data))
+    raise TypeError(f"Expected an object or a list, got {type(data).__name__}")
+
+
+def processed_to_json(processed: Mapping[str, str | None]) -> str:
+    """Write the ``processed.json`` format, sorted by ID."""
+    return json.dumps(dict(sorted(processed.items())), ensure_ascii=False)
+
+
+def store_mark(processed: dict[str, str | None], vorgang_id: str, source_fingerprint: str | None) -> bool:
+    """Record a mark in an ID -> source fingerprint mapping.
+
+    Returns:
+        True if the mapping changed.
+    """
+    if vorgang_id in processed and source_fingerprint in (None, processed[vorgang_id]):
+        return False
+    processed[vorgang_id] = source_fingerprint or processed.get(vorgang_id)
+    return True
+
+
+def select_changed(
+    processed: dict[str, str | None], vorgang_ids: Iterable[str], source_fingerprints: Mapping[str, str]
+) -> tuple[list[str], dict[str, str]]:
+    """Apply the :meth:`Cache.filter_unprocessed` rules to an ID -> source fingerprint mapping.
+
+    Returns:
+        The unprocessed IDs, and the fingerprints to adopt for processed IDs that have none stored.
+    """
+    unprocessed: list[str] = []
+    adopted: dict[str, str] = {}
+    for vorgang_id in vorgang_ids:
+        if vorgang_id not in processed:
+            unprocessed.append(vorgang_id)
+            continue
+        stored, current = processed[vorgang_id], source_fingerprints.get(vorgang_id)
+        if current is None or stored == current:
+            continue
+        if stored is None:
+            adopted[vorgang_id] = current
+        else:
+            unprocessed.append(vorgang_id)
+    return unprocessed, adopted
+
+
 class CacheManager(Cache):
-    """Implements Cache using file-based storage (no external dependencies)."""
+    """Implements Cache using file-based storage (no external dependencies).
+
+    ``processed.json`` maps each processed ID to its source fingerprint (or null).
+    Files from before fingerprints were stored hold a list of IDs and are read as
+    IDs without a fingerprint. Every change rewrites the file; inside a
+    :meth:`batch` it is written once per commit point instead.
+
+    Several processes may share ``cache_dir``. Each write takes an exclusive
+    ``flock`` on ``processed.json.lock``, reads the file again and applies only
+    this instance's changes since its last write, so marks and invalidations of
+    other processes are kept. Lookups reload the file when another process has
+    replaced it. ``flock`` is unreliable on network filesystems; use the
+    ``sqlite`` backend there.
+    """
 
     def __init__(self, config: Config) -> None:
         self._config = config
         self._cache_dir = Path(config.cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._cache_file = self._cache_dir / "processed.json"
-        self._processed: set[str] = self._load()
+        self._lock_file = self._cache_dir / "processed.json.lock"
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # Changes not yet written: ID -> (processed, source fingerprint)
+        self._pending: dict[str, tuple[bool, str | None]] = {}
+        self._file_version: tuple[int, int, int] | None = None
+        self._processed: dict[str, str | None] = self._load()
 
-    def _load(self) -> set[str]:
-        if not self._cache_file.exists():
-            return set()
+    def _load(self) -> dict[str, str | None]:
+        """Read ``processed.json`` and remember which version of the file was read."""
         try:
+            stat = self._cache_file.stat()
             text = self._cache_file.read_text(encoding="utf-8")
-            if not text.strip():
-                return set()
-            data = json.loads(text)
-            return set(data)
+        except FileNotFoundError:
+            self._file_version = None
+            return {}
+        self._file_version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if not text.strip():
+            return {}
+        try:
+            return processed_from_json(json.loads(text))
         except (json.JSONDecodeError, TypeError):
             logger.warning("Corrupt cache file %s, starting fresh", self._cache_file)
-            return set()
+            return {}
 
-    def _save(self) -> None:
-        data = json.dumps(sorted(self._processed), ensure_ascii=False)
-        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+    def _current_version(self) -> tuple[int, int, int] | None:
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(data)
-            os.replace(tmp_path, self._cache_file)
-        except BaseException:
-            os.unlink(tmp_path)
-            raise
+            stat = self._cache_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> None:
+        """Reload the file if another process replaced it, keeping unwritten changes; the caller holds the lock."""
+        if self._current_version() != self._file_version:
+            self._processed = self._merged(self._load())
+
+    def _merged(self, processed: dict[str, str | None]) -> dict[str, str | None]:
+        """Apply the unwritten changes to a state read from disk."""
+        for vorgang_id, (done, fingerprint) in self._pending.items():
+            if done:
+                store_mark(processed, vorgang_id, fingerprint)
+            else:
+                processed.pop(vorgang_id, None)
+        return processed
+
+    def _changed(self, changes: dict[str, tuple[bool, str | None]]) -> None:
+        """Persist changes now, or at the next commit point inside a batch; the caller holds the lock."""
+        for vorgang_id, (done, fingerprint) in changes.items():
+            pending = self._pending.get(vorgang_id)
+            if done and fingerprint is None and pending is not None and pending[0]:
+                continue  # keep the fingerprint of an earlier unwritten mark
+            self._pending[vorgang_id] = (done, fingerprint)
+        if not self._batch_depth:
+            self._save()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive flock shared by all processes using this cache directory."""
+        with self._lock_file.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _save(self) -> None:
+        """Merge the unwritten changes into the file on disk and replace it; the caller holds the lock."""
+        if not self._pending:
+            return
+        with self._file_lock():
+            processed = self._merged(self._load())
+            data = processed_to_json(processed)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._file_version = self._current_version()
+        self._processed = processed
+        self._pending = {}
 
     def is_processed(self, vorgang_id: str) -> bool:
         """Check if a Vorgang has already been processed."""
-        return vorgang_id in self._processed
+        with self._lock:
+            self._refresh()
+            return vorgang_id in self._processed
+
+    def filter_unprocessed(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> list[str]:
+        """Select the Vorgänge not in the cache or whose source fingerprint has changed."""
+        with self._lock:
+            self._refresh()
+            unprocessed, adopted = select_changed(self._processed, vorgang_ids, source_fingerprints or {})
+            if adopted:
+                self._processed.update(adopted)
+                self._changed({vorgang_id: (True, fingerprint) for vorgang_id, fingerprint in adopted.items()})
+        return unprocessed
 
-    def mark_processed(self, vorgang_id: str) -> None:
+    def mark_processed(self, vorgang_id: str, *, source_fingerprint: str | None = None) -> None:
         """Mark a Vorgang as processed."""
-        self._processed.add(vorgang_id)
-        self._save()
+        with self._lock:
+            self._refresh()
+            if store_mark(self._processed, vorgang_id, source_fingerprint):
+                self._changed({vorgang_id: (True, source_fingerprint)})
+
+    def mark_processed_many(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> None:
+        """Mark several Vorgänge as processed with a single write."""
+        fingerprints = source_fingerprints or {}
+        with self._lock:
+            self._refresh()
+            changes = {
+                vorgang_id: (True, fingerprints.get(vorgang_id))
+                for vorgang_id in vorgang_ids
+                if store_mark(self._processed, vorgang_id, fingerprints.get(vorgang_id))
+            }
+            if changes:
+                self._changed(changes)
 
     def invalidate(self, vorgang_id: str) -> None:
         """Remove a Vorgang from the cache for re-processing."""
-        self._processed.discard(vorgang_id)
-        self._save()
+        with self._lock:
+            self._processed.pop(vorgang_id, None)
+            self._changed({vorgang_id: (False, None)})
+
+    def flush(self) -> None:
+        """Write the changes made inside a batch since the last commit point."""
+        with self._lock:
+            self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Write ``processed.json`` once when the outermost batch exits, instead of on every change."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = not self._batch_depth
+            if outermost:
+                self.flush()
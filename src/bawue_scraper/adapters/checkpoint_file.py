@@ -0,0 +1,64 @@
+"""File-based checkpoint of searches deferred to the next run."""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.checkpoint import Checkpoint, PendingSearch
+
+logger = logging.getLogger(__name__)
+
+
+class FileCheckpoint(Checkpoint):
+    """Implements Checkpoint as a JSON file in ``cache_dir``."""
+
+    def __init__(self, config: Config) -> None:
+        self._cache_dir = Path(config.cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._checkpoint_file = self._cache_dir / "checkpoint.json"
+
+    def load(self) -> list[PendingSearch]:
+        """Load pending searches; a missing or corrupt file yields an empty list."""
+        if not self._checkpoint_file.exists():
+            return []
+        try:
+            data = json.loads(self._checkpoint_file.read_text(encoding="utf-8"))
+            return [
+                PendingSearch(
+                    vorgangstyp=entry["vorgangstyp"],
+                    date_from=date.fromisoformat(entry["date_from"]),
+                    date_to=date.fromisoformat(entry["date_to"]),
+                )
+                for entry in data.get("pending", [])
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+            logger.warning("Corrupt checkpoint file %s, ignoring", self._checkpoint_file)
+            return []
+
+    def save(self, pending: list[PendingSearch]) -> None:
+        """Atomically replace the checkpoint file."""
+        data = json.dumps(
+            {
+                "pending": [
+                    {
+                        "vorgangstyp": p.vorgangstyp,
+                        "date_from": p.date_from.isoformat(),
+                        "date_to": p.date_to.isoformat(),
+                    }
+                    for p in pending
+                ]
+            },
+            ensure_ascii=False,
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self._checkpoint_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
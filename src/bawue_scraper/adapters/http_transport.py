@@ -0,0 +1,283 @@
+"""Shared HTTP transport: sized connection pool, retries with backoff, per-host circuit breaker."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from bawue_scraper.ports.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request while the circuit for its host is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries and backoff per failure class (see docs/architecture.md §9)."""
+
+    connection_backoff_s: tuple[float, ...] = (2.0, 4.0, 8.0)
+    server_error_backoff_s: tuple[float, ...] = (5.0, 10.0, 20.0)
+    rate_limit_retries: int = 5
+    # Used when a 429 response has no usable Retry-After header
+    rate_limit_default_s: float = 10.0
+    max_retry_after_s: float = 300.0
+
+
+@dataclass
+class TransportCounters:
+    """Request statistics of one transport."""
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    circuit_opened: int = 0
+    circuit_rejected: int = 0
+    circuit_open_s: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Counters as a flat mapping for logging."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "circuit_opened": self.circuit_opened,
+            "circuit_rejected": self.circuit_rejected,
+            "circuit_open_s": round(self.circuit_open_s, 1),
+        }
+
+
+@dataclass
+class _Circuit:
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+
+
+class HttpTransport:
+    """A ``requests.Session`` wrapper that retries transient failures and protects failing hosts.
+
+    - Connection errors and timeouts are retried with ``connection_backoff_s``, HTTP 5xx
+      with ``server_error_backoff_s``, HTTP 429 after its ``Retry-After``. Other 4xx
+      responses are returned to the caller unchanged.
+    - With a ``deadline``, no retry is started whose backoff would end past it, and no
+      attempt's timeout reaches past it, so a caller's own deadline is not overrun.
+    - After ``breaker_threshold`` consecutive failed attempts against a host, its circuit
+      opens: requests fail fast with :class:`CircuitOpenError` for ``breaker_cooldown_s``.
+      The first request after the cooldown is let through as a trial; success closes the
+      circuit, failure opens it again.
+
+    Adapters configure headers and redirects on :attr:`session` and send every request
+    through :meth:`request`. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        timeout_s: float | None = None,
+        policy: RetryPolicy | None = None,
+        breaker_threshold: int = 5,
+        breaker_cooldown_s: float = 300.0,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self._timeout_s = timeout_s
+        self._policy = policy or RetryPolicy()
+        self._breaker_threshold = breaker_threshold
+        self._breaker_cooldown_s = breaker_cooldown_s
+        self._rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._counters = TransportCounters()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def counters(self) -> TransportCounters:
+        """Snapshot of the counters; open circuits contribute their time open so far."""
+        with self._lock:
+            now = time.monotonic()
+            still_open = sum(now - c.opened_at for c in self._circuits.values() if c.opened_at is not None)
+            return TransportCounters(
+                requests=self._counters.requests,
+                retries=self._counters.retries,
+                failures=self._counters.failures,
+                circuit_opened=self._counters.circuit_opened,
+                circuit_rejected=self._counters.circuit_rejected,
+                circuit_open_s=self._counters.circuit_open_s + still_open,
+            )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Callable[[], object] | None = None,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            body: Called before every attempt to produce the request body, for bodies that can
+                be read only once (a chunk iterator, or a file that has to be rewound).
+            deadline: Optional ``time.monotonic()`` limit for all attempts and backoff waits;
+                once a retry would not finish before it, the last failure is returned or raised.
+            **kwargs: Passed on to ``requests.Session.request``.
+
+        Returns:
+            The final response; 5xx/429 responses are returned once their retries are used up.
+
+        Raises:
+            CircuitOpenError: If the circuit for the host is open.
+            requests.RequestException: If the last attempt failed without a response.
+        """
+        timeout = kwargs.pop("timeout", self._timeout_s)
+        host = urlsplit(url).netloc
+        policy = self._policy
+        attempt = {"connection": 0, "server": 0, "rate_limit": 0}
+
+        while True:
+            kwargs["timeout"] = _capped_timeout(timeout, deadline)
+            self._check_circuit(host)
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            with self._lock:
+                self._counters.requests += 1
+
+            try:
+                if body is not None:
+                    kwargs["data"] = body()
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # No retries once the circuit has opened: the host is considered down
+                circuit_open = self._record_failure(host)
+                wait_s = None if circuit_open else self._backoff(policy.connection_backoff_s, attempt, "connection")
+                wait_s = _before_deadline(wait_s, deadline)
+                if wait_s is None:
+                    raise
+                logger.warning("%s %s failed (%s), retrying in %gs", method, url, e, wait_s)
+            else:
+                if resp.status_code >= 500:
+                    circuit_open = self._record_failure(host)
+                    wait_s = None if circuit_open else self._backoff(policy.server_error_backoff_s, attempt, "server")
+                elif resp.status_code == 429:
+                    self._record_success(host)
+                    wait_s = self._retry_after(resp, attempt)
+                else:
+                    self._record_success(host)
+                    return resp
+                wait_s = _before_deadline(wait_s, deadline)
+                if wait_s is None:
+                    return resp
+                logger.warning("%s %s returned HTTP %s, retrying in %gs", method, url, resp.status_code, wait_s)
+                resp.close()
+
+            with self._lock:
+                self._counters.retries += 1
+            time.sleep(wait_s)
+
+    def _backoff(self, schedule: tuple[float, ...], attempt: dict[str, int], kind: str) -> float | None:
+        if attempt[kind] >= len(schedule):
+            return None
+        attempt[kind] += 1
+        return schedule[attempt[kind] - 1]
+
+    def _retry_after(self, resp: requests.Response, attempt: dict[str, int]) -> float | None:
+        if attempt["rate_limit"] >= self._policy.rate_limit_retries:
+            return None
+        attempt["rate_limit"] += 1
+        wait_s = _parse_retry_after(resp.headers.get("Retry-After"))
+        if wait_s is None:
+            wait_s = self._policy.rate_limit_default_s
+        return min(wait_s, self._policy.max_retry_after_s)
+
+    def _check_circuit(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return
+            open_for = time.monotonic() - circuit.opened_at
+            if open_for < self._breaker_cooldown_s:
+                self._counters.circuit_rejected += 1
+                raise CircuitOpenError(
+                    f"Circuit for {host} is open for another {self._breaker_cooldown_s - open_for:.0f}s"
+                )
+            # Half-open: let this request through as a trial
+            self._counters.circuit_open_s += open_for
+            circuit.opened_at = None
+            circuit.consecutive_failures = self._breaker_threshold - 1
+            logger.info("Circuit for %s half-open, sending a trial request", host)
+
+    def _record_failure(self, host: str) -> bool:
+        """Count a failed attempt; returns True if the circuit for ``host`` is now open."""
+        with self._lock:
+            self._counters.failures += 1
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.consecutive_failures += 1
+            if circuit.consecutive_failures >= self._breaker_threshold and circuit.opened_at is None:
+                circuit.opened_at = time.monotonic()
+                self._counters.circuit_opened += 1
+                logger.error(
+                    "%d consecutive failures against %s, pausing requests for %gs",
+                    circuit.consecutive_failures,
+                    host,
+                    self._breaker_cooldown_s,
+                )
+            return circuit.opened_at is not None
+
+    def _record_success(self, host: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.consecutive_failures = 0
+
+
+def _before_deadline(wait_s: float | None, deadline: float | None) -> float | None:
+    """The backoff wait, or None if the retry after it would start at or past the deadline."""
+    if wait_s is None or deadline is None or time.monotonic() + wait_s < deadline:
+        return wait_s
+    return None
+
+
+def _capped_timeout(timeout: float | None, deadline: float | None) -> float | None:
+    """The request timeout, shortened to the time left before the deadline.
+
+    Raises:
+        requests.Timeout: If the deadline has already passed.
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.Timeout("Deadline passed before the request could be sent")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
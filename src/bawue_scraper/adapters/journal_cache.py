@@ -0,0 +1,221 @@
+"""Journal-based cache: appends each change to a file and compacts it into a JSON snapshot."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+from bawue_scraper.adapters.cache_manager import processed_from_json, processed_to_json, select_changed, store_mark
+from bawue_scraper.config import Config
+from bawue_scraper.ports.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+_ADD = "+"
+_REMOVE = "-"
+
+
+class JournalCache(Cache):
+    """Implements Cache with an append-only journal next to a JSON snapshot.
+
+    The snapshot is ``cache_dir/processed.json`` in the format of the file-based
+    cache, so both backends can be switched without a migration. Every change is
+    appended to ``cache_dir/processed.journal`` as one line (``["+", id]``,
+    ``["+", id, source_fingerprint]`` or ``["-", id]``) and flushed to the OS, so a crash loses at most a partly written
+    last line, which is skipped on replay.
+
+    Once the journal holds ``cache_compact_records`` records, it is renamed to
+    ``processed.journal.old`` and a new one is started; a background thread then
+    writes a fresh snapshot and deletes the old journal. On startup the snapshot is
+    loaded and both journals are replayed, which is correct whether or not an
+    interrupted compaction got as far as replacing the snapshot.
+
+    Inside a :meth:`batch`, records are collected in memory and appended in one
+    write per commit point.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._cache_dir = Path(config.cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_file = self._cache_dir / "processed.json"
+        self._journal_file = self._cache_dir / "processed.journal"
+        self._old_journal_file = self._cache_dir / "processed.journal.old"
+        self._compact_records = config.cache_compact_records
+        self._lock = threading.RLock()
+        self._compaction: threading.Thread | None = None
+        self._batch_depth = 0
+        self._batched: list[tuple[str, ...]] = []
+
+        self._processed = self._load_snapshot()
+        for journal in (self._old_journal_file, self._journal_file):
+            self._replay(journal)
+        _truncate_partial_record(self._journal_file)
+        self._journal: IO[str] = self._journal_file.open("a", encoding="utf-8")
+        self._records = 0
+        if self._old_journal_file.exists():
+            # A compaction was interrupted: finish it before the old journal could be overwritten
+            self._write_snapshot(dict(self._processed))
+            self._old_journal_file.unlink()
+
+    def _load_snapshot(self) -> dict[str, str | None]:
+        if not self._snapshot_file.exists():
+            return {}
+        try:
+            text = self._snapshot_file.read_text(encoding="utf-8")
+            return processed_from_json(json.loads(text)) if text.strip() else {}
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Corrupt cache snapshot %s, starting from the journal alone", self._snapshot_file)
+            return {}
+
+    def _replay(self, journal: Path) -> None:
+        if not journal.exists():
+            return
+        with journal.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                try:
+                    op, vorgang_id, *fingerprint = json.loads(line)
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    logger.warning("Skipping unreadable record %s:%d", journal.name, line_no)
+                    continue
+                if op == _ADD:
+                    store_mark(self._processed, vorgang_id, fingerprint[0] if fingerprint else None)
+                elif op == _REMOVE:
+                    self._processed.pop(vorgang_id, None)
+
+    def _append(self, records: list[tuple[str, ...]]) -> None:
+        """Write records to the journal, or collect them inside a batch; the caller holds the lock."""
+        if self._batch_depth:
+            self._batched.extend(records)
+            return
+        self._write_records(records)
+
+    def _write_records(self, records: list[tuple[str, ...]]) -> None:
+        if not records:
+            return
+        self._journal.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        self._journal.flush()
+        self._records += len(records)
+        # An old journal left by a failed compaction must not be overwritten; it is compacted on the next start
+        if self._records >= self._compact_records and self._compaction is None and not self._old_journal_file.exists():
+            self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        """Rotate the journal and write a snapshot of the current state in the background."""
+        self._journal.close()
+        os.replace(self._journal_file, self._old_journal_file)
+        self._journal = self._journal_file.open("a", encoding="utf-8")
+        self._records = 0
+        snapshot = dict(self._processed)
+        self._compaction = threading.Thread(
+            target=self._compact, args=(snapshot,), name="cache-compaction", daemon=True
+        )
+        self._compaction.start()
+
+    def _compact(self, snapshot: dict[str, str | None]) -> None:
+        try:
+            self._write_snapshot(snapshot)
+            self._old_journal_file.unlink()
+            logger.debug("Compacted the cache journal into a snapshot of %d IDs", len(snapshot))
+        except OSError:
+            # The old journal stays and is replayed and compacted on the next start
+            logger.exception("Cache journal compaction failed")
+        finally:
+            with self._lock:
+                self._compaction = None
+
+    def _write_snapshot(self, snapshot: dict[str, str | None]) -> None:
+        data = processed_to_json(snapshot)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._snapshot_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def is_processed(self, vorgang_id: str) -> bool:
+        """Check if a Vorgang has already been processed."""
+        return vorgang_id in self._processed
+
+    def filter_unprocessed(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> list[str]:
+        """Select the Vorgänge not in the cache or whose source fingerprint has changed."""
+        with self._lock:
+            unprocessed, adopted = select_changed(self._processed, vorgang_ids, source_fingerprints or {})
+            if adopted:
+                self.mark_processed_many(adopted, source_fingerprints=adopted)
+        return unprocessed
+
+    def mark_processed(self, vorgang_id: str, *, source_fingerprint: str | None = None) -> None:
+        """Append an add record unless the Vorgang is already marked with this fingerprint."""
+        fingerprints = {vorgang_id: source_fingerprint} if source_fingerprint else None
+        self.mark_processed_many([vorgang_id], source_fingerprints=fingerprints)
+
+    def mark_processed_many(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> None:
+        """Append add records for the Vorgänge not yet marked with these fingerprints, in one write."""
+        fingerprints = source_fingerprints or {}
+        with self._lock:
+            records = []
+            for vorgang_id in dict.fromkeys(vorgang_ids):
+                fingerprint = fingerprints.get(vorgang_id)
+                if store_mark(self._processed, vorgang_id, fingerprint):
+                    records.append((_ADD, vorgang_id) if fingerprint is None else (_ADD, vorgang_id, fingerprint))
+            self._append(records)
+
+    def invalidate(self, vorgang_id: str) -> None:
+        """Append a remove record if the Vorgang is marked."""
+        with self._lock:
+            if vorgang_id in self._processed:
+                del self._processed[vorgang_id]
+                self._append([(_REMOVE, vorgang_id)])
+
+    def flush(self) -> None:
+        """Append the records collected in a batch, wait for a running compaction and sync the journal to disk."""
+        with self._lock:
+            self._write_records(self._batched)
+            self._batched = []
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect records in memory and append them in one write when the outermost batch exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = not self._batch_depth
+            if outermost:
+                self.flush()
+
+
+def _truncate_partial_record(journal: Path) -> None:
+    """Cut a last line left unfinished by a crash, so the next record starts on a line of its own."""
+    if not journal.exists():
+        return
+    with journal.open("rb+") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) == b"\n":
+            return
+        f.seek(0)
+        f.truncate(f.read().rfind(b"\n") + 1)
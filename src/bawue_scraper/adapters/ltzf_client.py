@@ -1,23 +1,81 @@
 """LTZF client: submits collected data to the LTZF backend API."""
 
+import gzip
 import logging
-from datetime import date
+import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from pathlib import Path
+from typing import IO, Any
 
 import requests
 
+from bawue_scraper.adapters.http_transport import HttpTransport, RetryPolicy
 from bawue_scraper.config import Config
 from bawue_scraper.domain.models import Sitzung, Vorgang
-from bawue_scraper.ports.ltzf_api import LtzfApi
+from bawue_scraper.domain.serialization import (
+    iter_json_chunks,
+    sitzungen_to_json_bytes,
+    to_json_bytes,
+    volltext_size,
+)
+from bawue_scraper.ports.ltzf_api import KALENDER_MAX_DAYS_AHEAD, LtzfApi
+from bawue_scraper.ports.outbox import Outbox
 
 logger = logging.getLogger(__name__)
 
+# A request body: complete bytes, or a factory for a fresh chunk iterator of a streamed body
+Body = bytes | Callable[[], Iterator[bytes]]
+
+# Share of submission_deadline_s the retries of a submission may use; the rest is left for queueing it in the outbox
+_RETRY_DEADLINE_SHARE = 0.9
+
 
 class LtzfClient(LtzfApi):
-    """Implements LtzfApi by calling the LTZF REST API."""
+    """Implements LtzfApi by calling the LTZF REST API.
+
+    Requests go through an HttpTransport, which retries 429/5xx/connection failures
+    and pauses submissions while the LTZF host keeps failing. With an outbox, a
+    submission that still fails because the backend is unavailable is stored for
+    :meth:`replay_pending` and reported as accepted, so the Vorgang is not rebuilt.
+    Retries stop early enough for that to happen within ``submission_deadline_s``,
+    before the caller abandons the submission.
+
+    Bodies of at least ``ltzf_compression_min_bytes`` are sent with the configured
+    ``Content-Encoding``; if the backend answers 415, compression is switched off
+    for the rest of the process and the body is resent uncompressed.
+
+    Vorgänge whose document texts add up to ``ltzf_stream_min_bytes`` or more are
+    serialised incrementally (:func:`iter_json_chunks`) and compressed on the fly
+    instead of being built as one ``bytes`` object. They are sent with chunked
+    transfer encoding, or with ``ltzf_stream_spool`` written to a spool file under
+    ``cache_dir`` first and sent from there with a ``Content-Length``.
+    """
+
+    # Size of the batches read from the outbox during replay
+    _REPLAY_BATCH = 50
+    # Vorgänge per page when reading GET /api/v2/vorgang
+    _READ_PAGE_SIZE = 100
 
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self, config: Config, outbox: Outbox | None = None, *, retry_policy: RetryPolicy | None = None
+    ) -> None:
         self._config = config
-        self._session = requests.Session()
+        self._outbox = outbox
+        self._compression = config.ltzf_request_compression
+        self._counts = {"outboxed": 0, "replayed": 0, "streamed": 0, "bytes_raw": 0, "bytes_sent": 0}
+        self._counts_lock = threading.Lock()
+        self._transport = HttpTransport(
+            pool_size=max(config.ltzf_pool_size, config.ltzf_submit_concurrency),
+            timeout_s=config.ltzf_timeout_s,
+            policy=retry_policy,
+            breaker_threshold=config.circuit_breaker_threshold,
+            breaker_cooldown_s=config.circuit_breaker_cooldown_s,
+        )
+        self._session = self._transport.session
         self._session.headers.update(
             {
                 "X-API-Key": config.ltzf_api_key,
@@ -31,21 +89,219 @@ class LtzfClient(LtzfApi):
     def submit_vorgang(self, vorgang: Vorgang) -> bool:
         """Submit a Vorgang via PUT /api/v2/vorgang."""
         url = f"{self._config.ltzf_api_url}/api/v2/vorgang"
-        body = vorgang.model_dump(mode="json", exclude_none=True)
+        key, label = f"vorgang:{vorgang.api_id}", f"Vorgang {vorgang.titel}"
+        min_bytes = self._config.ltzf_stream_min_bytes
+        if min_bytes and volltext_size(vorgang) >= min_bytes:
+            return self._submit(key, url, lambda: iter_json_chunks(vorgang), label)
+        return self._submit(key, url, to_json_bytes(vorgang), label)
 
-        try:
-            resp = self._session.put(url, json=body)
-            if resp.status_code in (201, 409):
-                return True
-            logger.error("Failed to submit Vorgang %s: HTTP %s", vorgang.titel, resp.status_code)
+    def submit_sitzungen(self, datum: date, sitzungen: list[Sitzung]) -> bool:
+        """Submit the Sitzungen of one date via PUT /api/v2/kalender/BW/{datum}.
+
+        Dates beyond the collector scope (``KALENDER_MAX_DAYS_AHEAD`` after today)
+        would be rejected by the backend and are refused without a request.
+        """
+        latest = date.today() + timedelta(days=KALENDER_MAX_DAYS_AHEAD)
+        if datum > latest:
+            logger.warning("Not submitting Sitzungen for %s: the collector scope ends at %s", datum, latest)
             return False
-        except requests.ConnectionError as e:
+        url = f"{self._config.ltzf_api_url}/api/v2/kalender/BW/{datum.isoformat()}"
+        body = sitzungen_to_json_bytes(sitzungen)
+        return self._submit(f"kalender:{datum.isoformat()}", url, body, f"Sitzungen for {datum}")
+
+    def _submit(self, key: str, url: str, body: Body, label: str) -> bool:
+        """PUT a body, queueing it in the outbox if the backend is unavailable."""
+        deadline_s = self._config.submission_deadline_s
+        deadline = time.monotonic() + deadline_s * _RETRY_DEADLINE_SHARE if deadline_s and deadline_s > 0 else None
+        try:
+            resp = self._put(url, body, deadline)
+        except (requests.ConnectionError, requests.Timeout) as e:
             logger.error("Cannot reach LTZF API at %s: %s", url, e)
-            return False
+            return self._queue_for_replay(key, url, body)
         except requests.RequestException:
-            logger.exception("Request error submitting Vorgang %s", vorgang.titel)
+            logger.exception("Request error submitting %s", label)
             return False
 
-    def submit_sitzungen(self, datum: date, sitzungen: list[Sitzung]) -> bool:
-        """Submit Sitzungen via PUT /api/v2/kalender/BW/{datum}."""
-        raise NotImplementedError
+        if _accepted(resp.status_code):
+            if self._outbox is not None:
+                # A queued older version of this payload is superseded
+                self._outbox.remove(key)
+            return True
+        logger.error("Failed to submit %s: HTTP %s", label, resp.status_code)
+        if _backend_unavailable(resp.status_code):
+            return self._queue_for_replay(key, url, body)
+        return False
+
+    def _put(self, url: str, body: Body, deadline: float | None = None) -> requests.Response:
+        """PUT a JSON body, compressed if it is large enough and the backend accepts it."""
+        if not isinstance(body, bytes):
+            return self._put_streamed(url, body, deadline)
+        encoding = self._compression
+        if encoding != "none" and len(body) >= self._config.ltzf_compression_min_bytes:
+            encoded = gzip.compress(body, compresslevel=6) if encoding == "gzip" else zlib.compress(body, 6)
+            resp = self._transport.request(
+                "PUT", url, data=encoded, headers={"Content-Encoding": encoding}, deadline=deadline
+            )
+            if resp.status_code != 415:
+                self._count(bytes_raw=len(body), bytes_sent=len(encoded))
+                return resp
+            logger.warning("LTZF does not accept %s request bodies, sending them uncompressed from now on", encoding)
+            self._compression = "none"
+
+        resp = self._transport.request("PUT", url, data=body, deadline=deadline)
+        self._count(bytes_raw=len(body), bytes_sent=len(body))
+        return resp
+
+    def _put_streamed(
+        self, url: str, chunks: Callable[[], Iterator[bytes]], deadline: float | None = None
+    ) -> requests.Response:
+        """PUT a body produced chunk by chunk, compressed on the fly if compression is enabled."""
+        encoding = self._compression
+        headers = {} if encoding == "none" else {"Content-Encoding": encoding}
+        sizes = {"bytes_raw": 0, "bytes_sent": 0}
+
+        def encoded() -> Iterator[bytes]:
+            sizes.update(bytes_raw=0, bytes_sent=0)
+            compressor = _compressor(encoding)
+            for chunk in chunks():
+                sizes["bytes_raw"] += len(chunk)
+                if compressor is not None:
+                    chunk = compressor.compress(chunk)
+                sizes["bytes_sent"] += len(chunk)
+                if chunk:
+                    yield chunk
+            if compressor is not None:
+                tail = compressor.flush()
+                sizes["bytes_sent"] += len(tail)
+                yield tail
+
+        if self._config.ltzf_stream_spool:
+            spool_dir = Path(self._config.cache_dir)
+            spool_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryFile(dir=spool_dir, prefix="ltzf-body-") as spool:
+                for chunk in encoded():
+                    spool.write(chunk)
+                resp = self._transport.request(
+                    "PUT", url, body=lambda: _rewound(spool), headers=headers, deadline=deadline
+                )
+        else:
+            resp = self._transport.request("PUT", url, body=encoded, headers=headers, deadline=deadline)
+
+        if resp.status_code == 415 and encoding != "none":
+            logger.warning("LTZF does not accept %s request bodies, sending them uncompressed from now on", encoding)
+            self._compression = "none"
+            return self._put_streamed(url, chunks, deadline)
+        self._count(streamed=1, **sizes)
+        return resp
+
+    def _count(self, **increments: int) -> None:
+        with self._counts_lock:
+            for name, value in increments.items():
+                self._counts[name] += value
+
+    def _queue_for_replay(self, key: str, url: str, body: Body) -> bool:
+        if self._outbox is None:
+            return False
+        # The outbox stores complete bodies, so a streamed one is assembled here
+        self._outbox.put(key, url, body if isinstance(body, bytes) else b"".join(body()))
+        self._count(outboxed=1)
+        logger.warning("Queued %s in the outbox for later delivery", key)
+        return True
+
+    def replay_pending(self) -> int:
+        """Resubmit due outbox entries, oldest first.
+
+        Stops at the first entry the backend still cannot accept; that entry is
+        retried later with backoff. Entries rejected with a 4xx status are dropped.
+        """
+        if self._outbox is None:
+            return 0
+        delivered = 0
+        while batch := self._outbox.due(self._REPLAY_BATCH):
+            for entry in batch:
+                try:
+                    resp = self._put(entry.url, entry.body)
+                except requests.RequestException as e:
+                    self._outbox.defer(entry.key, str(e))
+                    logger.warning("LTZF still unreachable, %d outbox entries remain", self._outbox.count())
+                    return self._finish_replay(delivered)
+                if _accepted(resp.status_code):
+                    self._outbox.remove(entry.key)
+                    delivered += 1
+                elif _backend_unavailable(resp.status_code):
+                    self._outbox.defer(entry.key, f"HTTP {resp.status_code}")
+                    logger.warning("LTZF still unavailable, %d outbox entries remain", self._outbox.count())
+                    return self._finish_replay(delivered)
+                else:
+                    logger.error("LTZF rejected outbox entry %s with HTTP %s, dropping it", entry.key, resp.status_code)
+                    self._outbox.remove(entry.key)
+        return self._finish_replay(delivered)
+
+    def _finish_replay(self, delivered: int) -> int:
+        if delivered:
+            logger.info("Delivered %d queued submissions from the outbox", delivered)
+        self._count(replayed=delivered)
+        return delivered
+
+    def iter_vorgaenge(self, wahlperiode: int) -> Iterator[dict]:
+        """Read all BW Vorgänge of a Wahlperiode from GET /api/v2/vorgang, page by page.
+
+        Follows the ``Link: rel="next"`` header when the backend sends one and otherwise
+        requests the next page number until a page comes back empty or short.
+
+        Yields:
+            Each Vorgang as returned by the backend (raw JSON object).
+
+        Raises:
+            requests.RequestException: If a page cannot be read.
+        """
+        url = f"{self._config.ltzf_api_url}/api/v2/vorgang"
+        params: dict | None = {"p": "BW", "wp": wahlperiode, "per_page": self._READ_PAGE_SIZE}
+        page = 1
+        while True:
+            resp = self._transport.request("GET", url, params=params)
+            if resp.status_code == 204:
+                return
+            resp.raise_for_status()
+            items = resp.json()
+            if not items:
+                return
+            yield from items
+
+            if "next" in resp.links:
+                url, params = resp.links["next"]["url"], None
+            elif len(items) < self._READ_PAGE_SIZE:
+                return
+            else:
+                page = int(resp.headers.get("X-Page", page)) + 1
+                params = {"p": "BW", "wp": wahlperiode, "per_page": self._READ_PAGE_SIZE, "page": page}
+
+    def counters(self) -> dict[str, float]:
+        """Transport counters, outbox activity, and request body bytes before and after compression."""
+        with self._counts_lock:
+            counts = dict(self._counts)
+        return {**self._transport.counters().as_dict(), **counts}
+
+
+def _accepted(status_code: int) -> bool:
+    """Whether a response status means LTZF has the payload (409: an identical one was already stored)."""
+    return 200 <= status_code < 300 or status_code == 409
+
+
+def _compressor(encoding: str) -> Any:
+    """A streaming compressor producing the same format as ``gzip.compress`` / ``zlib.compress``."""
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.compressobj(6)
+    return None
+
+
+def _rewound(spool: IO[bytes]) -> IO[bytes]:
+    spool.seek(0)
+    return spool
+
+
+def _backend_unavailable(status_code: int) -> bool:
+    """Whether a final response status means the backend could not take the request right now."""
+    return status_code == 429 or status_code >= 500
@@ -0,0 +1,93 @@
+"""File sink: writes LTZF payloads to rotating, gzip-compressed NDJSON files for a later bulk upload."""
+
+import gzip
+import logging
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import IO
+
+from bawue_scraper.config import Config
+from bawue_scraper.domain.models import Sitzung, Vorgang
+from bawue_scraper.domain.serialization import sitzungen_to_json_bytes, to_json_bytes
+from bawue_scraper.ports.ltzf_api import LtzfApi
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the file currently being written; the uploader ignores these
+PARTIAL_SUFFIX = ".partial"
+
+
+class NdjsonFileSink(LtzfApi):
+    """Implements LtzfApi by appending each payload as one line to an NDJSON export file.
+
+    Lines are ``{"kind": "vorgang", "payload": {...}}`` or
+    ``{"kind": "kalender", "datum": "YYYY-MM-DD", "payload": [...]}``, with the
+    payload exactly as it would be sent to LTZF. Files are named
+    ``ltzf-<timestamp>-<pid>-<seq>.ndjson.gz`` under ``export_dir`` and carry a
+    ``.partial`` suffix while open. A file is finished when it reaches
+    ``export_rotate_mb`` of uncompressed data and on :meth:`flush`, so each run
+    leaves only complete files behind. Thread-safe.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._dir = Path(config.export_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._rotate_bytes = int(config.export_rotate_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._file: IO[bytes] | None = None
+        self._path: Path | None = None
+        self._file_bytes = 0
+        self._seq = 0
+        self._counts = {"records": 0, "files": 0, "bytes_raw": 0}
+
+    def submit_vorgang(self, vorgang: Vorgang) -> bool:
+        """Append the Vorgang's PUT body to the export."""
+        self._write(b'{"kind":"vorgang","payload":' + to_json_bytes(vorgang) + b"}\n")
+        return True
+
+    def submit_sitzungen(self, datum: date, sitzungen: list[Sitzung]) -> bool:
+        """Append the PUT body for one calendar date to the export."""
+        prefix = f'{{"kind":"kalender","datum":"{datum.isoformat()}","payload":'.encode()
+        self._write(prefix + sitzungen_to_json_bytes(sitzungen) + b"}\n")
+        return True
+
+    def _write(self, line: bytes) -> None:
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            self._file_bytes += len(line)
+            self._counts["records"] += 1
+            self._counts["bytes_raw"] += len(line)
+            if self._file_bytes >= self._rotate_bytes:
+                self._finish()
+
+    def _open(self) -> None:
+        self._seq += 1
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        self._path = self._dir / f"ltzf-{stamp}-{os.getpid()}-{self._seq:04d}.ndjson.gz"
+        partial = self._path.with_name(self._path.name + PARTIAL_SUFFIX)
+        self._file = gzip.open(partial, "wb", compresslevel=6)  # noqa: SIM115  # closed in _finish
+        self._file_bytes = 0
+
+    def _finish(self) -> None:
+        self._file.close()
+        self._path.with_name(self._path.name + PARTIAL_SUFFIX).rename(self._path)
+        self._counts["files"] += 1
+        logger.info("Finished export file %s (%.1f MB uncompressed)", self._path.name, self._file_bytes / 2**20)
+        self._file = None
+        self._path = None
+
+    def flush(self) -> None:
+        """Finish the current export file, if any."""
+        with self._lock:
+            if self._file is not None:
+                self._finish()
+
+    def counters(self) -> dict[str, float]:
+        """Records, finished files and uncompressed bytes written."""
+        with self._lock:
+            return dict(self._counts)
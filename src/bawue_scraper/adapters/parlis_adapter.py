@@ -1,6 +1,5 @@
 """PARLIS adapter: fetches Vorgang data from the BaWue parliament's PARLIS system."""
 
-import calendar
 import logging
 import re
 import time
@@ -9,7 +8,10 @@ from datetime import date
 import requests
 from lxml import html
 
+from bawue_scraper.adapters.rate_limiters import IntervalRateLimiter
 from bawue_scraper.config import Config
+from bawue_scraper.domain.windows import monthly_windows
+from bawue_scraper.ports.rate_limiter import RateLimiter
 from bawue_scraper.ports.vorgang_source import RawVorgang, VorgangSource
 
 logger = logging.getLogger(__name__)
@@ -19,12 +21,24 @@ BROWSE_URL = BASE_URL + "browse.tt.json"
 REPORT_URL = BASE_URL + "report.tt.html"
 CHUNKSIZE = 50
 
+# Fundstelle / record patterns, compiled once per process
+_DATUM_RE = re.compile(r"(\d{2}\.\d{2}\.\d{4})")
+_DRUCKSACHE_RE = re.compile(r"Drucksache\s+(\d+/\d+)")
+_PLENARPROTOKOLL_RE = re.compile(r"Plenarprotokoll\s+(\d+/\d+)")
+_STATION_TYP_RE = re.compile(r"^([\w\s\-äöüÄÖÜß]+?)(?:\s{2,}|\t)")
+_AUSSCHUSS_RE = re.compile(r"(Ausschuss\s+(?:für|fuer|f\u00c3\u00bcr)\s+[^0-9]+?)(?:\s+\d{2}\.\d{2}\.|\s+Drucksache)")
+_SEITEN_RE = re.compile(r"\((\d+)\s+S\.\)")
+_LINK_ID_RE = re.compile(r"link-(V-\d+)")
+_DETAIL_URL_RE = re.compile(r'"/parlis/vorgang/(V-\d+)"')
+
 
 class ParlisAdapter(VorgangSource):
     """Implements VorgangSource by scraping the PARLIS API."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, rate_limiter: RateLimiter | None = None) -> None:
         self._config = config
+        self._rate_limiter = rate_limiter or IntervalRateLimiter(config.parlis_request_delay_s)
+        self._session_established_at: float | None = None
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -36,10 +50,19 @@ class ParlisAdapter(VorgangSource):
     def _establish_session(self) -> None:
         """Load the PARLIS main page to establish session cookies."""
         logger.info("Establishing PARLIS session...")
+        self._rate_limiter.acquire()
         resp = self._session.get(BASE_URL, timeout=30)
         resp.raise_for_status()
+        self._session_established_at = time.monotonic()
         logger.info("Session established.")
 
+    def _ensure_session(self) -> None:
+        """Establish a PARLIS session unless the current one is younger than ``parlis_session_ttl_s``."""
+        established_at = self._session_established_at
+        if established_at is not None and time.monotonic() - established_at < self._config.parlis_session_ttl_s:
+            return
+        self._establish_session()
+
     def _build_query(self, vorgangstyp: str, date_from: date, date_to: date) -> dict:
         return {
             "action": "SearchAndDisplay",
@@ -68,6 +91,7 @@ class ParlisAdapter(VorgangSource):
             "start": start,
             "chunksize": CHUNKSIZE,
         }
+        self._rate_limiter.acquire()
         resp = self._session.get(REPORT_URL, params=params, timeout=30)
         resp.raise_for_status()
         return resp.text
@@ -77,30 +101,27 @@ class ParlisAdapter(VorgangSource):
         """Parse a Fundstelle text entry into structured station data."""
         result: dict = {"raw": text}
 
-        date_match = re.search(r"(\d{2}\.\d{2}\.\d{4})", text)
+        date_match = _DATUM_RE.search(text)
         if date_match:
             result["datum"] = date_match.group(1)
 
-        ds_match = re.search(r"Drucksache\s+(\d+/\d+)", text)
+        ds_match = _DRUCKSACHE_RE.search(text)
         if ds_match:
             result["drucksache"] = ds_match.group(1)
 
-        pp_match = re.search(r"Plenarprotokoll\s+(\d+/\d+)", text)
+        pp_match = _PLENARPROTOKOLL_RE.search(text)
         if pp_match:
             result["plenarprotokoll"] = pp_match.group(1)
 
-        type_match = re.match(r"^([\w\s\-äöüÄÖÜß]+?)(?:\s{2,}|\t)", text)
+        type_match = _STATION_TYP_RE.match(text)
         if type_match:
             result["station_typ"] = type_match.group(1).strip()
 
-        ausschuss_match = re.search(
-            r"(Ausschuss\s+(?:für|fuer|f\u00c3\u00bcr)\s+[^0-9]+?)(?:\s+\d{2}\.\d{2}\.|\s+Drucksache)",
-            text,
-        )
+        ausschuss_match = _AUSSCHUSS_RE.search(text)
         if ausschuss_match:
             result["ausschuss"] = ausschuss_match.group(1).strip()
 
-        pages_match = re.search(r"\((\d+)\s+S\.\)", text)
+        pages_match = _SEITEN_RE.search(text)
         if pages_match:
             result["seiten"] = int(pages_match.group(1))
 
@@ -142,13 +163,13 @@ class ParlisAdapter(VorgangSource):
             scripts = record.xpath(".//script")
             for script in scripts:
                 script_text = script.text_content()
-                vid_match = re.search(r"link-(V-\d+)", script_text)
+                vid_match = _LINK_ID_RE.search(script_text)
                 if vid_match and "vorgangs_id" not in item:
                     item["vorgangs_id"] = vid_match.group(1)
 
             url_match = None
             for script in scripts:
-                url_match = re.search(r'"/parlis/vorgang/(V-\d+)"', script.text_content())
+                url_match = _DETAIL_URL_RE.search(script.text_content())
                 if url_match:
                     break
             if url_match:
@@ -159,21 +180,6 @@ class ParlisAdapter(VorgangSource):
 
         return results
 
-    @staticmethod
-    def _monthly_windows(date_from: date, date_to: date) -> list[tuple[date, date]]:
-        """Split a date range into monthly windows."""
-        windows = []
-        current = date_from
-        while current <= date_to:
-            last_day = calendar.monthrange(current.year, current.month)[1]
-            window_end = date(current.year, current.month, last_day)
-            if window_end > date_to:
-                window_end = date_to
-            windows.append((current, window_end))
-            # Move to first day of next month
-            current = date(current.year + 1, 1, 1) if current.month == 12 else date(current.year, current.month + 1, 1)
-        return windows
-
     def _search_single(self, vorgangstyp: str, date_from: date, date_to: date) -> list[RawVorgang] | None:
         """Execute a single search against PARLIS.
 
@@ -189,6 +195,7 @@ class ParlisAdapter(VorgangSource):
             date_to,
         )
 
+        self._rate_limiter.acquire()
         resp = self._session.post(
             BROWSE_URL,
             json=query,
@@ -217,8 +224,6 @@ class ParlisAdapter(VorgangSource):
 
         all_results: list[RawVorgang] = []
         for start in range(0, item_count, CHUNKSIZE):
-            if start > 0:
-                time.sleep(self._config.parlis_request_delay_s)
             html_content = self._fetch_page(report_id, start)
             page_results = self._parse_results(html_content)
             all_results.extend(page_results)
@@ -231,16 +236,25 @@ class ParlisAdapter(VorgangSource):
 
         If PARLIS indicates the result set is too large (status=running), automatically
         subdivides the date range into monthly windows and retries.
+
+        The PARLIS session is reused across searches (e.g. in daemon mode) and
+        re-established once it is older than ``parlis_session_ttl_s`` or a request failed.
         """
-        self._establish_session()
+        self._ensure_session()
+        try:
+            return self._search_windows(vorgangstyp, date_from, date_to)
+        except requests.RequestException:
+            self._session_established_at = None
+            raise
+
+    def _search_windows(self, vorgangstyp: str, date_from: date, date_to: date) -> list[RawVorgang]:
         results = self._search_single(vorgangstyp, date_from, date_to)
         if results is not None:
             return results
 
         # Subdivide into monthly windows
         all_results: list[RawVorgang] = []
-        for window_from, window_to in self._monthly_windows(date_from, date_to):
-            time.sleep(self._config.parlis_request_delay_s)
+        for window_from, window_to in monthly_windows(date_from, date_to):
             window_results = self._search_single(vorgangstyp, window_from, window_to)
             if window_results is None:
                 logger.warning(
@@ -0,0 +1,74 @@
+"""Rate limiters for PARLIS requests: in-process and shared between processes."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.rate_limiter import RateLimiter
+
+
+class IntervalRateLimiter(RateLimiter):
+    """Enforces a minimum interval between requests within one process."""
+
+    def __init__(self, interval_s: float) -> None:
+        self._interval_s = interval_s
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Sleep until the minimum interval since the previous request has passed."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval_s
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class SqliteRateLimiter(RateLimiter):
+    """Enforces a minimum interval between requests across all processes sharing ``cache_dir``.
+
+    Each call reserves the next free time slot in a SQLite table, so any number of
+    worker processes together stay within the configured PARLIS request delay.
+    """
+
+    def __init__(self, config: Config, name: str = "parlis") -> None:
+        self._interval_s = config.parlis_request_delay_s
+        self._name = name
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "rate_limit.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits (name TEXT PRIMARY KEY, next_slot REAL NOT NULL)"
+            )
+
+    def _reserve_slot(self) -> float:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT next_slot FROM rate_limits WHERE name = ?", (self._name,)).fetchone()
+                now = time.time()
+                slot = max(now, row[0]) if row else now
+                self._conn.execute(
+                    "INSERT INTO rate_limits (name, next_slot) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET next_slot = excluded.next_slot",
+                    (self._name, slot + self._interval_s),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return slot - now
+
+    def acquire(self) -> None:
+        """Reserve the next shared slot and sleep until it starts."""
+        wait_s = self._reserve_slot()
+        if wait_s > 0:
+            time.sleep(wait_s)
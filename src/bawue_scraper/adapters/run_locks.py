@@ -0,0 +1,102 @@
+"""Run locks: an flock-based file lock for one host and a SQLite lease for shared volumes."""
+
+import fcntl
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.run_lock import RunLock
+
+
+class FileRunLock(RunLock):
+    """Holds an exclusive ``flock`` on ``cache_dir/run.lock``.
+
+    The operating system drops the lock when the holding process exits, so a
+    standby takes over as soon as the leader dies and ``lease_s`` is not needed.
+    ``flock`` is unreliable on network filesystems; use :class:`SqliteRunLock` there.
+    """
+
+    def __init__(self, config: Config) -> None:
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_file = cache_dir / "run.lock"
+        self._fd: int | None = None
+
+    def try_acquire(self, owner: str, lease_s: float) -> bool:
+        """Take the flock without blocking and record ``owner`` in the lock file."""
+        if self._fd is not None:
+            return True
+        fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, owner.encode("utf-8"))
+        self._fd = fd
+        return True
+
+    def renew(self, owner: str, lease_s: float) -> bool:
+        """The flock needs no renewal; report whether it is still held."""
+        return self._fd is not None
+
+    def release(self, owner: str) -> None:
+        """Unlock and close the lock file."""
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class SqliteRunLock(RunLock):
+    """Keeps a lease row in ``cache_dir/run_lock.sqlite3``.
+
+    Works for replicas on different hosts sharing the cache volume. Expiry uses
+    wall-clock time, so host clocks must agree to well within ``run_lock_lease_s``.
+    """
+
+    def __init__(self, config: Config, name: str = "scraper") -> None:
+        self._name = name
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "run_lock.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS run_leases "
+                "(name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def try_acquire(self, owner: str, lease_s: float) -> bool:
+        """Insert the lease, or take it over if it is expired or already ours."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO run_leases (name, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE run_leases.owner = excluded.owner OR run_leases.expires_at < ?",
+                (self._name, owner, now + lease_s, now),
+            )
+        return cursor.rowcount == 1
+
+    def renew(self, owner: str, lease_s: float) -> bool:
+        """Push the expiry forward if ``owner`` still holds the lease."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE run_leases SET expires_at = ? WHERE name = ? AND owner = ?",
+                (time.time() + lease_s, self._name, owner),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, owner: str) -> None:
+        """Delete the lease row if ``owner`` holds it."""
+        with self._lock:
+            self._conn.execute("DELETE FROM run_leases WHERE name = ? AND owner = ?", (self._name, owner))
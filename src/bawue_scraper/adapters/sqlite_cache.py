@@ -0,0 +1,190 @@
+"""SQLite-backed cache of processed Vorgänge."""
+
+import fcntl
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+
+from bawue_scraper.adapters.cache_manager import processed_from_json, select_changed
+from bawue_scraper.config import Config
+from bawue_scraper.ports.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+# Suffix given to processed.json once its IDs have been imported
+MIGRATED_SUFFIX = ".migrated"
+
+# IDs per SELECT in filter_unprocessed, below SQLite's default limit of bound parameters
+_LOOKUP_CHUNK = 500
+
+
+class SqliteCache(Cache):
+    """Implements Cache with a SQLite table in ``cache_dir/processed.sqlite3``.
+
+    Each change is a single-row insert or delete, so its cost does not grow with
+    the number of processed IDs. Each row also holds the source fingerprint the
+    Vorgang was last marked with. The database runs in WAL mode with
+    ``synchronous=NORMAL``: a committed change survives a crash of the process,
+    while a power loss may roll back the last few changes, which only means those
+    Vorgänge are processed again.
+
+    Inside a :meth:`batch`, changes are kept in memory and written in one
+    transaction per commit point.
+
+    On first use, IDs from an existing ``processed.json`` of the file-based cache
+    are imported and the file is renamed to ``processed.json.migrated``.
+    """
+
+    def __init__(self, config: Config) -> None:
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "processed.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # Changes made inside a batch and not yet committed: ID -> (processed, source fingerprint)
+        self._pending: dict[str, tuple[bool, str | None]] = {}
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed (vorgang_id TEXT PRIMARY KEY, processed_at REAL NOT NULL, "
+                "source_fingerprint TEXT) WITHOUT ROWID"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(processed)")}
+            if "source_fingerprint" not in columns:
+                # Databases created before source fingerprints were stored
+                self._conn.execute("ALTER TABLE processed ADD COLUMN source_fingerprint TEXT")
+        self._migrate_json(cache_dir / "processed.json")
+
+    def _migrate_json(self, json_file: Path) -> None:
+        """Import the IDs of the file-based cache once, then set its file aside.
+
+        Runs under the flock the file-based cache takes for its writes, so of several
+        processes starting at once only the first imports the file; the others find it
+        gone and treat it as already migrated.
+        """
+        if not json_file.exists():
+            return
+        with json_file.with_name(json_file.name + ".lock").open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                text = json_file.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return  # migrated by another process meanwhile
+            try:
+                processed = processed_from_json(json.loads(text)) if text.strip() else {}
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("Corrupt cache file %s, not migrating it", json_file)
+                return
+            fingerprints = {vorgang_id: fingerprint for vorgang_id, fingerprint in processed.items() if fingerprint}
+            self.mark_processed_many(processed, source_fingerprints=fingerprints)
+            json_file.rename(json_file.with_name(json_file.name + MIGRATED_SUFFIX))
+        logger.info("Migrated %d processed IDs from %s", len(processed), json_file)
+
+    def is_processed(self, vorgang_id: str) -> bool:
+        """Select the row of the Vorgang."""
+        with self._lock:
+            if vorgang_id in self._pending:
+                return self._pending[vorgang_id][0]
+            row = self._conn.execute("SELECT 1 FROM processed WHERE vorgang_id = ?", (vorgang_id,)).fetchone()
+        return row is not None
+
+    def filter_unprocessed(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> list[str]:
+        """Select the rows of all given Vorgänge, a few hundred IDs per query, and compare their fingerprints."""
+        ids = list(vorgang_ids)
+        processed: dict[str, str | None] = {}
+        with self._lock:
+            for start in range(0, len(ids), _LOOKUP_CHUNK):
+                chunk = ids[start : start + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT vorgang_id, source_fingerprint FROM processed "
+                    f"WHERE vorgang_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                processed.update(rows)
+            for vorgang_id, (done, fingerprint) in self._pending.items():
+                if done:
+                    processed[vorgang_id] = fingerprint or processed.get(vorgang_id)
+                else:
+                    processed.pop(vorgang_id, None)
+            unprocessed, adopted = select_changed(processed, ids, source_fingerprints or {})
+            if adopted:
+                self.mark_processed_many(adopted, source_fingerprints=adopted)
+        return unprocessed
+
+    def mark_processed(self, vorgang_id: str, *, source_fingerprint: str | None = None) -> None:
+        """Insert a row for the Vorgang, keeping the time it was first processed."""
+        self._write({vorgang_id: (True, source_fingerprint)})
+
+    def mark_processed_many(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> None:
+        """Insert rows for several Vorgänge in one transaction."""
+        fingerprints = source_fingerprints or {}
+        self._write({vorgang_id: (True, fingerprints.get(vorgang_id)) for vorgang_id in vorgang_ids})
+
+    def invalidate(self, vorgang_id: str) -> None:
+        """Delete the row of the Vorgang."""
+        self._write({vorgang_id: (False, None)})
+
+    def _write(self, changes: dict[str, tuple[bool, str | None]]) -> None:
+        with self._lock:
+            if not self._batch_depth:
+                self._commit(changes)
+                return
+            for vorgang_id, (done, fingerprint) in changes.items():
+                pending = self._pending.get(vorgang_id)
+                if done and fingerprint is None and pending is not None and pending[0]:
+                    continue  # keep the fingerprint of an earlier mark in this batch
+                self._pending[vorgang_id] = (done, fingerprint)
+
+    def _commit(self, changes: dict[str, tuple[bool, str | None]]) -> None:
+        """Apply changes in one transaction; the caller holds the lock."""
+        if not changes:
+            return
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT INTO processed (vorgang_id, processed_at, source_fingerprint) VALUES (?, ?, ?) "
+                "ON CONFLICT (vorgang_id) DO UPDATE "
+                "SET source_fingerprint = coalesce(excluded.source_fingerprint, source_fingerprint)",
+                ((vorgang_id, now, fingerprint) for vorgang_id, (done, fingerprint) in changes.items() if done),
+            )
+            self._conn.executemany(
+                "DELETE FROM processed WHERE vorgang_id = ?",
+                ((vorgang_id,) for vorgang_id, (done, _) in changes.items() if not done),
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def flush(self) -> None:
+        """Commit the changes made inside a batch since the last commit point."""
+        with self._lock:
+            self._commit(self._pending)
+            self._pending = {}
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Keep changes in memory and commit them in one transaction when the outermost batch exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = not self._batch_depth
+            if outermost:
+                self.flush()
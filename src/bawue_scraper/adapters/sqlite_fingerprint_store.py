@@ -0,0 +1,43 @@
+"""SQLite-backed store of submitted payload fingerprints."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.fingerprint_store import FingerprintStore
+
+
+class SqliteFingerprintStore(FingerprintStore):
+    """Implements FingerprintStore with a SQLite table in ``cache_dir/fingerprints.sqlite3``."""
+
+    def __init__(self, config: Config) -> None:
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "fingerprints.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints "
+                "(api_id TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, submitted_at REAL NOT NULL)"
+            )
+
+    def get(self, api_id: str) -> str | None:
+        """Select the stored fingerprint."""
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint FROM fingerprints WHERE api_id = ?", (api_id,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, api_id: str, fingerprint: str) -> None:
+        """Insert or overwrite the fingerprint."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO fingerprints (api_id, fingerprint, submitted_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(api_id) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                "submitted_at = excluded.submitted_at",
+                (api_id, fingerprint, time.time()),
+            )
@@ -0,0 +1,82 @@
+"""SQLite-backed outbox for LTZF submissions that failed because the backend was unreachable."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.outbox import Outbox, OutboxEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (next_attempt_at);
+"""
+
+
+class SqliteOutbox(Outbox):
+    """Implements Outbox with a SQLite database (WAL mode) under ``cache_dir``.
+
+    Failed deliveries are retried after ``outbox_retry_base_s``, doubling per
+    attempt up to ``outbox_retry_max_s``.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "outbox.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def put(self, key: str, url: str, body: bytes) -> None:
+        """Insert or replace the entry; a replaced entry is due immediately again."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO outbox (key, url, body, next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET url = excluded.url, body = excluded.body, attempts = 0, "
+                "next_attempt_at = excluded.next_attempt_at, last_error = NULL",
+                (key, url, body, now, now),
+            )
+
+    def due(self, limit: int) -> list[OutboxEntry]:
+        """Select due entries in insertion order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, url, body, attempts FROM outbox WHERE next_attempt_at <= ? ORDER BY created_at LIMIT ?",
+                (time.time(), limit),
+            ).fetchall()
+        return [OutboxEntry(key=key, url=url, body=bytes(body), attempts=attempts) for key, url, body, attempts in rows]
+
+    def remove(self, key: str) -> None:
+        """Delete the entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE key = ?", (key,))
+
+    def defer(self, key: str, error: str) -> None:
+        """Push the next attempt back exponentially."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, "
+                "next_attempt_at = ? + MIN(? * (1 << attempts), ?), last_error = ? WHERE key = ?",
+                (time.time(), self._config.outbox_retry_base_s, self._config.outbox_retry_max_s, error, key),
+            )
+
+    def count(self) -> int:
+        """Count all entries, due or not."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()
+        return int(row[0])
@@ -0,0 +1,77 @@
+"""SQLite-backed store of revalidation times."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Iterable
+from datetime import date
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.revalidation_store import RevalidationStore, Verification
+
+
+class SqliteRevalidationStore(RevalidationStore):
+    """Implements RevalidationStore with a SQLite table in ``cache_dir/revalidation.sqlite3``."""
+
+    def __init__(self, config: Config) -> None:
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            cache_dir / "revalidation.sqlite3", timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS revalidation (vorgang_id TEXT PRIMARY KEY, vorgangstyp TEXT NOT NULL, "
+                "since TEXT NOT NULL, verified_at REAL NOT NULL, due_at REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS revalidation_due ON revalidation (due_at, vorgangstyp)")
+
+    def record(self, verifications: Iterable[Verification]) -> None:
+        """Insert or overwrite the entries in one transaction."""
+        now = time.time()
+        rows = [(v.vorgang_id, v.vorgangstyp, v.since.isoformat(), now, v.due_at) for v in verifications]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO revalidation (vorgang_id, vorgangstyp, since, verified_at, due_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (vorgang_id) DO UPDATE SET "
+                    "vorgangstyp = excluded.vorgangstyp, since = excluded.since, "
+                    "verified_at = excluded.verified_at, due_at = excluded.due_at",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def due_since(self, now: float) -> dict[str, date]:
+        """Select the earliest ``since`` per Vorgangstyp among the due entries."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT vorgangstyp, MIN(since) FROM revalidation WHERE due_at <= ? GROUP BY vorgangstyp", (now,)
+            ).fetchall()
+        return {vorgangstyp: date.fromisoformat(since) for vorgangstyp, since in rows}
+
+    def clear_due(self, vorgangstyp: str, date_from: date, date_to: date, now: float, *, seen: Collection[str]) -> int:
+        """Unset the due time of the entries still due within the searched range and not seen."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                due = self._conn.execute(
+                    "SELECT vorgang_id FROM revalidation "
+                    "WHERE due_at <= ? AND vorgangstyp = ? AND since BETWEEN ? AND ?",
+                    (now, vorgangstyp, date_from.isoformat(), date_to.isoformat()),
+                ).fetchall()
+                unseen = [(vorgang_id,) for (vorgang_id,) in due if vorgang_id not in seen]
+                self._conn.executemany("UPDATE revalidation SET due_at = NULL WHERE vorgang_id = ?", unseen)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(unseen)
@@ -0,0 +1,158 @@
+"""SQLite-backed work queue shared by a planner and any number of worker processes."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from bawue_scraper.config import Config
+from bawue_scraper.ports.work_queue import WorkQueue, WorkUnit
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT UNIQUE,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_work_units_state ON work_units (state, id);
+"""
+
+
+class SqliteWorkQueue(WorkQueue):
+    """Implements WorkQueue with a SQLite database (WAL mode) under ``cache_dir``.
+
+    Unit states: ``pending`` → ``leased`` → ``done``. A failed unit goes back to
+    ``pending`` until ``work_queue_max_attempts`` is reached, then to ``failed``.
+    A ``leased`` unit whose lease has expired is handed out again, or set to
+    ``failed`` if it has used up its attempts (its worker keeps crashing on it).
+    Acks and releases only apply while the caller still holds the lease.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+        cache_dir = Path(config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db_file = cache_dir / "work_queue.sqlite3"
+        self._conn = sqlite3.connect(self._db_file, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def _transaction(self, statements: list[tuple[str, tuple]]) -> int:
+        """Run the statements in one transaction.
+
+        Returns:
+            The number of rows changed by the last statement.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    rowcount = self._conn.execute(sql, params).rowcount
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return rowcount
+
+    def enqueue(self, kind: str, payload: dict, dedupe_key: str | None = None) -> None:
+        """Add a unit; a finished unit with the same dedupe key is reset to pending."""
+        self._transaction(
+            [
+                (
+                    "INSERT INTO work_units (kind, payload, dedupe_key, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(dedupe_key) DO UPDATE SET "
+                    "payload = excluded.payload, state = 'pending', attempts = 0, lease_owner = NULL, "
+                    "lease_expires = NULL, last_error = NULL, updated_at = excluded.updated_at "
+                    "WHERE state IN ('done', 'failed')",
+                    (kind, json.dumps(payload, ensure_ascii=False), dedupe_key, time.time()),
+                )
+            ]
+        )
+
+    def lease(self, worker_id: str, lease_s: float) -> WorkUnit | None:
+        """Lease the oldest pending unit, or one whose lease has expired with attempts left."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                max_attempts = self._config.work_queue_max_attempts
+                exhausted = self._conn.execute(
+                    "UPDATE work_units SET state = 'failed', lease_owner = NULL, lease_expires = NULL, "
+                    "last_error = ?, updated_at = ? WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (f"lease expired after {max_attempts} attempts", now, now, max_attempts),
+                ).rowcount
+                if exhausted:
+                    logger.error(
+                        "%d work units failed: their leases expired after %d attempts", exhausted, max_attempts
+                    )
+                row = self._conn.execute(
+                    "SELECT id, kind, payload, attempts, state FROM work_units "
+                    "WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                unit_id, kind, payload, attempts, state = row
+                if state == "leased":
+                    logger.warning("Lease on work unit %d expired, re-leasing to %s", unit_id, worker_id)
+                self._conn.execute(
+                    "UPDATE work_units SET state = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE id = ?",
+                    (worker_id, now + lease_s, now, unit_id),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return WorkUnit(unit_id=unit_id, kind=kind, payload=json.loads(payload), attempts=attempts + 1)
+
+    def ack(self, unit_id: int, worker_id: str) -> None:
+        """Mark a unit leased by ``worker_id`` as done."""
+        updated = self._transaction(
+            [
+                (
+                    "UPDATE work_units SET state = 'done', lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                    "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                    (time.time(), unit_id, worker_id),
+                )
+            ]
+        )
+        if not updated:
+            logger.warning("Ignoring ack of work unit %d by %s: its lease has passed on", unit_id, worker_id)
+
+    def release(self, unit_id: int, worker_id: str, error: str) -> None:
+        """Re-queue a failed unit leased by ``worker_id``, or mark it failed once it has used up its attempts."""
+        updated = self._transaction(
+            [
+                (
+                    "UPDATE work_units SET "
+                    "state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                    "lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ? "
+                    "WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+                    (self._config.work_queue_max_attempts, error, time.time(), unit_id, worker_id),
+                )
+            ]
+        )
+        if not updated:
+            logger.warning("Ignoring release of work unit %d by %s: its lease has passed on", unit_id, worker_id)
+
+    def outstanding(self) -> int:
+        """Count pending and leased units."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM work_units WHERE state IN ('pending', 'leased')").fetchone()
+        return int(row[0])
@@ -0,0 +1,61 @@
+"""Cache bootstrap: marks Vorgänge already stored in LTZF as processed, so a fresh node starts warm."""
+
+import logging
+from collections.abc import Iterable
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from bawue_scraper.ports.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+# Cache writes are batched so that an interrupted bootstrap keeps what it has read
+_BATCH_SIZE = 500
+
+
+def bootstrap_cache(vorgaenge: Iterable[dict], cache: Cache) -> int:
+    """Mark the PARLIS IDs of Vorgänge read from LTZF as processed.
+
+    The orchestrator derives ``api_id`` as ``uuid5(NAMESPACE_URL, vorgangs_id)`` and sends the
+    PARLIS ``vorgangs_id`` in ``ids``. Only an id that reproduces the Vorgang's ``api_id`` is
+    taken, so Vorgänge that another collector submitted or the backend merged are left to be
+    scraped again rather than wrongly skipped.
+
+    Args:
+        vorgaenge: Raw Vorgang objects from GET /api/v2/vorgang.
+        cache: The processed cache to fill.
+
+    Returns:
+        The number of PARLIS IDs marked as processed.
+    """
+    loaded = 0
+    read = 0
+    batch: list[str] = []
+    for vorgang in vorgaenge:
+        read += 1
+        vorgang_id = _parlis_id(vorgang)
+        if vorgang_id is None:
+            continue
+        batch.append(vorgang_id)
+        if len(batch) >= _BATCH_SIZE:
+            cache.mark_processed_many(batch)
+            loaded += len(batch)
+            batch = []
+    cache.mark_processed_many(batch)
+    loaded += len(batch)
+    cache.flush()
+
+    logger.info("Bootstrap complete: read=%d, marked-processed=%d, not-ours=%d", read, loaded, read - loaded)
+    return loaded
+
+
+def _parlis_id(vorgang: dict) -> str | None:
+    try:
+        api_id = UUID(str(vorgang["api_id"]))
+    except (KeyError, ValueError):
+        return None
+    for ident in vorgang.get("ids") or []:
+        # The backend may return identifiers as plain strings or as {"typ": ..., "id": ...} objects
+        candidate = ident.get("id") if isinstance(ident, dict) else ident
+        if isinstance(candidate, str) and uuid5(NAMESPACE_URL, candidate) == api_id:
+            return candidate
+    return None
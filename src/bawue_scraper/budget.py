@@ -0,0 +1,38 @@
+"""Run time budget and duration estimates used to decide what work still fits."""
+
+import math
+import time
+
+
+class CostEstimate:
+    """Exponentially weighted moving average of observed durations."""
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        self._alpha = alpha
+        self.estimate_s = 0.0
+        self._observed = False
+
+    def observe(self, duration_s: float) -> None:
+        """Feed one observed duration into the average."""
+        if not self._observed:
+            self.estimate_s = duration_s
+            self._observed = True
+        else:
+            self.estimate_s = self._alpha * duration_s + (1 - self._alpha) * self.estimate_s
+
+
+class TimeBudget:
+    """Tracks the time left of a run; without a budget every piece of work fits."""
+
+    def __init__(self, budget_s: float | None) -> None:
+        self._deadline = None if budget_s is None else time.monotonic() + budget_s
+
+    def remaining_s(self) -> float:
+        """Seconds left until the budget is used up (``inf`` without a budget)."""
+        if self._deadline is None:
+            return math.inf
+        return self._deadline - time.monotonic()
+
+    def allows(self, estimate_s: float) -> bool:
+        """Check whether work of the estimated duration can still finish within the budget."""
+        return self.remaining_s() > estimate_s
@@ -0,0 +1,143 @@
+"""Bulk upload: submits NDJSON export files written by the file sink to an LTZF backend in parallel."""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from bawue_scraper.adapters.ndjson_sink import PARTIAL_SUFFIX
+from bawue_scraper.concurrency import AimdLimiter
+from bawue_scraper.domain.models import Sitzung, Vorgang
+from bawue_scraper.ports.ltzf_api import LtzfApi
+
+logger = logging.getLogger(__name__)
+
+_SITZUNGEN = TypeAdapter(list[Sitzung])
+
+
+@dataclass
+class UploadStats:
+    """Counters collected while uploading export files."""
+
+    files: int = 0
+    records: int = 0
+    submitted: int = 0
+    errors: int = 0
+
+    def summary(self) -> str:
+        """Format the counters for the upload summary log line."""
+        return f"files={self.files}, records={self.records}, submitted={self.submitted}, errors={self.errors}"
+
+
+def export_files(export_dir: Path) -> list[Path]:
+    """Finished export files in ``export_dir``, oldest first (file names start with a timestamp)."""
+    files = [p for p in export_dir.glob("*.ndjson*") if not p.name.endswith(PARTIAL_SUFFIX)]
+    return sorted(files, key=lambda p: p.name)
+
+
+def upload_exports(
+    paths: list[Path],
+    ltzf_api: LtzfApi,
+    *,
+    concurrency: int,
+    stop: threading.Event | None = None,
+) -> UploadStats:
+    """Submit every record of the given export files.
+
+    Records are read as a stream and submitted by up to ``concurrency`` threads;
+    the AIMD limiter backs off while the backend fails or slows down. Versions of
+    the same Vorgang or calendar date are submitted in file order, so the newest
+    one wins. Unreadable lines and damaged files are counted as errors and skipped.
+
+    Args:
+        paths: NDJSON files, plain or gzip-compressed.
+        ltzf_api: Where to submit the records.
+        concurrency: Maximum number of concurrent submissions.
+        stop: When set, no further records are started.
+
+    Returns:
+        The upload counters.
+    """
+    stats = UploadStats()
+    stats_lock = threading.Lock()
+    limiter = AimdLimiter(concurrency)
+    in_flight: dict[str, Future] = {}
+
+    def send(key: str, submit: Callable[[], bool]) -> None:
+        started = time.monotonic()
+        ok = False
+        try:
+            ok = submit()
+        except Exception:  # intentional: one failing record must not stop the upload
+            logger.exception("Error uploading %s", key)
+        finally:
+            limiter.release(time.monotonic() - started, ok)
+        with stats_lock:
+            if ok:
+                stats.submitted += 1
+            else:
+                stats.errors += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ltzf-upload") as executor:
+        for path in paths:
+            if stop is not None and stop.is_set():
+                logger.warning("Stop requested, not uploading the remaining export files")
+                break
+            stats.files += 1
+            try:
+                for line_no, line in enumerate(_read_lines(path), start=1):
+                    if stop is not None and stop.is_set():
+                        break
+                    try:
+                        key, submit = _parse_record(line, ltzf_api)
+                    except (KeyError, ValueError) as e:
+                        logger.error("Skipping unreadable record %s:%d: %s", path.name, line_no, e)
+                        with stats_lock:
+                            stats.errors += 1
+                        continue
+                    stats.records += 1
+                    previous = in_flight.pop(key, None)
+                    if previous is not None:
+                        previous.result()
+                    # Taking the slot here bounds the records held in memory to the concurrency limit
+                    limiter.acquire()
+                    in_flight[key] = executor.submit(send, key, submit)
+                    if len(in_flight) > 4 * concurrency:
+                        in_flight = {k: f for k, f in in_flight.items() if not f.done()}
+            except (OSError, EOFError) as e:
+                logger.error("Export file %s is damaged, skipping the rest of it: %s", path, e)
+                with stats_lock:
+                    stats.errors += 1
+
+    logger.info("Upload complete: %s (%.1f records/s)", stats.summary(), limiter.throughput())
+    return stats
+
+
+def _read_lines(path: Path) -> Iterator[bytes]:
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield line
+
+
+def _parse_record(line: bytes, ltzf_api: LtzfApi) -> tuple[str, Callable[[], bool]]:
+    """Parse one export line into its payload key and the submission call."""
+    record = json.loads(line)
+    kind = record["kind"]
+    if kind == "vorgang":
+        vorgang = Vorgang.model_validate(record["payload"])
+        return f"vorgang:{vorgang.api_id}", lambda: ltzf_api.submit_vorgang(vorgang)
+    if kind == "kalender":
+        datum = date.fromisoformat(record["datum"])
+        sitzungen = _SITZUNGEN.validate_python(record["payload"])
+        return f"kalender:{datum.isoformat()}", lambda: ltzf_api.submit_sitzungen(datum, sitzungen)
+    raise ValueError(f"unknown record kind {kind!r}")
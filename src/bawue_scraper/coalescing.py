@@ -0,0 +1,73 @@
+"""Coalescing buffer: merges repeated builds of the same Vorgang into a single LTZF submission."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from bawue_scraper.domain.merge import merge_vorgaenge
+from bawue_scraper.domain.models import Vorgang
+
+
+@dataclass
+class _Pending:
+    vorgang: Vorgang
+    vorgang_ids: list[str]
+    first_added: float
+
+
+class CoalescingBuffer:
+    """Holds built Vorgänge keyed by ``api_id`` for ``window_s`` after their first build.
+
+    A Vorgang built again while it is held (found under another Vorgangstyp or window,
+    or re-enqueued) is merged into the held version instead of producing another PUT.
+    The caller takes due entries with :meth:`pop_due` and everything that is left with
+    :meth:`pop_all` at the end of a run. Thread-safe.
+    """
+
+    def __init__(self, window_s: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._window_s = window_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Pending] = {}
+
+    def add(self, vorgang: Vorgang, vorgang_id: str) -> bool:
+        """Hold a built Vorgang, merging it into an already held version.
+
+        Args:
+            vorgang: The built Vorgang.
+            vorgang_id: The PARLIS id it was built from, to be marked processed once submitted.
+
+        Returns:
+            True if it was merged into a held version, False if it starts a new entry.
+        """
+        key = str(vorgang.api_id)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = _Pending(vorgang, [vorgang_id], self._clock())
+                return False
+            pending.vorgang = merge_vorgaenge(pending.vorgang, vorgang)
+            if vorgang_id not in pending.vorgang_ids:
+                pending.vorgang_ids.append(vorgang_id)
+            return True
+
+    def pop_due(self) -> list[tuple[Vorgang, list[str]]]:
+        """Remove and return the entries held for at least the window."""
+        cutoff = self._clock() - self._window_s
+        with self._lock:
+            due = [key for key, pending in self._pending.items() if pending.first_added <= cutoff]
+            return [self._take(key) for key in due]
+
+    def pop_all(self) -> list[tuple[Vorgang, list[str]]]:
+        """Remove and return every held entry."""
+        with self._lock:
+            return [self._take(key) for key in list(self._pending)]
+
+    def _take(self, key: str) -> tuple[Vorgang, list[str]]:
+        pending = self._pending.pop(key)
+        return pending.vorgang, pending.vorgang_ids
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
@@ -0,0 +1,93 @@
+"""Adaptive concurrency limit (AIMD) for LTZF submissions."""
+
+import logging
+import math
+import threading
+import time
+
+from bawue_scraper.budget import CostEstimate
+
+logger = logging.getLogger(__name__)
+
+
+class AimdLimiter:
+    """Limits concurrent operations with additive increase and multiplicative decrease.
+
+    After ``limit`` consecutive healthy completions the limit grows by one. A failed
+    operation or a latency spike (more than ``spike_factor`` times the average
+    healthy latency) multiplies the limit by ``decrease_factor``, at most once per
+    average latency so that one burst of failures in flight counts as one signal.
+    Transport-level 429/5xx retries surface here as failures or latency spikes.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        *,
+        initial: int = 1,
+        decrease_factor: float = 0.5,
+        spike_factor: float = 3.0,
+    ) -> None:
+        self._maximum = maximum
+        self._decrease_factor = decrease_factor
+        self._spike_factor = spike_factor
+        self._limit = max(1, min(initial, maximum))
+        self._in_flight = 0
+        self._healthy_streak = 0
+        self._latency = CostEstimate()
+        self._last_decrease = -math.inf
+        self._completed = 0
+        self._started_at: float | None = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until fewer than ``limit`` operations are in flight, then take a slot."""
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+
+    def release(self, latency_s: float, ok: bool) -> None:
+        """Return a slot and adjust the limit from the outcome of the operation.
+
+        Args:
+            latency_s: How long the operation took.
+            ok: Whether it succeeded.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._completed += 1
+            baseline = self._latency.estimate_s
+            spike = baseline > 0 and latency_s > baseline * self._spike_factor
+            if ok and not spike:
+                self._latency.observe(latency_s)
+                self._healthy_streak += 1
+                if self._healthy_streak >= self._limit and self._limit < self._maximum:
+                    self._limit += 1
+                    self._healthy_streak = 0
+                    logger.debug("Submission concurrency raised to %d", self._limit)
+            else:
+                self._healthy_streak = 0
+                now = time.monotonic()
+                if now - self._last_decrease >= max(baseline, 0.1):
+                    self._last_decrease = now
+                    self._limit = max(1, int(self._limit * self._decrease_factor))
+                    logger.info(
+                        "Submission concurrency lowered to %d (%s)", self._limit, "latency spike" if ok else "failure"
+                    )
+            self._condition.notify_all()
+
+    def throughput(self) -> float:
+        """Completed operations per second since the first acquire."""
+        with self._condition:
+            if self._started_at is None:
+                return 0.0
+            elapsed = time.monotonic() - self._started_at
+            return self._completed / elapsed if elapsed > 0 else 0.0
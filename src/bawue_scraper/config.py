@@ -20,10 +20,51 @@ class Config(BaseSettings):
 
     # Optional
     ltzf_allow_redirects: bool = False
-    ltzf_mode: Literal["dry-run", "live"] = "dry-run"
+    ltzf_mode: Literal["dry-run", "live", "file"] = "dry-run"
+    ltzf_timeout_s: float = 60.0
+    ltzf_pool_size: int = 10
+    ltzf_submit_concurrency: int = 1
+    ltzf_coalesce_window_s: float = 0.0
+    ltzf_request_compression: Literal["none", "gzip", "deflate"] = "none"
+    ltzf_compression_min_bytes: int = 65536
+    ltzf_stream_min_bytes: int = 0
+    ltzf_stream_spool: bool = False
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_cooldown_s: float = 300.0
+    outbox_retry_base_s: float = 60.0
+    outbox_retry_max_s: float = 3600.0
+    export_dir: str = "./export"
+    export_rotate_mb: float = 64.0
     scrape_interval_hours: int = 24
     scrape_lookback_days: int = 7
+    scrape_time_budget_s: float | None = None
     parlis_request_delay_s: float = 1.0
+    parlis_session_ttl_s: int = 1800
+    search_prefetch_depth: int = 1
     log_level: str = "INFO"
     cache_dir: str = "./cache"
+    cache_backend: Literal["json", "sqlite", "journal"] = "json"
+    cache_compact_records: int = 10000
+    cache_commit_interval_s: float = 60.0
+    revalidate_interval_days: dict[str, float] = {"Gesetzgebung": 3.0}
+    revalidate_answer_due_days: float = 21.0
     wahlperiode: int = 17
+
+    # Processing deadlines (seconds; unset or <= 0 disables)
+    vorgang_deadline_s: float | None = 900.0
+    extraction_deadline_s: float | None = 300.0
+    submission_deadline_s: float | None = 120.0
+    shutdown_grace_s: float = 25.0
+
+    # Daemon mode
+    scrape_jitter_s: float = 300.0
+    vorgangstyp_interval_hours: dict[str, float] = {}
+
+    # Run lock (one active runner per cache_dir; "sqlite" for volumes shared between hosts)
+    run_lock_backend: Literal["none", "file", "sqlite"] = "file"
+    run_lock_lease_s: float = 60.0
+
+    # Work queue (planner/worker mode)
+    work_queue_lease_s: int = 900
+    work_queue_max_attempts: int = 3
+    work_queue_poll_interval_s: float = 5.0
@@ -0,0 +1,30 @@
+"""Canonical content hashes of domain models."""
+
+import hashlib
+
+from bawue_scraper.domain.models import Sitzung, Vorgang
+from bawue_scraper.domain.serialization import iter_json_chunks, sitzungen_to_json_bytes, to_json_bytes, volltext_size
+
+
+def vorgang_fingerprint(vorgang: Vorgang, *, stream_min_bytes: int = 0) -> str:
+    """SHA-256 of the Vorgang's PUT body.
+
+    The body lists fields in model definition order, so equal Vorgänge always hash equally.
+
+    Args:
+        vorgang: The Vorgang to hash.
+        stream_min_bytes: From this many characters of document text on, the body is
+            hashed piece by piece as :func:`iter_json_chunks` produces it instead of
+            being built in memory; the digest is the same. 0 never streams.
+    """
+    if stream_min_bytes and volltext_size(vorgang) >= stream_min_bytes:
+        digest = hashlib.sha256()
+        for chunk in iter_json_chunks(vorgang):
+            digest.update(chunk)
+        return digest.hexdigest()
+    return hashlib.sha256(to_json_bytes(vorgang)).hexdigest()
+
+
+def sitzungen_fingerprint(sitzungen: list[Sitzung]) -> str:
+    """SHA-256 of the PUT body for one calendar date; callers pass the Sitzungen in a stable order."""
+    return hashlib.sha256(sitzungen_to_json_bytes(sitzungen)).hexdigest()
@@ -0,0 +1,82 @@
+"""Merging of two builds of the same Vorgang."""
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from bawue_scraper.domain.models import Dokument, Station, Vorgang
+
+
+def merge_vorgaenge(base: Vorgang, update: Vorgang) -> Vorgang:
+    """Combine two builds of the same Vorgang (same ``api_id``) into one.
+
+    Scalar fields come from ``update``. Stationen are matched by typ, start time,
+    Gremium and the links of their Dokumente, so that two Fundstellen of the same
+    kind on the same day stay apart; a Station found in both keeps the Dokumente of
+    both, matched by hash, or by link while no text could be extracted. Initiatoren,
+    ids and links are combined without duplicates, in first-seen order.
+    """
+    return update.model_copy(
+        update={
+            "stationen": _union(base.stationen, update.stationen, _station_key, _merge_station),
+            "initiatoren": _union(base.initiatoren, update.initiatoren, lambda a: (a.organisation, a.person)),
+            "ids": _optional_union(base.ids, update.ids, str),
+            "links": _optional_union(base.links, update.links, str),
+        }
+    )
+
+
+def _station_key(station: Station) -> Hashable:
+    links = tuple(sorted({str(dokument.link) for dokument in station.dokumente}))
+    return station.typ, station.zp_start, station.gremium.name, links
+
+
+def _dokument_key(dokument: Dokument) -> Hashable:
+    # The hash is empty when text extraction failed or is not available
+    return dokument.hash or str(dokument.link)
+
+
+def _merge_station(base: Station, update: Station) -> Station:
+    return update.model_copy(
+        update={
+            "dokumente": _union(base.dokumente, update.dokumente, _dokument_key),
+            "stellungnahmen": _optional_union(base.stellungnahmen, update.stellungnahmen, _dokument_key),
+        }
+    )
+
+
+def _union(
+    base: list[Any],
+    update: list[Any],
+    key: Callable[[Any], Hashable],
+    merge: Callable[[Any, Any], Any] | None = None,
+) -> list[Any]:
+    """Items of both lists by key, in first-seen order; on a key clash the item from ``update`` wins.
+
+    Items sharing a key within one list are kept apart: the n-th of them in ``update``
+    matches the n-th in ``base``.
+    """
+    merged: dict[Hashable, Any] = {}
+    for k, item in _numbered(base, key):
+        merged[k] = item
+    for k, item in _numbered(update, key):
+        merged[k] = merge(merged[k], item) if merge is not None and k in merged else item
+    return list(merged.values())
+
+
+def _numbered(items: list[Any], key: Callable[[Any], Hashable]) -> list[tuple[Hashable, Any]]:
+    """Pair each item with its key and the number of earlier items with the same key."""
+    seen: dict[Hashable, int] = {}
+    numbered = []
+    for item in items:
+        k = key(item)
+        seen[k] = seen.get(k, -1) + 1
+        numbered.append(((k, seen[k]), item))
+    return numbered
+
+
+def _optional_union(
+    base: list[Any] | None, update: list[Any] | None, key: Callable[[Any], Hashable]
+) -> list[Any] | None:
+    if base is None or update is None:
+        return update if base is None else base
+    return _union(base, update, key)
@@ -0,0 +1,94 @@
+"""Serialisation of domain models to LTZF request bodies."""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from bawue_scraper.domain.models import Dokument, Sitzung, Station, Vorgang
+
+_SITZUNGEN = TypeAdapter(list[Sitzung])
+_STR = TypeAdapter(str)
+
+# Characters of volltext encoded per chunk by iter_json_chunks
+VOLLTEXT_CHUNK_CHARS = 256 * 1024
+
+
+def to_json_bytes(model: BaseModel) -> bytes:
+    """Serialise a model to compact UTF-8 JSON, leaving out None fields.
+
+    Encodes straight from the model with pydantic-core, without building the
+    intermediate dict tree of ``model_dump`` or a ``str`` copy of the output, so
+    large ``volltext`` strings are copied only once, into the result.
+    """
+    return model.__pydantic_serializer__.to_json(model, exclude_none=True)
+
+
+def sitzungen_to_json_bytes(sitzungen: list[Sitzung]) -> bytes:
+    """Serialise the Sitzungen of one date to a JSON array, like :func:`to_json_bytes`."""
+    return _SITZUNGEN.dump_json(sitzungen, exclude_none=True)
+
+
+def volltext_size(vorgang: Vorgang) -> int:
+    """Characters of document text in a Vorgang, which make up nearly all of its body size."""
+    return sum(
+        len(dokument.volltext)
+        for station in vorgang.stationen
+        for dokument in [*station.dokumente, *(station.stellungnahmen or [])]
+    )
+
+
+def iter_json_chunks(vorgang: Vorgang, *, chunk_chars: int = VOLLTEXT_CHUNK_CHARS) -> Iterator[bytes]:
+    """Serialise a Vorgang incrementally, yielding the bytes of :func:`to_json_bytes` in pieces.
+
+    Stationen, Dokumente and Stellungnahmen are encoded one at a time and each
+    ``volltext`` in slices of ``chunk_chars`` characters, so no piece is larger
+    than about one slice plus one Dokument's metadata, whatever the Vorgang size.
+    The concatenated output is byte-identical to :func:`to_json_bytes`.
+    """
+
+    def stationen(items: list[Station]) -> Iterator[bytes]:
+        return _iter_list(items, lambda station: _iter_station(station, chunk_chars))
+
+    return _spliced(vorgang, {"stationen": stationen})
+
+
+def _iter_station(station: Station, chunk_chars: int) -> Iterator[bytes]:
+    def dokumente(items: list[Dokument]) -> Iterator[bytes]:
+        return _iter_list(items, lambda dokument: _iter_dokument(dokument, chunk_chars))
+
+    return _spliced(station, {"dokumente": dokumente, "stellungnahmen": dokumente})
+
+
+def _iter_dokument(dokument: Dokument, chunk_chars: int) -> Iterator[bytes]:
+    def volltext(text: str) -> Iterator[bytes]:
+        for start in range(0, len(text), chunk_chars):
+            # Strip the quotes of each encoded slice; escaping is per character, so slices concatenate
+            yield _STR.dump_json(text[start : start + chunk_chars])[1:-1]
+
+    return _spliced(dokument, {"volltext": volltext})
+
+
+def _iter_list(items: list[Any], encode: Callable[[Any], Iterator[bytes]]) -> Iterator[bytes]:
+    for i, item in enumerate(items):
+        if i:
+            yield b","
+        yield from encode(item)
+
+
+def _spliced(model: BaseModel, streamed: dict[str, Callable[[Any], Iterator[bytes]]]) -> Iterator[bytes]:
+    """Encode ``model`` with the ``streamed`` fields emptied, then splice in their incremental encoding.
+
+    The fields are found by their ``"name":[]`` / ``"name":""`` marker in the skeleton;
+    quotes inside string values are escaped, so a marker cannot be matched inside one.
+    """
+    names = [name for name in type(model).model_fields if name in streamed and getattr(model, name) is not None]
+    empty = {name: "" if isinstance(getattr(model, name), str) else [] for name in names}
+    rest = to_json_bytes(model.model_copy(update=empty))
+    for name in names:
+        open_, close = (b'"', b'"') if empty[name] == "" else (b"[", b"]")
+        head, _, rest = rest.partition(b'"' + name.encode() + b'":' + open_ + close)
+        yield head + b'"' + name.encode() + b'":' + open_
+        yield from streamed[name](getattr(model, name))
+        yield close
+    yield rest
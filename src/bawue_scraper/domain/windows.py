@@ -0,0 +1,19 @@
+"""Date window helpers for splitting scraping ranges."""
+
+import calendar
+from datetime import date
+
+
+def monthly_windows(date_from: date, date_to: date) -> list[tuple[date, date]]:
+    """Split a date range into monthly windows."""
+    windows = []
+    current = date_from
+    while current <= date_to:
+        last_day = calendar.monthrange(current.year, current.month)[1]
+        window_end = date(current.year, current.month, last_day)
+        if window_end > date_to:
+            window_end = date_to
+        windows.append((current, window_end))
+        # Move to first day of next month
+        current = date(current.year + 1, 1, 1) if current.month == 12 else date(current.year, current.month + 1, 1)
+    return windows
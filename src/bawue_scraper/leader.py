@@ -0,0 +1,81 @@
+"""Leader election: keeps a RunLock renewed while this process is the active runner."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from bawue_scraper.ports.run_lock import RunLock
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """Acquires a RunLock and renews it from a heartbeat thread.
+
+    The heartbeat renews every third of the lease. If a renewal is refused (a
+    standby took the lock over) or renewals keep failing until the lease has
+    run out, ``on_lost`` is called once so the caller can stop working.
+    """
+
+    def __init__(self, lock: RunLock, owner: str, lease_s: float, on_lost: Callable[[], None]) -> None:
+        self._lock = lock
+        self._owner = owner
+        self._lease_s = lease_s
+        self._on_lost = on_lost
+        self._released = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+
+    @property
+    def owner(self) -> str:
+        """Identifier this process uses as lock owner."""
+        return self._owner
+
+    def acquire(self) -> bool:
+        """Try once to become leader; starts the heartbeat on success."""
+        if not self._lock.try_acquire(self._owner, self._lease_s):
+            return False
+        logger.info("Acquired run lock as %s", self._owner)
+        self._released.clear()
+        self._heartbeat = threading.Thread(target=self._renew_loop, name="run-lock-heartbeat", daemon=True)
+        self._heartbeat.start()
+        return True
+
+    def wait(self, stop: threading.Event) -> bool:
+        """Stand by until this process becomes leader.
+
+        Args:
+            stop: Ends the wait early when set.
+
+        Returns:
+            True once leader, False if ``stop`` was set first.
+        """
+        logger.info("Another process holds the run lock, standing by")
+        while not self.acquire():
+            if stop.wait(self._lease_s / 3):
+                return False
+        return True
+
+    def release(self) -> None:
+        """Stop the heartbeat and give up the lock."""
+        self._released.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        self._lock.release(self._owner)
+
+    def _renew_loop(self) -> None:
+        last_renewed = time.monotonic()
+        while not self._released.wait(self._lease_s / 3):
+            try:
+                if self._lock.renew(self._owner, self._lease_s):
+                    last_renewed = time.monotonic()
+                    continue
+                logger.error("Run lock was taken over by another process, stopping")
+            except Exception:  # intentional: retry until the lease would have expired
+                logger.warning("Failed to renew run lock", exc_info=True)
+                if time.monotonic() - last_renewed < self._lease_s:
+                    continue
+                logger.error("Run lock could not be renewed before it expired, stopping")
+            self._on_lost()
+            return
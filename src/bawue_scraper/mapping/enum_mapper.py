@@ -44,6 +44,25 @@ VORGANGSTYP_MAP: dict[str, Vorgangstyp] = {
     "Wahlprüfung": Vorgangstyp.SONSTIG,
 }
 
+# ---------------------------------------------------------------------------
+# Scheduling priority per PARLIS Vorgangstyp (lower value = scraped first).
+# Legislative types are the core data; high-volume question types come last.
+# Types not listed here use PRIORITY_NORMAL.
+# ---------------------------------------------------------------------------
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+VORGANGSTYP_PRIORITY: dict[str, int] = {
+    "Gesetzgebung": PRIORITY_HIGH,
+    "Haushaltsgesetzgebung": PRIORITY_HIGH,
+    "Volksantrag": PRIORITY_HIGH,
+    "Kleine Anfrage": PRIORITY_LOW,
+    "Mündliche Anfrage": PRIORITY_LOW,
+    "Petitionen": PRIORITY_LOW,
+    "Anmerkung zur Plenarsitzung": PRIORITY_LOW,
+}
+
 # ---------------------------------------------------------------------------
 # Stationstyp mapping: Fundstelle text pattern → LTZF Stationstyp
 # Ordered longest-first so "Beschlussempfehlung und Bericht" matches before
@@ -65,8 +84,8 @@ STATIONSTYP_MAP: dict[str, Stationstyp] = {
     "Inkrafttreten": Stationstyp.POSTPARL_KRAFT,
 }
 
-# Sorted keys longest-first for greedy matching
-_STATIONSTYP_KEYS_SORTED = sorted(STATIONSTYP_MAP.keys(), key=len, reverse=True)
+# Sorted keys longest-first for greedy matching, paired with their lowercase form
+_STATIONSTYP_KEYS_SORTED = [(key, key.lower()) for key in sorted(STATIONSTYP_MAP.keys(), key=len, reverse=True)]
 
 # ---------------------------------------------------------------------------
 # Dokumententyp mapping: document context → LTZF Dokumententyp
@@ -84,7 +103,7 @@ DOKUMENTENTYP_MAP: dict[str, Dokumententyp] = {
     "Mitteilung": Dokumententyp.MITTEILUNG,
 }
 
-_DOKUMENTENTYP_KEYS_SORTED = sorted(DOKUMENTENTYP_MAP.keys(), key=len, reverse=True)
+_DOKUMENTENTYP_KEYS_SORTED = [(key, key.lower()) for key in sorted(DOKUMENTENTYP_MAP.keys(), key=len, reverse=True)]
 
 
 def map_vorgangstyp(parlis_typ: str) -> Vorgangstyp:
@@ -99,6 +118,18 @@ def map_vorgangstyp(parlis_typ: str) -> Vorgangstyp:
     return VORGANGSTYP_MAP.get(parlis_typ, Vorgangstyp.SONSTIG)
 
 
+def vorgangstyp_priority(parlis_typ: str) -> int:
+    """Return the scheduling priority class of a PARLIS Vorgangstyp.
+
+    Args:
+        parlis_typ: The Vorgangstyp string from PARLIS.
+
+    Returns:
+        PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW.
+    """
+    return VORGANGSTYP_PRIORITY.get(parlis_typ, PRIORITY_NORMAL)
+
+
 def map_stationstyp(fundstelle_text: str, initiator: str | None = None) -> Stationstyp:
     """Map a Fundstelle text to the LTZF Stationstyp enum.
 
@@ -113,8 +144,8 @@ def map_stationstyp(fundstelle_text: str, initiator: str | None = None) -> Stati
         The corresponding LTZF Stationstyp, or SONSTIG if no match.
     """
     text_lower = fundstelle_text.lower()
-    for key in _STATIONSTYP_KEYS_SORTED:
-        if key.lower() in text_lower:
+    for key, key_lower in _STATIONSTYP_KEYS_SORTED:
+        if key_lower in text_lower:
             # Special case: Gesetzentwurf from Landesregierung → PREPARL_REGENT
             if key == "Gesetzentwurf" and initiator and "Landesregierung" in initiator:
                 return Stationstyp.PREPARL_REGENT
@@ -133,8 +164,8 @@ def map_dokumententyp(context: str, is_vorparlamentarisch: bool = False) -> Doku
         The corresponding LTZF Dokumententyp, or SONSTIG if no match.
     """
     context_lower = context.lower()
-    for key in _DOKUMENTENTYP_KEYS_SORTED:
-        if key.lower() in context_lower:
+    for key, key_lower in _DOKUMENTENTYP_KEYS_SORTED:
+        if key_lower in context_lower:
             if key == "Gesetzentwurf" and is_vorparlamentarisch:
                 return Dokumententyp.PREPARL_ENTWURF
             return DOKUMENTENTYP_MAP[key]
@@ -1,24 +1,90 @@
 """Pipeline orchestrator: coordinates the scraping workflow via ports."""
 
+import hashlib
+import json
 import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields
 from datetime import date, datetime, timedelta
+from enum import Enum
 from uuid import NAMESPACE_URL, uuid5
 
+from bawue_scraper.budget import CostEstimate, TimeBudget
+from bawue_scraper.coalescing import CoalescingBuffer
+from bawue_scraper.concurrency import AimdLimiter
 from bawue_scraper.config import Config
 from bawue_scraper.domain.enums import Stationstyp
-from bawue_scraper.domain.models import Autor, Dokument, Gremium, Station, Vorgang
-from bawue_scraper.mapping.enum_mapper import VORGANGSTYP_MAP, map_dokumententyp, map_stationstyp, map_vorgangstyp
+from bawue_scraper.domain.fingerprint import sitzungen_fingerprint, vorgang_fingerprint
+from bawue_scraper.domain.models import Autor, Dokument, Gremium, Sitzung, Station, Vorgang
+from bawue_scraper.domain.windows import monthly_windows
+from bawue_scraper.mapping.enum_mapper import (
+    VORGANGSTYP_MAP,
+    map_dokumententyp,
+    map_stationstyp,
+    map_vorgangstyp,
+    vorgangstyp_priority,
+)
 from bawue_scraper.ports.cache import Cache
 from bawue_scraper.ports.calendar_source import CalendarSource
+from bawue_scraper.ports.checkpoint import Checkpoint, PendingSearch
 from bawue_scraper.ports.document_extractor import DocumentExtractor
-from bawue_scraper.ports.ltzf_api import LtzfApi
+from bawue_scraper.ports.fingerprint_store import FingerprintStore
+from bawue_scraper.ports.ltzf_api import KALENDER_MAX_DAYS_AHEAD, LtzfApi
+from bawue_scraper.ports.revalidation_store import RevalidationStore, Verification
 from bawue_scraper.ports.vorgang_source import RawFundstelle, RawVorgang, VorgangSource
+from bawue_scraper.ports.work_queue import WorkQueue, WorkUnit
+from bawue_scraper.revalidation import RevalidationPolicy
+from bawue_scraper.watchdog import DeadlineExceeded, run_with_deadline
 
 logger = logging.getLogger(__name__)
 
 # Default Vorgangstypen to scrape — derived from the canonical VORGANGSTYP_MAP
 DEFAULT_VORGANGSTYPEN: list[str] = list(VORGANGSTYP_MAP.keys())
 
+# Work unit kinds used in planner/worker mode
+WORK_KIND_SEARCH = "search"
+WORK_KIND_BUILD = "build"
+
+
+@dataclass
+class RunStats:
+    """Counters collected while processing Vorgänge."""
+
+    total: int = 0
+    submitted: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    deferred: int = 0
+    coalesced: int = 0
+
+    def summary(self) -> str:
+        """Format the counters for the run summary log line."""
+        return (
+            f"total={self.total}, submitted={self.submitted}, skipped={self.skipped}, "
+            f"skipped-unchanged={self.unchanged}, errors={self.errors}, timeouts={self.timeouts}, "
+            f"deferred={self.deferred}, coalesced={self.coalesced}"
+        )
+
+    def merge(self, other: "RunStats") -> None:
+        """Add the counters of ``other`` to this instance."""
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+class _Outcome(Enum):
+    SUBMITTED = "submitted"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+    # Held by the coalescing buffer; submitted (and counted) when the buffer is emitted
+    BUFFERED = "buffered"
+    COALESCED = "coalesced"
+
 
 class Orchestrator:
     """Coordinates the scraping pipeline using injected port implementations."""
@@ -31,6 +97,9 @@ class Orchestrator:
         calendar_source: CalendarSource,
         ltzf_api: LtzfApi,
         cache: Cache,
+        checkpoint: Checkpoint | None = None,
+        fingerprints: FingerprintStore | None = None,
+        revalidation: RevalidationStore | None = None,
     ) -> None:
         self._config = config
         self._vorgang_source = vorgang_source
@@ -38,6 +107,39 @@ class Orchestrator:
         self._calendar_source = calendar_source
         self._ltzf_api = ltzf_api
         self._cache = cache
+        self._checkpoint = checkpoint
+        self._fingerprints = fingerprints
+        self._revalidation = revalidation
+        self._revalidation_policy = RevalidationPolicy(config)
+        self._search_cost = CostEstimate()
+        self._record_cost = CostEstimate()
+        self._stop = threading.Event()
+        self._drain_until = math.inf
+        self._last_commit = time.monotonic()
+        # Source fingerprints and revalidation entries of the Vorgänge held in the coalescing buffer, by PARLIS id
+        self._held_sources: dict[str, str] = {}
+        self._held_verifications: dict[str, Verification] = {}
+        concurrency = config.ltzf_submit_concurrency
+        self._submit_limiter = AimdLimiter(concurrency) if concurrency > 1 else None
+        window = config.ltzf_coalesce_window_s
+        self._coalescer = CoalescingBuffer(window) if window > 0 else None
+
+    def request_stop(self, grace_s: float | None = None) -> None:
+        """Stop accepting new work and drain in-flight work.
+
+        Safe to call from a signal handler. The Vorgang currently being processed
+        may finish within the grace period (default ``shutdown_grace_s``); after
+        that it is abandoned and retried on the next run. Unstarted searches are
+        saved to the checkpoint as with an exhausted time budget.
+        """
+        grace = self._config.shutdown_grace_s if grace_s is None else grace_s
+        self._drain_until = time.monotonic() + grace
+        self._stop.set()
+
+    @property
+    def stop_requested(self) -> bool:
+        """Whether :meth:`request_stop` has been called."""
+        return self._stop.is_set()
 
     def run(
         self,
@@ -45,6 +147,7 @@ class Orchestrator:
         vorgangstypen: list[str] | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
+        time_budget_s: float | None = None,
     ) -> None:
         """Execute a full scraping cycle.
 
@@ -52,11 +155,13 @@ class Orchestrator:
             vorgangstypen: Override the default list of Vorgangstypen to scrape.
             date_from: Override the default start date.
             date_to: Override the default end date.
+            time_budget_s: Override the configured time budget for the Vorgänge pipeline.
         """
         self.run_vorgaenge(
             vorgangstypen=vorgangstypen or DEFAULT_VORGANGSTYPEN,
             date_from=date_from or date.today() - timedelta(days=self._config.scrape_lookback_days),
             date_to=date_to or date.today(),
+            time_budget_s=time_budget_s,
         )
         try:
             self.run_kalender()
@@ -68,50 +173,590 @@ class Orchestrator:
         vorgangstypen: list[str],
         date_from: date,
         date_to: date,
-    ) -> None:
-        """Scrape and submit Vorgänge only."""
-        total = 0
-        skipped = 0
-        submitted = 0
-        errors = 0
+        *,
+        time_budget_s: float | None = None,
+    ) -> RunStats:
+        """Scrape and submit Vorgänge only.
+
+        Vorgangstypen are processed by priority class (see ``vorgangstyp_priority``);
+        within a class, searches deferred by the previous run go first. With a time
+        budget (argument or ``scrape_time_budget_s``), no search or record is started
+        whose estimated duration no longer fits, and the unfinished searches are
+        saved to the checkpoint for the next run.
+
+        PARLIS searches run one at a time in the background, up to
+        ``search_prefetch_depth`` searches ahead of the one being processed, so
+        PARLIS is queried while the current records are built and submitted. A
+        search still running when the grace period of a stop request ends is
+        abandoned and saved to the checkpoint.
+
+        The records of each search are looked up in the cache at once and processed
+        in a cache batch that is committed when the search is done and at least every
+        ``cache_commit_interval_s``, so a crash loses at most that much progress.
+
+        With a revalidation store, the search of a Vorgangstyp starts early enough to
+        find again the processed Vorgänge of that type whose recheck is due.
+        """
+        stats = RunStats()
+        budget = TimeBudget(time_budget_s if time_budget_s is not None else self._config.scrape_time_budget_s)
+        pending, kept = self._plan_searches(vorgangstypen, date_from, date_to)
+        # Deliver what earlier runs built but could not submit before submitting anything new
+        self._ltzf_api.replay_pending()
+        lookahead = max(0, self._config.search_prefetch_depth) + 1
+
+        # A single thread keeps the PARLIS session and rate limiter used by one caller at a time
+        searches: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="parlis-search") as executor:
+            while pending:
+                if self._stop.is_set():
+                    logger.warning("Stop requested, deferring %d searches to the next run", len(pending))
+                    break
+                if not searches:
+                    if not budget.allows(self._search_cost.estimate_s):
+                        logger.warning("Time budget exhausted, deferring %d searches to the next run", len(pending))
+                        break
+                    searches.append(executor.submit(self._timed_search, pending[0]))
+                # Prefetched searches are only started while they would still fit into the budget
+                while len(searches) < min(lookahead, len(pending)) and budget.allows(self._search_cost.estimate_s):
+                    searches.append(executor.submit(self._timed_search, pending[len(searches)]))
+                try:
+                    raw_vorgaenge = searches[0].result()
+                except DeadlineExceeded:
+                    logger.warning(
+                        "Stop requested while searching, deferring %d searches to the next run", len(pending)
+                    )
+                    break
+                with self._cache.batch():
+                    completed = self._run_search(pending[0], raw_vorgaenge, stats, budget)
+                if not completed:
+                    break
+                self._clear_unseen_due(pending[0], raw_vorgaenge)
+                searches.popleft()
+                pending.pop(0)
+            for future in searches:
+                future.cancel()
+
+        stats.deferred = len(pending)
+        self._emit_coalesced(stats, flush=True)
+        self._cache.flush()
+        self._ltzf_api.flush()
+        if self._checkpoint is not None:
+            self._checkpoint.save(pending + kept)
 
+        logger.info("Vorgänge pipeline complete: %s", stats.summary())
+        self._log_transport_counters()
+        return stats
+
+    def _log_transport_counters(self) -> None:
+        counters = self._ltzf_api.counters()
+        if counters:
+            logger.info("LTZF transport: %s", ", ".join(f"{name}={value}" for name, value in counters.items()))
+        if self._submit_limiter is not None:
+            logger.info(
+                "LTZF submission concurrency: limit=%d of %d, %.2f submissions/s",
+                self._submit_limiter.limit,
+                self._config.ltzf_submit_concurrency,
+                self._submit_limiter.throughput(),
+            )
+
+    def _plan_searches(
+        self, vorgangstypen: list[str], date_from: date, date_to: date
+    ) -> tuple[list[PendingSearch], list[PendingSearch]]:
+        """Order the requested searches and merge in those deferred by the previous run.
+
+        Returns:
+            The searches to run in order, and deferred searches for Vorgangstypen that
+            were not requested this time (kept in the checkpoint untouched).
+        """
+        deferred = {p.vorgangstyp: p for p in self._checkpoint.load()} if self._checkpoint is not None else {}
+        due_since = self._due_since()
+
+        searches = []
         for vorgangstyp in vorgangstypen:
-            raw_vorgaenge = self._vorgang_source.search(vorgangstyp, date_from, date_to)
-            logger.info("Found %d Vorgänge for type '%s'", len(raw_vorgaenge), vorgangstyp)
+            start = min(date_from, due_since.get(vorgangstyp, date_from))
+            previous = deferred.pop(vorgangstyp, None)
+            if previous is None:
+                searches.append((vorgangstyp, False, PendingSearch(vorgangstyp, start, date_to)))
+            else:
+                # Widen the range so the records the previous run never reached are still covered
+                merged = PendingSearch(vorgangstyp, min(start, previous.date_from), max(date_to, previous.date_to))
+                searches.append((vorgangstyp, True, merged))
+
+        searches.sort(key=lambda item: (vorgangstyp_priority(item[0]), not item[1]))
+        return [search for _, _, search in searches], list(deferred.values())
+
+    def _due_since(self) -> dict[str, date]:
+        """Earliest search start per Vorgangstyp that covers its Vorgänge due for a recheck."""
+        if self._revalidation is None:
+            return {}
+        due_since = self._revalidation.due_since(time.time())
+        for vorgangstyp, since in sorted(due_since.items()):
+            logger.info("Revalidating due %s Vorgänge: searching from %s", vorgangstyp, since)
+        return due_since
+
+    def _verified(self, raw_vorgaenge: list[RawVorgang]) -> None:
+        """Record that the Vorgänge are up to date in the cache and when their policy wants them checked again.
+
+        Called only for records skipped as unchanged or marked processed; a record whose
+        rebuild failed keeps its earlier due time, so it is searched for again.
+        """
+        if self._revalidation is not None and raw_vorgaenge:
+            now = time.time()
+            self._revalidation.record(self._revalidation_policy.verify(raw, now) for raw in raw_vorgaenge)
+
+    def _clear_unseen_due(self, search: PendingSearch, raw_vorgaenge: list[RawVorgang]) -> None:
+        """Stop rechecking the due Vorgänge a completed search no longer found."""
+        if self._revalidation is None:
+            return
+        seen = {raw.get("vorgangs_id", "unknown") for raw in raw_vorgaenge}
+        cleared = self._revalidation.clear_due(
+            search.vorgangstyp, search.date_from, search.date_to, time.time(), seen=seen
+        )
+        if cleared:
+            logger.info("%d due %s Vorgänge not found in PARLIS, no longer rechecked", cleared, search.vorgangstyp)
+
+    def _timed_search(self, search: PendingSearch) -> list[RawVorgang]:
+        """Run one search and record its duration for the budget estimate.
+
+        Raises:
+            DeadlineExceeded: If a stop was requested before or during the search.
+        """
+        if self._stop.is_set():
+            # A prefetched search that starts after a stop request would be deferred unused, so skip querying PARLIS
+            raise DeadlineExceeded(f"Search for '{search.vorgangstyp}' skipped after a stop request")
+        started = time.monotonic()
+        raw_vorgaenge = self._search(search.vorgangstyp, search.date_from, search.date_to)
+        self._search_cost.observe(time.monotonic() - started)
+        return raw_vorgaenge
+
+    def _run_search(
+        self, search: PendingSearch, raw_vorgaenge: list[RawVorgang], stats: RunStats, budget: TimeBudget
+    ) -> bool:
+        """Process the records of one search while the budget allows.
+
+        Returns:
+            False if the budget ran out or a stop was requested before all records were processed.
+        """
+        raw_vorgaenge = self._unprocessed(raw_vorgaenge, stats)
+        self._last_commit = time.monotonic()
+        if self._submit_limiter is not None:
+            return self._run_search_concurrently(search, raw_vorgaenge, stats, budget)
 
+        for raw in raw_vorgaenge:
+            if self._stop.is_set():
+                logger.warning("Stop requested while processing '%s', deferring the rest", search.vorgangstyp)
+                return False
+            if not budget.allows(self._record_cost.estimate_s):
+                logger.warning("Time budget exhausted while processing '%s', deferring the rest", search.vorgangstyp)
+                return False
+            started = time.monotonic()
+            skipped_before = stats.skipped
+            self._process_raw(raw, stats, prefiltered=True)
+            if stats.skipped == skipped_before:
+                self._record_cost.observe(time.monotonic() - started)
+            self._commit_if_due()
+        return True
+
+    def _unprocessed(self, raw_vorgaenge: list[RawVorgang], stats: RunStats) -> list[RawVorgang]:
+        """Drop the records cached or held for coalescing with unchanged Fundstellen.
+
+        The cache is consulted for all records in one call. The records dropped as cached
+        count as verified for the revalidation policy; the others only once they have been
+        processed successfully.
+        """
+        ids = [raw.get("vorgangs_id", "unknown") for raw in raw_vorgaenge]
+        fingerprints = {
+            vorgang_id: _source_fingerprint(raw) for raw, vorgang_id in zip(raw_vorgaenge, ids, strict=True)
+        }
+        unprocessed = set(self._cache.filter_unprocessed(ids, source_fingerprints=fingerprints))
+        self._verified(
+            [raw for raw, vorgang_id in zip(raw_vorgaenge, ids, strict=True) if vorgang_id not in unprocessed]
+        )
+        remaining = [
+            raw
+            for raw, vorgang_id in zip(raw_vorgaenge, ids, strict=True)
+            if vorgang_id in unprocessed and not self._held(vorgang_id, fingerprints[vorgang_id])
+        ]
+        skipped = len(raw_vorgaenge) - len(remaining)
+        stats.total += skipped
+        stats.skipped += skipped
+        if skipped:
+            logger.debug("Skipping %d already-processed Vorgänge", skipped)
+        return remaining
+
+    def _held(self, vorgang_id: str, source_fingerprint: str) -> bool:
+        """Whether the Vorgang waits in the coalescing buffer, built from the same Fundstellen."""
+        return self._held_sources.get(vorgang_id) == source_fingerprint
+
+    def _commit_if_due(self) -> None:
+        """Commit the cache batch once ``cache_commit_interval_s`` has passed since the last commit."""
+        now = time.monotonic()
+        if now - self._last_commit >= self._config.cache_commit_interval_s:
+            self._cache.flush()
+            self._last_commit = now
+
+    def _run_search_concurrently(
+        self, search: PendingSearch, raw_vorgaenge: list[RawVorgang], stats: RunStats, budget: TimeBudget
+    ) -> bool:
+        """Like :meth:`_run_search`, but with up to ``ltzf_submit_concurrency`` records in progress.
+
+        How many of their LTZF submissions are actually in flight is decided by the
+        AIMD limiter in :meth:`_build_and_submit`.
+        """
+        workers = self._config.ltzf_submit_concurrency
+        in_progress: set[Future] = set()
+        completed = True
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ltzf-submit") as executor:
             for raw in raw_vorgaenge:
-                total += 1
-                vorgang_id = raw.get("vorgangs_id", "unknown")
+                if self._stop.is_set():
+                    logger.warning("Stop requested while processing '%s', deferring the rest", search.vorgangstyp)
+                    completed = False
+                    break
+                if not budget.allows(self._record_cost.estimate_s):
+                    logger.warning(
+                        "Time budget exhausted while processing '%s', deferring the rest", search.vorgangstyp
+                    )
+                    completed = False
+                    break
+                if len(in_progress) >= workers:
+                    done, in_progress = wait(in_progress, return_when=FIRST_COMPLETED)
+                    self._collect_records(done, stats)
+                    self._commit_if_due()
+                in_progress.add(executor.submit(self._timed_process_raw, raw))
+            self._collect_records(wait(in_progress).done, stats)
+        return completed
 
-                if self._cache.is_processed(vorgang_id):
-                    skipped += 1
-                    logger.debug("Skipping already-processed Vorgang %s", vorgang_id)
-                    continue
+    def _timed_process_raw(self, raw: RawVorgang) -> tuple[RunStats, float]:
+        record_stats = RunStats()
+        started = time.monotonic()
+        self._process_raw(raw, record_stats, prefiltered=True)
+        return record_stats, time.monotonic() - started
 
-                try:
-                    vorgang = self._build_vorgang(raw)
-                    success = self._ltzf_api.submit_vorgang(vorgang)
-                    if success:
-                        self._cache.mark_processed(vorgang_id)
-                        submitted += 1
-                    else:
-                        errors += 1
-                        logger.warning("Failed to submit Vorgang %s", vorgang_id)
-                except Exception:  # intentional: single Vorgang failure must not stop the pipeline
-                    errors += 1
-                    logger.error("Error processing Vorgang %s", vorgang_id, exc_info=True)
-
-        logger.info(
-            "Vorgänge pipeline complete: total=%d, submitted=%d, skipped=%d, errors=%d",
-            total,
-            submitted,
-            skipped,
-            errors,
+    def _collect_records(self, done: set[Future], stats: RunStats) -> None:
+        for future in done:
+            record_stats, duration_s = future.result()
+            stats.merge(record_stats)
+            if not record_stats.skipped:
+                # Records overlap, so each one costs the budget only a share of its duration
+                self._record_cost.observe(duration_s / self._submit_limiter.limit)
+
+    def plan_work(self, queue: WorkQueue, vorgangstypen: list[str], date_from: date, date_to: date) -> int:
+        """Enqueue one search unit per Vorgangstyp and monthly window.
+
+        Returns:
+            The number of units enqueued.
+        """
+        count = 0
+        due_since = self._due_since()
+        for vorgangstyp in vorgangstypen:
+            start = min(date_from, due_since.get(vorgangstyp, date_from))
+            for window_from, window_to in monthly_windows(start, date_to):
+                queue.enqueue(
+                    WORK_KIND_SEARCH,
+                    {
+                        "vorgangstyp": vorgangstyp,
+                        "date_from": window_from.isoformat(),
+                        "date_to": window_to.isoformat(),
+                    },
+                    dedupe_key=f"{WORK_KIND_SEARCH}:{vorgangstyp}:{window_from}:{window_to}",
+                )
+                count += 1
+        logger.info("Planned %d search units for %d Vorgangstypen", count, len(vorgangstypen))
+        return count
+
+    def run_worker(self, queue: WorkQueue, worker_id: str, *, exit_when_empty: bool = False) -> RunStats:
+        """Lease and process work units until the queue is drained.
+
+        Search units fan out into one build unit per unprocessed Vorgang, so the
+        expensive extraction and submission work spreads across all workers.
+
+        Args:
+            queue: The shared work queue.
+            worker_id: Identifier of this worker (used as lease owner).
+            exit_when_empty: Return once no units are pending or leased instead of polling forever.
+                A stop request always ends the loop after the current unit.
+
+        Coalescing is off for workers: a build unit is acked once it has been handled,
+        so a Vorgang held only in memory would be lost if the worker died. Repeated
+        builds of a Vorgang are merged by the queue's dedupe keys instead.
+        """
+        stats = RunStats()
+        if self._coalescer is not None:
+            logger.info("LTZF_COALESCE_WINDOW_S does not apply to workers, submitting every build at once")
+            self._coalescer = None
+        logger.info("Worker %s started", worker_id)
+
+        while not self._stop.is_set():
+            unit = queue.lease(worker_id, self._config.work_queue_lease_s)
+            if unit is None:
+                if exit_when_empty and queue.outstanding() == 0:
+                    break
+                self._stop.wait(self._config.work_queue_poll_interval_s)
+                continue
+
+            try:
+                success = self._process_unit(queue, unit, stats)
+            except DeadlineExceeded as e:
+                logger.warning("Abandoned work unit %d (%s): %s; it will be retried", unit.unit_id, unit.kind, e)
+                queue.release(unit.unit_id, worker_id, repr(e))
+                continue
+            except Exception as e:  # intentional: a failing unit must not stop the worker
+                logger.error("Error processing work unit %d (%s)", unit.unit_id, unit.kind, exc_info=True)
+                queue.release(unit.unit_id, worker_id, repr(e))
+                continue
+
+            if success:
+                queue.ack(unit.unit_id, worker_id)
+            else:
+                queue.release(unit.unit_id, worker_id, "processing failed")
+
+        self._cache.flush()
+        self._ltzf_api.flush()
+        logger.info("Worker %s finished: %s", worker_id, stats.summary())
+        self._log_transport_counters()
+        return stats
+
+    def _process_unit(self, queue: WorkQueue, unit: WorkUnit, stats: RunStats) -> bool:
+        """Process a single leased work unit."""
+        if unit.kind == WORK_KIND_SEARCH:
+            payload = unit.payload
+            search = PendingSearch(
+                payload["vorgangstyp"],
+                date.fromisoformat(payload["date_from"]),
+                date.fromisoformat(payload["date_to"]),
+            )
+            raw_vorgaenge = self._search(search.vorgangstyp, search.date_from, search.date_to)
+            for raw in self._unprocessed(raw_vorgaenge, stats):
+                vorgang_id = raw.get("vorgangs_id")
+                dedupe_key = f"{WORK_KIND_BUILD}:{vorgang_id}" if vorgang_id else None
+                queue.enqueue(WORK_KIND_BUILD, dict(raw), dedupe_key=dedupe_key)
+            self._clear_unseen_due(search, raw_vorgaenge)
+            return True
+        if unit.kind == WORK_KIND_BUILD:
+            return self._process_raw(unit.payload, stats)  # type: ignore[arg-type]  # JSON round-trip of RawVorgang
+        logger.error("Unknown work unit kind '%s' (unit %d)", unit.kind, unit.unit_id)
+        return False
+
+    def _search(self, vorgangstyp: str, date_from: date, date_to: date) -> list[RawVorgang]:
+        """Search PARLIS, giving up once the grace period of a stop request has passed.
+
+        Raises:
+            DeadlineExceeded: If a stop request cut the search off.
+        """
+        raw_vorgaenge = run_with_deadline(
+            lambda: self._vorgang_source.search(vorgangstyp, date_from, date_to),
+            None,
+            f"Search for '{vorgangstyp}'",
+            cutoff=lambda: self._drain_until,
         )
+        logger.info("Found %d Vorgänge for type '%s'", len(raw_vorgaenge), vorgangstyp)
+        return raw_vorgaenge
+
+    def _process_raw(self, raw: RawVorgang, stats: RunStats, *, prefiltered: bool = False) -> bool:
+        """Build and submit a single raw Vorgang unless it is cached or held with unchanged Fundstellen.
+
+        Building and submitting run under ``vorgang_deadline_s``. A Vorgang that
+        overruns it is abandoned, counted as a timeout and left out of the cache,
+        so the next run (or another worker) retries it. With coalescing enabled the
+        built Vorgang is handed to the coalescing buffer instead of being submitted,
+        and it is marked processed once the buffer has submitted it. The cache entry
+        records a fingerprint of the Fundstellen, so the Vorgang is built again once
+        PARLIS lists a new one.
+
+        Args:
+            raw: The record from the search.
+            stats: Counters to update.
+            prefiltered: The caller has already checked the record against the cache.
+
+        Returns:
+            False if the Vorgang could not be built or submitted in time, True otherwise.
+        """
+        stats.total += 1
+        vorgang_id = raw.get("vorgangs_id", "unknown")
+        source_fingerprint = _source_fingerprint(raw)
 
-    def run_kalender(self) -> None:
-        """Scrape and submit calendar/session data only."""
-        raise NotImplementedError("Calendar pipeline not yet implemented.")
+        if not prefiltered:
+            if self._held(vorgang_id, source_fingerprint):
+                stats.skipped += 1
+                logger.debug("Skipping Vorgang %s, already held for coalescing", vorgang_id)
+                return True
+            if not self._cache.filter_unprocessed([vorgang_id], source_fingerprints={vorgang_id: source_fingerprint}):
+                stats.skipped += 1
+                logger.debug("Skipping already-processed Vorgang %s", vorgang_id)
+                self._verified([raw])
+                return True
+
+        try:
+            outcome = run_with_deadline(
+                lambda: self._build_and_submit(raw),
+                self._config.vorgang_deadline_s,
+                f"Vorgang {vorgang_id}",
+                cutoff=lambda: self._drain_until,
+            )
+            if outcome is _Outcome.BUFFERED or outcome is _Outcome.COALESCED:
+                self._held_sources[vorgang_id] = source_fingerprint
+                if self._revalidation is not None:
+                    self._held_verifications[vorgang_id] = self._revalidation_policy.verify(raw, time.time())
+                if outcome is _Outcome.COALESCED:
+                    stats.coalesced += 1
+                    logger.debug("Vorgang %s merged into its pending submission", vorgang_id)
+                self._emit_coalesced(stats)
+                return True
+            if outcome is not _Outcome.FAILED:
+                self._cache.mark_processed(vorgang_id, source_fingerprint=source_fingerprint)
+                self._verified([raw])
+                if outcome is _Outcome.UNCHANGED:
+                    stats.unchanged += 1
+                    logger.debug("Vorgang %s unchanged since its last submission, not resubmitted", vorgang_id)
+                else:
+                    stats.submitted += 1
+                return True
+            stats.errors += 1
+            logger.warning("Failed to submit Vorgang %s", vorgang_id)
+        except DeadlineExceeded as e:
+            stats.timeouts += 1
+            logger.warning("Abandoned Vorgang %s: %s; it will be retried", vorgang_id, e)
+        except Exception:  # intentional: single Vorgang failure must not stop the pipeline
+            stats.errors += 1
+            logger.error("Error processing Vorgang %s", vorgang_id, exc_info=True)
+        return False
+
+    def _build_and_submit(self, raw: RawVorgang) -> _Outcome:
+        """Build the Vorgang and submit it unless its payload matches the last submission."""
+        vorgang = self._build_vorgang(raw)
+        if self._coalescer is not None:
+            merged = self._coalescer.add(vorgang, raw.get("vorgangs_id", "unknown"))
+            return _Outcome.COALESCED if merged else _Outcome.BUFFERED
+        return self._submit_unless_unchanged(vorgang)
+
+    def _submit_unless_unchanged(self, vorgang: Vorgang) -> _Outcome:
+        fingerprint = None
+        if self._fingerprints is not None:
+            fingerprint = vorgang_fingerprint(vorgang, stream_min_bytes=self._config.ltzf_stream_min_bytes)
+            if self._fingerprints.get(str(vorgang.api_id)) == fingerprint:
+                return _Outcome.UNCHANGED
+
+        if self._submit_limiter is None:
+            success = self._submit(vorgang)
+        else:
+            self._submit_limiter.acquire()
+            started = time.monotonic()
+            success = False
+            try:
+                success = self._submit(vorgang)
+            finally:
+                self._submit_limiter.release(time.monotonic() - started, success)
+
+        if not success:
+            return _Outcome.FAILED
+        if self._fingerprints is not None and fingerprint is not None:
+            self._fingerprints.put(str(vorgang.api_id), fingerprint)
+        return _Outcome.SUBMITTED
+
+    def _emit_coalesced(self, stats: RunStats, *, flush: bool = False) -> None:
+        """Submit the Vorgänge whose coalescing window has passed, or all of them with ``flush``.
+
+        Every PARLIS id merged into a submitted Vorgang is marked processed and recorded
+        as verified; after a failed submission none is, so the next run builds them again.
+        """
+        if self._coalescer is None:
+            return
+        for vorgang, vorgang_ids in self._coalescer.pop_all() if flush else self._coalescer.pop_due():
+            sources = {i: fingerprint for i in vorgang_ids if (fingerprint := self._held_sources.pop(i, None))}
+            verifications = [v for i in vorgang_ids if (v := self._held_verifications.pop(i, None))]
+            try:
+                outcome = self._submit_unless_unchanged(vorgang)
+            except DeadlineExceeded as e:
+                stats.timeouts += 1
+                logger.warning("Abandoned Vorgang %s: %s; it will be retried", vorgang.api_id, e)
+                continue
+            except Exception:  # intentional: single Vorgang failure must not stop the pipeline
+                stats.errors += 1
+                logger.error("Error submitting Vorgang %s", vorgang.api_id, exc_info=True)
+                continue
+            if outcome is _Outcome.FAILED:
+                stats.errors += 1
+                logger.warning("Failed to submit Vorgang %s (from %s)", vorgang.api_id, ", ".join(vorgang_ids))
+                continue
+            self._cache.mark_processed_many(vorgang_ids, source_fingerprints=sources)
+            if self._revalidation is not None and verifications:
+                self._revalidation.record(verifications)
+            if outcome is _Outcome.UNCHANGED:
+                stats.unchanged += 1
+            else:
+                stats.submitted += 1
+
+    def _submit(self, vorgang: Vorgang) -> bool:
+        return run_with_deadline(
+            lambda: self._ltzf_api.submit_vorgang(vorgang), self._config.submission_deadline_s, "LTZF submission"
+        )
+
+    def run_kalender(self) -> RunStats:
+        """Scrape and submit calendar/session data only.
+
+        Sitzungen are grouped by the date of their ``termin`` and submitted with one
+        request per date. Dates more than ``KALENDER_MAX_DAYS_AHEAD`` days after today
+        are outside the collector scope and counted as skipped. With a fingerprint
+        store, a date whose Sitzungen are unchanged since its last successful
+        submission is not sent again.
+        """
+        stats = RunStats()
+        days = _group_by_datum(self._calendar_source.fetch_sessions())
+        self._ltzf_api.replay_pending()
+        latest = date.today() + timedelta(days=KALENDER_MAX_DAYS_AHEAD)
+
+        for i, (datum, sitzungen) in enumerate(days):
+            if self._stop.is_set():
+                stats.deferred = len(days) - i
+                logger.warning("Stop requested, leaving %d calendar dates for the next run", stats.deferred)
+                break
+            stats.total += 1
+            if datum > latest:
+                stats.skipped += 1
+                continue
+            try:
+                outcome = self._submit_day(datum, sitzungen)
+            except DeadlineExceeded:
+                logger.error("Submitting Sitzungen for %s timed out", datum)
+                stats.timeouts += 1
+                continue
+            except Exception:  # intentional: one failing date must not stop the calendar pipeline
+                logger.exception("Error submitting Sitzungen for %s", datum)
+                stats.errors += 1
+                continue
+            if outcome is _Outcome.SUBMITTED:
+                stats.submitted += 1
+            elif outcome is _Outcome.UNCHANGED:
+                stats.unchanged += 1
+            else:
+                stats.errors += 1
+
+        if stats.skipped:
+            logger.info("Skipped %d calendar dates after %s (outside the collector scope)", stats.skipped, latest)
+        self._ltzf_api.flush()
+        logger.info("Calendar pipeline complete: %s", stats.summary())
+        return stats
+
+    def _submit_day(self, datum: date, sitzungen: list[Sitzung]) -> _Outcome:
+        """Submit the Sitzungen of one date unless they match the last successful submission."""
+        key = f"kalender:{datum.isoformat()}"
+        fingerprint = None
+        if self._fingerprints is not None:
+            fingerprint = sitzungen_fingerprint(sitzungen)
+            if self._fingerprints.get(key) == fingerprint:
+                logger.debug("Sitzungen for %s unchanged since last submission, skipping", datum)
+                return _Outcome.UNCHANGED
+
+        success = run_with_deadline(
+            lambda: self._ltzf_api.submit_sitzungen(datum, sitzungen),
+            self._config.submission_deadline_s,
+            "LTZF calendar submission",
+        )
+        if not success:
+            return _Outcome.FAILED
+        if fingerprint is not None:
+            self._fingerprints.put(key, fingerprint)
+        return _Outcome.SUBMITTED
 
     def _build_vorgang(self, raw: RawVorgang) -> Vorgang:
         """Convert a raw PARLIS dict into a domain Vorgang model."""
@@ -170,11 +815,17 @@ class Orchestrator:
             volltext = ""
             doc_hash = ""
             try:
-                result = self._document_extractor.extract_text(pdf_url)
+                result = run_with_deadline(
+                    lambda: self._document_extractor.extract_text(pdf_url),
+                    self._config.extraction_deadline_s,
+                    "PDF extraction",
+                )
                 volltext = result.text
                 doc_hash = result.hash
             except NotImplementedError:
                 logger.debug("Document extractor not implemented, skipping PDF text extraction")
+            except DeadlineExceeded:
+                raise  # a hung extraction abandons the whole Vorgang rather than submitting it without text
             except Exception:
                 logger.warning("Failed to extract text from %s", pdf_url, exc_info=True)
 
@@ -198,3 +849,23 @@ class Orchestrator:
             zp_start=zp_start,
             gremium=gremium,
         )
+
+
+def _source_fingerprint(raw: RawVorgang) -> str:
+    """Short hash of a record's Fundstellen, independent of their order.
+
+    PARLIS lists a Fundstelle for every step of a Vorgang (Beratung, Beschlussempfehlung,
+    Gesetzblatt, ...), so the hash changes when the Vorgang gains a Station.
+    """
+    fundstellen = {json.dumps(fund, sort_keys=True, ensure_ascii=False) for fund in raw.get("fundstellen_parsed", [])}
+    return hashlib.sha256("\n".join(sorted(fundstellen)).encode()).hexdigest()[:16]
+
+
+def _group_by_datum(sitzungen: list[Sitzung]) -> list[tuple[date, list[Sitzung]]]:
+    """Group Sitzungen by date, in date order and with a stable order within each date."""
+    days: dict[date, list[Sitzung]] = {}
+    for sitzung in sitzungen:
+        days.setdefault(sitzung.termin.date(), []).append(sitzung)
+    return [
+        (datum, sorted(day, key=lambda s: (s.termin, s.gremium.name, s.nummer))) for datum, day in sorted(days.items())
+    ]
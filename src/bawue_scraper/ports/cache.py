@@ -1,10 +1,22 @@
 """Port: cache for tracking processed items."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 
 
 class Cache(ABC):
-    """Tracks already-processed items to avoid redundant work."""
+    """Tracks already-processed items to avoid redundant work.
+
+    Changes are durable once the call returns, except inside :meth:`batch`: there
+    they become durable at the next commit point (the end of the batch or a call to
+    :meth:`flush`). A crash loses at most the changes since the last commit point,
+    and those Vorgänge are processed again on the next run.
+
+    A Vorgang can be marked with a fingerprint of the source data it was built from
+    (for PARLIS, its Fundstellen). Implementations that store it report the Vorgang
+    as unprocessed again once the source changes, see :meth:`filter_unprocessed`.
+    """
 
     @abstractmethod
     def is_processed(self, vorgang_id: str) -> bool:
@@ -17,13 +29,50 @@ class Cache(ABC):
             True if already processed, False otherwise.
         """
 
+    def filter_unprocessed(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> list[str]:
+        """Select the Vorgänge that have not been processed yet or whose source has changed.
+
+        Implementations backed by a database should override this to look all IDs up at once.
+        Implementations that store source fingerprints count a processed Vorgang as
+        unprocessed when its stored fingerprint differs from the given one. A processed
+        Vorgang without a stored fingerprint (e.g. marked by ``bootstrap``) takes the given
+        one and stays processed. The default stores none and ignores ``source_fingerprints``.
+
+        Args:
+            vorgang_ids: The identifiers of the Vorgänge.
+            source_fingerprints: Current source fingerprints by identifier.
+
+        Returns:
+            The unprocessed identifiers, in their original order.
+        """
+        return [vorgang_id for vorgang_id in vorgang_ids if not self.is_processed(vorgang_id)]
+
     @abstractmethod
-    def mark_processed(self, vorgang_id: str) -> None:
+    def mark_processed(self, vorgang_id: str, *, source_fingerprint: str | None = None) -> None:
         """Mark a Vorgang as processed.
 
         Args:
             vorgang_id: The identifier of the Vorgang.
+            source_fingerprint: Fingerprint of the source data the Vorgang was built from;
+                None keeps a stored one.
+        """
+
+    def mark_processed_many(
+        self, vorgang_ids: Iterable[str], *, source_fingerprints: Mapping[str, str] | None = None
+    ) -> None:
+        """Mark several Vorgänge as processed at once.
+
+        Implementations that persist on every change should override this to write once.
+
+        Args:
+            vorgang_ids: The identifiers of the Vorgänge.
+            source_fingerprints: Source fingerprints by identifier, for the Vorgänge that have one.
         """
+        fingerprints = source_fingerprints or {}
+        for vorgang_id in vorgang_ids:
+            self.mark_processed(vorgang_id, source_fingerprint=fingerprints.get(vorgang_id))
 
     @abstractmethod
     def invalidate(self, vorgang_id: str) -> None:
@@ -32,3 +81,23 @@ class Cache(ABC):
         Args:
             vorgang_id: The identifier of the Vorgang.
         """
+
+    def flush(self) -> None:  # noqa: B027  # optional hook, write-through caches need not override it
+        """Persist any buffered changes.
+
+        Called at the end of a run and before a graceful shutdown; inside a batch it is a commit point.
+        """
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes and make them durable together when the block exits.
+
+        Implementations may buffer changes made inside the block instead of persisting
+        each one; reads inside the block see them. The batch is committed however the
+        block exits, as each mark records work that has already been done. Batches may
+        be nested; only the outermost one commits. The default commits via :meth:`flush`.
+        """
+        try:
+            yield
+        finally:
+            self.flush()
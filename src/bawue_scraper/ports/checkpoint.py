@@ -0,0 +1,34 @@
+"""Port: checkpoint of work deferred to the next run."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class PendingSearch:
+    """A Vorgangstyp search (with its date range) that a run could not finish."""
+
+    vorgangstyp: str
+    date_from: date
+    date_to: date
+
+
+class Checkpoint(ABC):
+    """Persists the searches a run left unfinished so the next run starts with them."""
+
+    @abstractmethod
+    def load(self) -> list[PendingSearch]:
+        """Load the searches deferred by the previous run.
+
+        Returns:
+            The pending searches, or an empty list if there are none.
+        """
+
+    @abstractmethod
+    def save(self, pending: list[PendingSearch]) -> None:
+        """Replace the stored pending searches.
+
+        Args:
+            pending: The searches to defer; an empty list clears the checkpoint.
+        """
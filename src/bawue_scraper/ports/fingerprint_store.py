@@ -0,0 +1,27 @@
+"""Port: fingerprints of the payloads last submitted to LTZF."""
+
+from abc import ABC, abstractmethod
+
+
+class FingerprintStore(ABC):
+    """Remembers the content hash of the last successful submission per object."""
+
+    @abstractmethod
+    def get(self, api_id: str) -> str | None:
+        """Look up the fingerprint of the last successful submission.
+
+        Args:
+            api_id: The LTZF api_id of the object (``kalender:<datum>`` for a calendar day).
+
+        Returns:
+            The stored fingerprint, or None if the object was never submitted.
+        """
+
+    @abstractmethod
+    def put(self, api_id: str, fingerprint: str) -> None:
+        """Record the fingerprint of a successful submission.
+
+        Args:
+            api_id: The LTZF api_id of the object (``kalender:<datum>`` for a calendar day).
+            fingerprint: The content hash of the submitted payload.
+        """
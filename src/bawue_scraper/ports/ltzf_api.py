@@ -5,6 +5,9 @@ from datetime import date
 
 from bawue_scraper.domain.models import Sitzung, Vorgang
 
+# The collector scope may write the calendar only up to this many days after today
+KALENDER_MAX_DAYS_AHEAD = 1
+
 
 class LtzfApi(ABC):
     """Submits scraped data to the LTZF backend."""
@@ -17,17 +20,42 @@ class LtzfApi(ABC):
             vorgang: The Vorgang to submit.
 
         Returns:
-            True if submission succeeded, False otherwise.
+            True if submission succeeded (or the payload was queued in a durable outbox for
+            later delivery), False otherwise.
         """
 
     @abstractmethod
     def submit_sitzungen(self, datum: date, sitzungen: list[Sitzung]) -> bool:
         """Submit Sitzungen for a date via PUT /api/v2/kalender/{parlament}/{datum}.
 
+        The request replaces all Sitzungen the backend holds for ``datum``.
+
         Args:
-            datum: The date for the sessions.
-            sitzungen: The sessions to submit.
+            datum: The date for the sessions; at most ``KALENDER_MAX_DAYS_AHEAD`` days after today.
+            sitzungen: All sessions on that date.
+
+        Returns:
+            True if submission succeeded (or was queued in a durable outbox), False otherwise.
+        """
+
+    def counters(self) -> dict[str, float]:
+        """Transport statistics (requests, retries, circuit breaker) for the run summary.
+
+        Returns:
+            Counter name to value; empty for implementations without a transport.
+        """
+        return {}
+
+    def flush(self) -> None:  # noqa: B027  # optional hook, only buffering implementations override it
+        """Finish buffered output, such as an open export file.
+
+        Called at the end of a run and before a graceful shutdown.
+        """
+
+    def replay_pending(self) -> int:
+        """Resubmit payloads queued while the backend was unreachable.
 
         Returns:
-            True if submission succeeded, False otherwise.
+            The number of payloads delivered; 0 for implementations without an outbox.
         """
+        return 0
@@ -0,0 +1,64 @@
+"""Port: durable store of LTZF submissions that could not be delivered yet."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass
+class OutboxEntry:
+    """A serialised request waiting for delivery."""
+
+    key: str
+    url: str
+    body: bytes
+    attempts: int
+
+
+class Outbox(ABC):
+    """Keeps built payloads across runs so an LTZF outage does not require rebuilding them."""
+
+    @abstractmethod
+    def put(self, key: str, url: str, body: bytes) -> None:
+        """Store a payload; an existing entry with the same key is replaced.
+
+        Args:
+            key: Identifies the submitted object (e.g. ``vorgang:<api_id>``).
+            url: The URL to PUT the body to.
+            body: The serialised request body.
+        """
+
+    @abstractmethod
+    def due(self, limit: int) -> list[OutboxEntry]:
+        """Return the oldest entries whose next delivery attempt is due.
+
+        Args:
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Up to ``limit`` entries, oldest first.
+        """
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        """Delete an entry after delivery (no-op if it does not exist).
+
+        Args:
+            key: The entry key.
+        """
+
+    @abstractmethod
+    def defer(self, key: str, error: str) -> None:
+        """Record a failed delivery attempt and schedule the next one with backoff.
+
+        Args:
+            key: The entry key.
+            error: A short description of the failure.
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Count the stored entries.
+
+        Returns:
+            The number of undelivered entries.
+        """
@@ -0,0 +1,11 @@
+"""Port: rate limiting for requests against an external source."""
+
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """Spaces out requests so that an external source is not overloaded."""
+
+    @abstractmethod
+    def acquire(self) -> None:
+        """Block until the next request may be sent."""
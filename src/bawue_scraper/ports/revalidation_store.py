@@ -0,0 +1,59 @@
+"""Port: when processed Vorgänge were last verified and when they are due again."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class Verification:
+    """A Vorgang seen in PARLIS, with the time its revalidation policy says to look again."""
+
+    vorgang_id: str
+    vorgangstyp: str
+    # Date of its earliest Fundstelle: a search from this date finds the Vorgang again
+    since: date
+    # Unix time of the next check, or None if the Vorgang is not rechecked
+    due_at: float | None
+
+
+class RevalidationStore(ABC):
+    """Tracks when each processed Vorgang was last verified and when to check it again."""
+
+    @abstractmethod
+    def record(self, verifications: Iterable[Verification]) -> None:
+        """Store verifications, with the current time as their last verified time.
+
+        Args:
+            verifications: The Vorgänge just seen; each replaces the earlier entry for its ID.
+        """
+
+    @abstractmethod
+    def due_since(self, now: float) -> dict[str, date]:
+        """Find the search ranges needed to revisit the Vorgänge that are due.
+
+        Args:
+            now: The current Unix time.
+
+        Returns:
+            Per Vorgangstyp with due Vorgänge, the earliest ``since`` among them.
+        """
+
+    @abstractmethod
+    def clear_due(self, vorgangstyp: str, date_from: date, date_to: date, now: float, *, seen: Collection[str]) -> int:
+        """Stop rechecking the due Vorgänge that a completed search did not find.
+
+        Vorgänge the search found stay due until they are recorded, which happens only
+        once they have been skipped as unchanged or processed successfully.
+
+        Args:
+            vorgangstyp: The Vorgangstyp that was searched.
+            date_from: Start of the searched range.
+            date_to: End of the searched range.
+            now: The current Unix time.
+            seen: IDs of the Vorgänge the search found.
+
+        Returns:
+            The number of Vorgänge no longer rechecked.
+        """
@@ -0,0 +1,35 @@
+"""Port: mutual exclusion between scraper processes sharing one cache directory."""
+
+from abc import ABC, abstractmethod
+
+
+class RunLock(ABC):
+    """A lease that at most one process holds at a time."""
+
+    @abstractmethod
+    def try_acquire(self, owner: str, lease_s: float) -> bool:
+        """Take the lock if it is free, expired, or already held by ``owner``.
+
+        Args:
+            owner: Identifier of the calling process.
+            lease_s: How long the lock stays valid without a renewal.
+
+        Returns:
+            True if ``owner`` now holds the lock.
+        """
+
+    @abstractmethod
+    def renew(self, owner: str, lease_s: float) -> bool:
+        """Extend the lease held by ``owner``.
+
+        Args:
+            owner: Identifier of the calling process.
+            lease_s: New lease duration from now.
+
+        Returns:
+            False if ``owner`` no longer holds the lock (another process took it over).
+        """
+
+    @abstractmethod
+    def release(self, owner: str) -> None:
+        """Give up the lock if ``owner`` holds it."""
@@ -0,0 +1,75 @@
+"""Port: queue of work units shared between a planner and worker processes."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass
+class WorkUnit:
+    """A leased unit of work."""
+
+    unit_id: int
+    kind: str
+    payload: dict
+    attempts: int
+
+
+class WorkQueue(ABC):
+    """Distributes work units to workers with expiring leases."""
+
+    @abstractmethod
+    def enqueue(self, kind: str, payload: dict, dedupe_key: str | None = None) -> None:
+        """Add a work unit to the queue.
+
+        Args:
+            kind: The type of work (e.g. "search", "build").
+            payload: JSON-serialisable parameters for the unit.
+            dedupe_key: Optional key; a unit with the same key that is still pending or
+                leased is not enqueued twice.
+        """
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_s: float) -> WorkUnit | None:
+        """Lease the next available unit.
+
+        Units whose lease has expired (e.g. because their worker crashed) are
+        available again, unless they have used up their attempts; those fail.
+
+        Args:
+            worker_id: Identifier of the leasing worker.
+            lease_s: Lease duration in seconds.
+
+        Returns:
+            The leased WorkUnit, or None if no unit is available.
+        """
+
+    @abstractmethod
+    def ack(self, unit_id: int, worker_id: str) -> None:
+        """Mark a leased unit as done.
+
+        Ignored if the lease has expired and the unit was leased to another worker.
+
+        Args:
+            unit_id: The identifier of the unit.
+            worker_id: Identifier of the worker holding the lease.
+        """
+
+    @abstractmethod
+    def release(self, unit_id: int, worker_id: str, error: str) -> None:
+        """Return a leased unit after a failure so it can be retried.
+
+        Ignored if the lease has expired and the unit was leased to another worker.
+
+        Args:
+            unit_id: The identifier of the unit.
+            worker_id: Identifier of the worker holding the lease.
+            error: A short description of the failure.
+        """
+
+    @abstractmethod
+    def outstanding(self) -> int:
+        """Count units that are pending or currently leased.
+
+        Returns:
+            The number of units not yet done or permanently failed.
+        """
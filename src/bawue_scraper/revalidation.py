@@ -0,0 +1,73 @@
+"""Revalidation policy: when a processed Vorgang is worth looking up in PARLIS again."""
+
+from datetime import date, datetime, timedelta
+
+from bawue_scraper.config import Config
+from bawue_scraper.domain.enums import Stationstyp
+from bawue_scraper.mapping.enum_mapper import map_stationstyp
+from bawue_scraper.ports.revalidation_store import Verification
+from bawue_scraper.ports.vorgang_source import RawVorgang
+
+# Stations after which a Vorgang does not change any more
+TERMINAL_STATIONSTYPEN = frozenset({Stationstyp.POSTPARL_KRAFT, Stationstyp.PARL_ABLEHNUNG})
+
+# PARLIS Vorgangstyp whose only expected change is the answer of the Landesregierung
+KLEINE_ANFRAGE = "Kleine Anfrage"
+
+_DAY_S = 86400.0
+
+
+class RevalidationPolicy:
+    """Decides per Vorgangstyp when a processed Vorgang is checked again.
+
+    - A Vorgang with a terminal station (``postparl-kraft``, ``parl-ablehnung``) is frozen.
+    - A Kleine Anfrage without an answer is checked once, ``revalidate_answer_due_days``
+      after it was asked; once answered, or once that day has passed, it is frozen.
+    - Other open Vorgänge are checked every ``revalidate_interval_days[Vorgangstyp]``
+      days; types without an interval are not checked on a schedule.
+
+    Frozen Vorgänge are still re-opened when a search happens to list new Fundstellen
+    for them; they only stop widening the searches.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self._interval_days = config.revalidate_interval_days
+        self._answer_due_days = config.revalidate_answer_due_days
+
+    def verify(self, raw: RawVorgang, now: float) -> Verification:
+        """Describe a Vorgang just seen in PARLIS and when to look at it again.
+
+        Args:
+            raw: The record from the search.
+            now: The current Unix time.
+        """
+        fundstellen = raw.get("fundstellen_parsed", [])
+        dates = [parsed for fund in fundstellen if (parsed := _parse_datum(fund.get("datum")))]
+        since = min(dates, default=date.fromtimestamp(now))
+        vorgangstyp = raw.get("Vorgangstyp", "")
+        return Verification(raw.get("vorgangs_id", "unknown"), vorgangstyp, since, self._due_at(raw, since, now))
+
+    def _due_at(self, raw: RawVorgang, since: date, now: float) -> float | None:
+        fundstellen = raw.get("fundstellen_parsed", [])
+        initiative = raw.get("Initiative", "")
+        stationstypen = {map_stationstyp(fund.get("station_typ", ""), initiator=initiative) for fund in fundstellen}
+        if stationstypen & TERMINAL_STATIONSTYPEN:
+            return None
+
+        vorgangstyp = raw.get("Vorgangstyp", "")
+        if vorgangstyp == KLEINE_ANFRAGE:
+            answered = any("antwort" in fund.get("raw", "").lower() for fund in fundstellen)
+            if answered or self._answer_due_days <= 0:
+                return None
+            answer_due = datetime.combine(since + timedelta(days=self._answer_due_days), datetime.min.time())
+            return answer_due.timestamp() if answer_due.timestamp() > now else None
+
+        interval_days = self._interval_days.get(vorgangstyp)
+        return now + interval_days * _DAY_S if interval_days else None
+
+
+def _parse_datum(datum: str | None) -> date | None:
+    try:
+        return datetime.strptime(datum, "%d.%m.%Y").date() if datum else None
+    except ValueError:
+        return None
@@ -0,0 +1,114 @@
+"""In-process scheduler for daemon mode: runs scraping cycles at configured intervals."""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from bawue_scraper.config import Config
+from bawue_scraper.orchestrator import Orchestrator
+
+logger = logging.getLogger(__name__)
+
+# Schedule key for the calendar pipeline (never a PARLIS Vorgangstyp)
+KALENDER_KEY = "__kalender__"
+
+
+class Scheduler:
+    """Runs the orchestrator repeatedly in one long-lived process.
+
+    Adapters, HTTP sessions, connection pools and caches live as long as the
+    orchestrator, so every cycle after the first starts warm. Each Vorgangstyp
+    has its own cadence (``vorgangstyp_interval_hours``, falling back to
+    ``scrape_interval_hours``); all types that are due are processed together
+    in one cycle. Cycles run sequentially on the calling thread and therefore
+    never overlap — a cycle that overruns simply delays the next one.
+    ``time_budget_s`` limits the Vorgänge pipeline of each cycle (default:
+    ``scrape_time_budget_s``).
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        orchestrator: Orchestrator,
+        vorgangstypen: list[str],
+        *,
+        include_vorgaenge: bool = True,
+        include_kalender: bool = True,
+        time_budget_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config
+        self._orchestrator = orchestrator
+        self._time_budget_s = time_budget_s
+        self._clock = clock
+        self._stop = threading.Event()
+
+        keys = list(vorgangstypen) if include_vorgaenge else []
+        if include_kalender:
+            keys.append(KALENDER_KEY)
+        now = clock()
+        self._next_due: dict[str, float] = dict.fromkeys(keys, now)
+
+    def _interval_s(self, key: str) -> float:
+        hours = self._config.vorgangstyp_interval_hours.get(key, self._config.scrape_interval_hours)
+        return hours * 3600
+
+    def _jitter_s(self) -> float:
+        return random.uniform(0, self._config.scrape_jitter_s)
+
+    def due(self) -> list[str]:
+        """Return the schedule keys whose next run time has passed."""
+        now = self._clock()
+        return [key for key, due_at in self._next_due.items() if due_at <= now]
+
+    def seconds_until_next(self) -> float:
+        """Seconds until the earliest scheduled run (0 if something is already due)."""
+        if not self._next_due:
+            return 0.0
+        return max(0.0, min(self._next_due.values()) - self._clock())
+
+    def run_pending(self) -> None:
+        """Run one cycle covering everything that is currently due."""
+        due = self.due()
+        if not due:
+            return
+
+        started = self._clock()
+        vorgangstypen = [key for key in due if key != KALENDER_KEY]
+        logger.info("Starting scheduled cycle: %d Vorgangstypen, kalender=%s", len(vorgangstypen), KALENDER_KEY in due)
+
+        if vorgangstypen:
+            try:
+                self._orchestrator.run_vorgaenge(
+                    vorgangstypen=vorgangstypen,
+                    date_from=date.today() - timedelta(days=self._config.scrape_lookback_days),
+                    date_to=date.today(),
+                    time_budget_s=self._time_budget_s,
+                )
+            except Exception:  # intentional: a failed cycle must not end the daemon
+                logger.error("Scheduled Vorgänge cycle failed", exc_info=True)
+        if KALENDER_KEY in due:
+            try:
+                self._orchestrator.run_kalender()
+            except NotImplementedError:
+                logger.info("Calendar pipeline not yet implemented, skipping.")
+            except Exception:  # intentional: a failed cycle must not end the daemon
+                logger.error("Scheduled calendar cycle failed", exc_info=True)
+
+        for key in due:
+            self._next_due[key] = started + self._interval_s(key) + self._jitter_s()
+        logger.info("Cycle finished in %.1fs, next run in %.0fs", self._clock() - started, self.seconds_until_next())
+
+    def run_forever(self) -> None:
+        """Run cycles until :meth:`stop` is called."""
+        logger.info("Daemon mode: %d schedule entries", len(self._next_due))
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self.seconds_until_next())
+
+    def stop(self) -> None:
+        """Stop the scheduler after the current cycle."""
+        self._stop.set()
@@ -0,0 +1 @@
+"""Test doubles for local load, soak and fault-injection testing."""
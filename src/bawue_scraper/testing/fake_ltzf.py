@@ -0,0 +1,331 @@
+"""Local stand-in for the LTZF write API, with fault injection.
+
+Implements the endpoints used by ``LtzfClient``:
+
+- ``PUT /api/v2/vorgang`` — body validated as a ``Vorgang``; 201, or 409 if the
+  identical payload is already stored
+- ``PUT /api/v2/kalender/{parlament}/{datum}`` — body validated as a list of
+  ``Sitzung``; 201, or 403 for dates after the collector scope (one day after today)
+- ``GET /ping`` and ``GET /health`` — 200
+
+Request bodies may be gzip or deflate encoded. Wrong ``X-API-Key`` → 401, invalid
+payloads → 400. Every request is recorded in :attr:`FakeLtzfServer.submissions`.
+
+Faults are either random (:class:`Faults`, by rate) or scripted for the next
+requests (:meth:`FakeLtzfServer.fail_next`, :meth:`FakeLtzfServer.drop_next`).
+A dropped request is read completely and its connection closed without a response.
+
+Run standalone for soak tests against the real CLI::
+
+    python -m bawue_scraper.testing.fake_ltzf --port 8080 --error-rate 0.05 --latency-ms 50
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import random
+import socket
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from bawue_scraper.domain.models import Sitzung, Vorgang
+from bawue_scraper.ports.ltzf_api import KALENDER_MAX_DAYS_AHEAD
+
+logger = logging.getLogger(__name__)
+
+_SITZUNGEN = TypeAdapter(list[Sitzung])
+
+# Marker in the fault script for a dropped connection
+_DROP = 0
+
+
+@dataclass
+class Faults:
+    """Random faults, applied to each PUT request independently."""
+
+    latency_s: float = 0.0
+    latency_jitter_s: float = 0.0
+    # Fraction of requests answered with ``error_status``
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Fraction of requests answered with 429 and ``Retry-After: retry_after_s``
+    rate_limit_rate: float = 0.0
+    retry_after_s: float = 1.0
+    # Fraction of requests whose connection is closed without a response
+    drop_rate: float = 0.0
+
+
+@dataclass(frozen=True)
+class Submission:
+    """One PUT request as seen by the server."""
+
+    path: str
+    status: int
+    headers: dict[str, str]
+    body_bytes: int
+    payload: Any = None
+
+
+class FakeLtzfServer:
+    """Threaded HTTP server on localhost that behaves like the LTZF write API.
+
+    Use as a context manager or call :meth:`start`/:meth:`stop`. Thread-safe;
+    faults may be changed while the server runs.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        api_key: str | None = None,
+        faults: Faults | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.faults = faults or Faults()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._script: deque[tuple[int, float | None]] = deque()
+        self._submissions: list[Submission] = []
+        self.vorgaenge: dict[str, dict] = {}
+        self.kalender: dict[tuple[str, str], list[dict]] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as ``ltzf_api_url``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeLtzfServer":
+        """Serve requests on a background thread."""
+        # A short poll interval keeps stop() fast in test teardown
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-ltzf", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted, then close the socket."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self) -> "FakeLtzfServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(self, status: int, times: int = 1, *, retry_after_s: float | None = None) -> None:
+        """Answer the next ``times`` PUT requests with ``status`` (before any random fault)."""
+        with self._lock:
+            self._script.extend([(status, retry_after_s)] * times)
+
+    def drop_next(self, times: int = 1) -> None:
+        """Close the connection of the next ``times`` PUT requests without a response."""
+        with self._lock:
+            self._script.extend([(_DROP, None)] * times)
+
+    @property
+    def submissions(self) -> list[Submission]:
+        """All PUT requests received so far, in arrival order."""
+        with self._lock:
+            return list(self._submissions)
+
+    def status_counts(self) -> Counter:
+        """Number of PUT requests per response status (0 for dropped connections)."""
+        with self._lock:
+            return Counter(s.status for s in self._submissions)
+
+    def reset(self) -> None:
+        """Forget submissions, stored data and scripted faults."""
+        with self._lock:
+            self._script.clear()
+            self._submissions.clear()
+            self.vorgaenge.clear()
+            self.kalender.clear()
+
+    def _next_fault(self) -> tuple[int, float | None] | None:
+        """The scripted or random fault for the next request, or None to process it."""
+        with self._lock:
+            if self._script:
+                return self._script.popleft()
+            faults = self.faults
+            roll = self._random.random()
+        if roll < faults.drop_rate:
+            return _DROP, None
+        roll -= faults.drop_rate
+        if roll < faults.rate_limit_rate:
+            return 429, faults.retry_after_s
+        roll -= faults.rate_limit_rate
+        if roll < faults.error_rate:
+            return faults.error_status, None
+        return None
+
+    def _delay(self) -> None:
+        faults = self.faults
+        delay = faults.latency_s + (self._random.uniform(0, faults.latency_jitter_s) if faults.latency_jitter_s else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _store(self, path: str, payload: Any) -> tuple[int, str]:
+        """Validate and store a decoded payload; returns status and error message."""
+        parts = path.strip("/").split("/")
+        try:
+            if parts == ["api", "v2", "vorgang"]:
+                api_id = str(Vorgang.model_validate(payload).api_id)
+                with self._lock:
+                    if self.vorgaenge.get(api_id) == payload:
+                        return 409, ""
+                    self.vorgaenge[api_id] = payload
+                return 201, ""
+            if len(parts) == 5 and parts[:3] == ["api", "v2", "kalender"]:
+                parlament, datum = parts[3], date.fromisoformat(parts[4])
+                _SITZUNGEN.validate_python(payload)
+                if datum > date.today() + timedelta(days=KALENDER_MAX_DAYS_AHEAD):
+                    return 403, f"{datum} is outside the collector scope"
+                with self._lock:
+                    self.kalender[(parlament, datum.isoformat())] = payload
+                return 201, ""
+        except (ValidationError, ValueError) as e:
+            return 400, str(e)
+        return 404, f"No such endpoint: {path}"
+
+    def _record(self, submission: Submission) -> None:
+        with self._lock:
+            self._submissions.append(submission)
+
+
+def _handler_for(server: FakeLtzfServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug("%s " + format, self.address_string(), *args)
+
+        def do_GET(self) -> None:
+            if self.path in ("/ping", "/health"):
+                self._respond(200)
+            else:
+                self._respond(404, "Not found")
+
+        def do_PUT(self) -> None:
+            raw = self._read_body()
+            headers = dict(self.headers.items())
+            server._delay()
+
+            fault = server._next_fault()
+            if fault is not None and fault[0] == _DROP:
+                server._record(Submission(self.path, _DROP, headers, len(raw)))
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            if fault is not None:
+                status, retry_after = fault
+                server._record(Submission(self.path, status, headers, len(raw)))
+                extra = {"Retry-After": f"{retry_after:g}"} if retry_after is not None else {}
+                self._respond(status, "Injected fault", extra)
+                return
+
+            if server.api_key is not None and self.headers.get("X-API-Key") != server.api_key:
+                status, error, payload = 401, "Invalid API key", None
+            else:
+                try:
+                    payload = json.loads(_decode(raw, self.headers.get("Content-Encoding")))
+                except (OSError, zlib.error, ValueError) as e:
+                    status, error, payload = 400, f"Unreadable body: {e}", None
+                else:
+                    status, error = server._store(self.path, payload)
+            server._record(Submission(self.path, status, headers, len(raw), payload))
+            self._respond(status, error)
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            chunks = []
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            # Skip trailers up to the blank line ending the body
+            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+
+        def _respond(self, status: int, error: str = "", headers: dict[str, str] | None = None) -> None:
+            body = json.dumps({"error": error}).encode() if error else b""
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            if body:
+                self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def _decode(raw: bytes, encoding: str | None) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        return zlib.decompress(raw)
+    return raw
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local LTZF write API stand-in with fault injection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", help="Require this X-API-Key (default: accept any)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per PUT")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency up to this value")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of PUTs answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of PUTs answered with 429")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of PUTs dropped without response")
+    parser.add_argument("--seed", type=int, help="Seed for the fault dice")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    faults = Faults(
+        latency_s=args.latency_ms / 1000,
+        latency_jitter_s=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        drop_rate=args.drop_rate,
+    )
+    server = FakeLtzfServer(args.host, args.port, api_key=args.api_key, faults=faults, seed=args.seed)
+    logger.info("Fake LTZF API listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info("Served %d PUT requests: %s", len(server.submissions), dict(server.status_counts()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Hard deadlines for pipeline stages that may hang (PDF download, OCR, LTZF PUT)."""
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage does not finish within its deadline."""
+
+
+def run_with_deadline(
+    fn: Callable[[], Any],
+    deadline_s: float | None,
+    stage: str,
+    cutoff: Callable[[], float] | None = None,
+) -> Any:
+    """Run ``fn`` and return its result, giving up after ``deadline_s`` seconds.
+
+    ``fn`` runs in a daemon thread. Python threads cannot be killed, so on timeout
+    the thread is abandoned: it may finish in the background, but its result is
+    discarded and it never blocks the caller or interpreter shutdown. Callers must
+    therefore keep side effects they rely on (cache updates, counters) outside ``fn``.
+
+    Args:
+        fn: The work to run.
+        deadline_s: Maximum duration in seconds; None or <= 0 runs ``fn`` inline without a deadline.
+        stage: Stage name used in the DeadlineExceeded message.
+        cutoff: Optional callable returning an absolute ``time.monotonic()`` limit that may move
+            earlier while ``fn`` runs (e.g. a shutdown grace period); ``inf`` means no limit.
+
+    Raises:
+        DeadlineExceeded: If ``fn`` did not finish in time.
+    """
+    has_deadline = deadline_s is not None and deadline_s > 0
+    if not has_deadline and cutoff is None:
+        return fn()
+
+    outcome: dict = {}
+
+    def target() -> None:
+        try:
+            outcome["result"] = fn()
+        except BaseException as e:  # re-raised in the calling thread
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name=f"deadline-{stage}", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + deadline_s if has_deadline else math.inf
+    while thread.is_alive():
+        limit = deadline if cutoff is None else min(deadline, cutoff())
+        remaining = limit - time.monotonic()
+        if remaining <= 0:
+            if limit < deadline:
+                raise DeadlineExceeded(f"{stage} was cut off before its deadline")
+            raise DeadlineExceeded(f"{stage} exceeded its deadline of {deadline_s:g}s")
+        # Wake up periodically so a cutoff that moved earlier is noticed
+        thread.join(min(remaining, 0.5))
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
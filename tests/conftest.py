@@ -9,6 +9,7 @@ import pytest
 from bawue_scraper.config import Config
 from bawue_scraper.domain.enums import Dokumententyp, Stationstyp, Vorgangstyp
 from bawue_scraper.domain.models import Autor, Dokument, Gremium, Sitzung, Station, Top, Vorgang
+from bawue_scraper.testing.fake_ltzf import FakeLtzfServer
 
 
 @pytest.fixture()
@@ -20,6 +21,28 @@ def config(monkeypatch):
     return Config()
 
 
+@pytest.fixture()
+def tmp_cache_config(tmp_path, monkeypatch):
+    """Config pointing cache_dir at a tmp_path."""
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    return Config()
+
+
+@pytest.fixture()
+def fake_ltzf():
+    """A running local LTZF stand-in that accepts the test API key."""
+    with FakeLtzfServer(api_key="test-api-key") as server:
+        yield server
+
+
+@pytest.fixture()
+def fake_ltzf_config(config, fake_ltzf, tmp_path, monkeypatch):
+    """Config pointing at ``fake_ltzf``, with a temporary cache_dir."""
+    monkeypatch.setattr(config, "ltzf_api_url", fake_ltzf.url)
+    monkeypatch.setattr(config, "cache_dir", str(tmp_path / "cache"))
+    return config
+
+
 @pytest.fixture()
 def sample_autor():
     """A sample Autor instance."""
@@ -120,5 +143,7 @@ def mock_ltzf_api():
 
 @pytest.fixture()
 def mock_cache():
-    """A mock Cache."""
-    return MagicMock()
+    """A mock Cache whose bulk lookup follows ``is_processed``."""
+    cache = MagicMock()
+    cache.filter_unprocessed.side_effect = lambda ids, **_: [i for i in ids if not cache.is_processed(i)]
+    return cache
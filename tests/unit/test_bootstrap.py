@@ -0,0 +1,50 @@
+"""Tests for the cache bootstrap from the LTZF read API."""
+
+from unittest.mock import MagicMock
+from uuid import NAMESPACE_URL, uuid4, uuid5
+
+from bawue_scraper.bootstrap import bootstrap_cache
+
+
+def _stored(vorgang_id: str, ids: list | None = None) -> dict:
+    """A Vorgang as the orchestrator would have submitted it."""
+    return {"api_id": str(uuid5(NAMESPACE_URL, vorgang_id)), "ids": ids if ids is not None else [vorgang_id]}
+
+
+def _marked(cache: MagicMock) -> list[str]:
+    return [vid for call in cache.mark_processed_many.call_args_list for vid in call.args[0]]
+
+
+class TestBootstrapCache:
+    def test_marks_parlis_ids_of_own_vorgaenge(self):
+        cache = MagicMock()
+
+        loaded = bootstrap_cache([_stored("V-1"), _stored("V-2")], cache)
+
+        assert loaded == 2
+        assert _marked(cache) == ["V-1", "V-2"]
+        cache.flush.assert_called_once_with()
+
+    def test_picks_matching_id_among_several(self):
+        cache = MagicMock()
+
+        bootstrap_cache([_stored("V-1", ids=["17/1234", {"typ": "vorgnr", "id": "V-1"}])], cache)
+
+        assert _marked(cache) == ["V-1"]
+
+    def test_skips_vorgaenge_not_submitted_by_this_collector(self):
+        cache = MagicMock()
+        foreign = {"api_id": str(uuid4()), "ids": ["V-9"]}
+
+        loaded = bootstrap_cache([foreign, {"titel": "ohne api_id"}, _stored("V-1")], cache)
+
+        assert loaded == 1
+        assert _marked(cache) == ["V-1"]
+
+    def test_writes_in_batches(self, monkeypatch):
+        monkeypatch.setattr("bawue_scraper.bootstrap._BATCH_SIZE", 2)
+        cache = MagicMock()
+
+        bootstrap_cache([_stored(f"V-{i}") for i in range(5)], cache)
+
+        assert [len(call.args[0]) for call in cache.mark_processed_many.call_args_list] == [2, 2, 1]
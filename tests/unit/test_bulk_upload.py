@@ -0,0 +1,106 @@
+"""Tests for the bulk upload of NDJSON exports."""
+
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from bawue_scraper.adapters.ndjson_sink import NdjsonFileSink
+from bawue_scraper.bulk_upload import export_files, upload_exports
+from bawue_scraper.config import Config
+
+
+@pytest.fixture()
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXPORT_DIR", str(tmp_path / "export"))
+    return tmp_path / "export"
+
+
+@pytest.fixture()
+def sink(export_dir):
+    return NdjsonFileSink(Config())
+
+
+@pytest.fixture()
+def ltzf_api():
+    api = MagicMock()
+    api.submit_vorgang.return_value = True
+    api.submit_sitzungen.return_value = True
+    return api
+
+
+class TestExportFiles:
+    def test_lists_finished_files_oldest_first(self, export_dir):
+        export_dir.mkdir()
+        for name in ("ltzf-20260202T000000-1-0001.ndjson.gz", "ltzf-20260201T000000-1-0001.ndjson.gz"):
+            (export_dir / name).touch()
+        (export_dir / "ltzf-20260203T000000-1-0001.ndjson.gz.partial").touch()
+
+        assert [p.name for p in export_files(export_dir)] == [
+            "ltzf-20260201T000000-1-0001.ndjson.gz",
+            "ltzf-20260202T000000-1-0001.ndjson.gz",
+        ]
+
+
+class TestUploadExports:
+    def test_submits_every_record(self, sink, export_dir, ltzf_api, sample_vorgang, sample_sitzung):
+        sink.submit_vorgang(sample_vorgang)
+        sink.submit_sitzungen(date(2026, 2, 5), [sample_sitzung])
+        sink.flush()
+
+        stats = upload_exports(export_files(export_dir), ltzf_api, concurrency=4)
+
+        assert (stats.files, stats.records, stats.submitted, stats.errors) == (1, 2, 2, 0)
+        assert ltzf_api.submit_vorgang.call_args.args[0] == sample_vorgang
+        assert ltzf_api.submit_sitzungen.call_args.args == (date(2026, 2, 5), [sample_sitzung])
+
+    def test_versions_of_one_vorgang_submitted_in_order(self, sink, export_dir, ltzf_api, sample_vorgang):
+        titles = [f"Version {i}" for i in range(5)]
+        for titel in titles:
+            sink.submit_vorgang(sample_vorgang.model_copy(update={"titel": titel}))
+        sink.flush()
+        sent = []
+        ltzf_api.submit_vorgang.side_effect = lambda v: sent.append(v.titel) or True
+
+        upload_exports(export_files(export_dir), ltzf_api, concurrency=4)
+
+        assert sent == titles
+
+    def test_failed_and_unreadable_records_counted(self, export_dir, ltzf_api, sample_vorgang):
+        export_dir.mkdir()
+        path = export_dir / "ltzf-manual.ndjson"
+        path.write_bytes(
+            b'{"kind": "vorgang", "payload": ' + sample_vorgang.model_dump_json().encode() + b"}\n"
+            b"not json\n"
+            b'{"kind": "unknown"}\n'
+        )
+        ltzf_api.submit_vorgang.return_value = False
+
+        stats = upload_exports([path], ltzf_api, concurrency=2)
+
+        assert (stats.records, stats.submitted, stats.errors) == (1, 0, 3)
+
+    def test_damaged_file_skipped(self, sink, export_dir, ltzf_api, sample_vorgang):
+        sink.submit_vorgang(sample_vorgang)
+        sink.flush()
+        [good] = export_files(export_dir)
+        # A file cut short, e.g. by a full disk: the gzip trailer is missing
+        damaged = export_dir / "ltzf-damaged.ndjson.gz"
+        damaged.write_bytes(good.read_bytes()[:-8])
+
+        stats = upload_exports([damaged, good], ltzf_api, concurrency=2)
+
+        assert stats.errors == 1
+        assert stats.files == 2
+
+    def test_stop_prevents_further_files(self, sink, export_dir, ltzf_api, sample_vorgang):
+        sink.submit_vorgang(sample_vorgang)
+        sink.flush()
+        stop = threading.Event()
+        stop.set()
+
+        stats = upload_exports(export_files(export_dir), ltzf_api, concurrency=2, stop=stop)
+
+        assert stats.files == 0
+        ltzf_api.submit_vorgang.assert_not_called()
@@ -1,6 +1,8 @@
 """Tests for the file-based cache manager."""
 
 import json
+import multiprocessing
+from pathlib import Path
 
 import pytest
 
@@ -8,6 +10,13 @@ from bawue_scraper.adapters.cache_manager import CacheManager
 from bawue_scraper.config import Config
 
 
+def _mark_range(config: Config, prefix: str, count: int) -> None:
+    """Mark IDs one write at a time, as a separate scraper process would."""
+    cache = CacheManager(config)
+    for i in range(count):
+        cache.mark_processed(f"{prefix}-{i:03d}")
+
+
 @pytest.fixture()
 def cache_config(tmp_path, monkeypatch):
     """Config pointing cache_dir at a tmp_path."""
@@ -77,15 +86,24 @@ class TestCacheManager:
         cache = CacheManager(cache_config)
         assert cache.is_processed("V-12345") is False
 
-    def test_cache_file_contains_json_list(self, cache_config):
+    def test_cache_file_maps_ids_to_source_fingerprints(self, cache_config):
         from pathlib import Path
 
         cache = CacheManager(cache_config)
         cache.mark_processed("V-001")
-        cache.mark_processed("V-002")
+        cache.mark_processed("V-002", source_fingerprint="abc")
 
         data = json.loads((Path(cache_config.cache_dir) / "processed.json").read_text())
-        assert set(data) == {"V-001", "V-002"}
+        assert data == {"V-001": None, "V-002": "abc"}
+
+    def test_reads_list_of_ids(self, cache_config):
+        from pathlib import Path
+
+        cache_dir = Path(cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text('["V-001"]', encoding="utf-8")
+
+        assert CacheManager(cache_config).is_processed("V-001") is True
 
     def test_save_uses_atomic_write(self, cache_config, monkeypatch):
         """Verify _save() writes to a temp file then atomically replaces."""
@@ -100,3 +118,127 @@ class TestCacheManager:
             # The target should be the cache file path
             target = mock_replace.call_args[0][1]
             assert str(target) == str(cache._cache_file)
+
+    def test_mark_processed_many_writes_once(self, cache_config):
+        import os
+        from unittest.mock import patch
+
+        cache = CacheManager(cache_config)
+
+        with patch("bawue_scraper.adapters.cache_manager.os.replace", wraps=os.replace) as mock_replace:
+            cache.mark_processed_many(["V-001", "V-002", "V-003"])
+            cache.mark_processed_many(["V-001"])
+
+        mock_replace.assert_called_once()
+        assert all(CacheManager(cache_config).is_processed(v) for v in ("V-001", "V-002", "V-003"))
+
+    def test_batch_writes_once_on_exit(self, cache_config, mocker):
+        import os
+
+        cache = CacheManager(cache_config)
+        mock_replace = mocker.patch("bawue_scraper.adapters.cache_manager.os.replace", wraps=os.replace)
+
+        with cache.batch():
+            cache.mark_processed("V-001")
+            cache.mark_processed("V-002")
+            cache.invalidate("V-001")
+            assert cache.is_processed("V-002") is True
+            mock_replace.assert_not_called()
+
+        mock_replace.assert_called_once()
+        reopened = CacheManager(cache_config)
+        assert (reopened.is_processed("V-001"), reopened.is_processed("V-002")) == (False, True)
+
+    def test_batch_commits_on_exception(self, cache_config):
+        cache = CacheManager(cache_config)
+
+        with pytest.raises(RuntimeError), cache.batch():
+            cache.mark_processed("V-001")
+            raise RuntimeError("boom")
+
+        assert CacheManager(cache_config).is_processed("V-001") is True
+
+    def test_filter_unprocessed(self, cache_config):
+        cache = CacheManager(cache_config)
+        cache.mark_processed("V-002")
+
+        assert cache.filter_unprocessed(["V-001", "V-002", "V-003"]) == ["V-001", "V-003"]
+
+
+class TestSourceFingerprints:
+    def test_changed_source_counts_as_unprocessed(self, cache_config):
+        cache = CacheManager(cache_config)
+        cache.mark_processed_many(["V-001", "V-002"], source_fingerprints={"V-001": "a", "V-002": "b"})
+
+        unprocessed = cache.filter_unprocessed(
+            ["V-001", "V-002", "V-003"], source_fingerprints={"V-001": "a", "V-002": "b2", "V-003": "c"}
+        )
+
+        assert unprocessed == ["V-002", "V-003"]
+        # Without fingerprints only the processed state counts
+        assert cache.filter_unprocessed(["V-001", "V-002"]) == []
+
+    def test_mark_without_fingerprint_keeps_stored_one(self, cache_config):
+        cache = CacheManager(cache_config)
+        cache.mark_processed("V-001", source_fingerprint="a")
+        cache.mark_processed("V-001")
+
+        assert CacheManager(cache_config).filter_unprocessed(["V-001"], source_fingerprints={"V-001": "b"}) == ["V-001"]
+
+    def test_id_without_fingerprint_adopts_given_one(self, cache_config):
+        cache = CacheManager(cache_config)
+        cache.mark_processed("V-001")
+
+        assert cache.filter_unprocessed(["V-001"], source_fingerprints={"V-001": "a"}) == []
+
+        reopened = CacheManager(cache_config)
+        assert reopened.filter_unprocessed(["V-001"], source_fingerprints={"V-001": "b"}) == ["V-001"]
+
+
+class TestSharedCacheDir:
+    def test_writes_merge_with_other_instances(self, cache_config):
+        first, second = CacheManager(cache_config), CacheManager(cache_config)
+        first.mark_processed("V-001", source_fingerprint="a")
+        second.mark_processed("V-002")
+        first.mark_processed("V-003")
+
+        reopened = CacheManager(cache_config)
+        assert [reopened.is_processed(v) for v in ("V-001", "V-002", "V-003")] == [True, True, True]
+        assert reopened.filter_unprocessed(["V-001"], source_fingerprints={"V-001": "a"}) == []
+
+    def test_invalidation_by_other_instance_is_kept(self, cache_config):
+        first, second = CacheManager(cache_config), CacheManager(cache_config)
+        first.mark_processed("V-001")
+        second.invalidate("V-001")
+        first.mark_processed("V-002")
+
+        assert CacheManager(cache_config).is_processed("V-001") is False
+
+    def test_lookups_see_writes_of_other_instances(self, cache_config):
+        first, second = CacheManager(cache_config), CacheManager(cache_config)
+        second.mark_processed("V-001")
+
+        assert first.is_processed("V-001") is True
+        assert first.filter_unprocessed(["V-001", "V-002"]) == ["V-002"]
+
+    def test_batch_keeps_unwritten_changes_when_reloading(self, cache_config):
+        first, second = CacheManager(cache_config), CacheManager(cache_config)
+        with first.batch():
+            first.mark_processed("V-001")
+            second.mark_processed("V-002")
+            assert first.filter_unprocessed(["V-001", "V-002", "V-003"]) == ["V-003"]
+
+        reopened = CacheManager(cache_config)
+        assert reopened.is_processed("V-001") and reopened.is_processed("V-002")
+
+    def test_parallel_processes_lose_no_marks(self, cache_config):
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_mark_range, args=(cache_config, p, 40)) for p in ("A", "B", "C")]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        assert [process.exitcode for process in processes] == [0, 0, 0]
+        data = json.loads((Path(cache_config.cache_dir) / "processed.json").read_text(encoding="utf-8"))
+        assert len(data) == 120
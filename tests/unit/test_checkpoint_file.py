@@ -0,0 +1,30 @@
+"""Tests for the file-based run checkpoint."""
+
+from datetime import date
+
+from bawue_scraper.adapters.checkpoint_file import FileCheckpoint
+from bawue_scraper.ports.checkpoint import PendingSearch
+
+
+class TestFileCheckpoint:
+    def test_load_without_file_returns_empty(self, tmp_cache_config):
+        assert FileCheckpoint(tmp_cache_config).load() == []
+
+    def test_save_then_load_round_trip(self, tmp_cache_config):
+        pending = [PendingSearch("Kleine Anfrage", date(2026, 1, 1), date(2026, 1, 31))]
+        FileCheckpoint(tmp_cache_config).save(pending)
+
+        assert FileCheckpoint(tmp_cache_config).load() == pending
+
+    def test_save_empty_clears(self, tmp_cache_config):
+        checkpoint = FileCheckpoint(tmp_cache_config)
+        checkpoint.save([PendingSearch("Antrag", date(2026, 1, 1), date(2026, 1, 31))])
+        checkpoint.save([])
+
+        assert checkpoint.load() == []
+
+    def test_corrupt_file_returns_empty(self, tmp_cache_config):
+        checkpoint = FileCheckpoint(tmp_cache_config)
+        checkpoint._checkpoint_file.write_text("{broken")
+
+        assert checkpoint.load() == []
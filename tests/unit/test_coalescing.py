@@ -0,0 +1,134 @@
+"""Tests for the coalescing buffer and the Vorgang merge."""
+
+from datetime import datetime
+
+import pytest
+
+from bawue_scraper.coalescing import CoalescingBuffer
+from bawue_scraper.domain.enums import Stationstyp
+from bawue_scraper.domain.merge import merge_vorgaenge
+from bawue_scraper.domain.models import Autor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+class TestMergeVorgaenge:
+    def test_scalars_from_newer_build(self, sample_vorgang):
+        newer = sample_vorgang.model_copy(update={"titel": "Neuer Titel"})
+
+        assert merge_vorgaenge(sample_vorgang, newer).titel == "Neuer Titel"
+
+    def test_stations_united_in_first_seen_order(self, sample_vorgang, sample_station):
+        beratung = sample_station.model_copy(
+            update={"typ": Stationstyp.PARL_VOLLVLSGN, "zp_start": datetime(2026, 3, 1)}
+        )
+        newer = sample_vorgang.model_copy(update={"stationen": [beratung, sample_station]})
+
+        merged = merge_vorgaenge(sample_vorgang, newer)
+
+        assert [s.typ for s in merged.stationen] == [Stationstyp.PARL_INITIATIV, Stationstyp.PARL_VOLLVLSGN]
+
+    def test_documents_of_matching_station_united_by_hash(self, sample_vorgang, sample_station, sample_dokument):
+        anlage = sample_dokument.model_copy(update={"hash": "def456hash"})
+        newer_station = sample_station.model_copy(update={"dokumente": [anlage]})
+        newer = sample_vorgang.model_copy(update={"stationen": [newer_station]})
+
+        merged = merge_vorgaenge(sample_vorgang, newer)
+
+        assert len(merged.stationen) == 1
+        assert [d.hash for d in merged.stationen[0].dokumente] == ["abc123hash", "def456hash"]
+
+    def test_same_typ_and_date_fundstellen_kept_apart(self, sample_vorgang, sample_station, sample_dokument):
+        # Two "Antrag" Fundstellen on one day, built while no PDF text could be extracted
+        stationen = [
+            sample_station.model_copy(
+                update={"dokumente": [sample_dokument.model_copy(update={"hash": "", "link": link})]}
+            )
+            for link in ("https://www.landtag-bw.de/a.pdf", "https://www.landtag-bw.de/b.pdf")
+        ]
+        build = sample_vorgang.model_copy(update={"stationen": stationen})
+
+        merged = merge_vorgaenge(build, build.model_copy())
+
+        assert [str(s.dokumente[0].link) for s in merged.stationen] == [
+            "https://www.landtag-bw.de/a.pdf",
+            "https://www.landtag-bw.de/b.pdf",
+        ]
+
+    def test_documents_without_hash_united_by_link(self, sample_vorgang, sample_station, sample_dokument):
+        anlage = sample_dokument.model_copy(update={"hash": "", "link": "https://www.landtag-bw.de/anlage.pdf"})
+        station = sample_station.model_copy(
+            update={"dokumente": [sample_dokument.model_copy(update={"hash": ""}), anlage]}
+        )
+        build = sample_vorgang.model_copy(update={"stationen": [station]})
+
+        merged = merge_vorgaenge(build, build.model_copy())
+
+        assert len(merged.stationen) == 1
+        assert len(merged.stationen[0].dokumente) == 2
+
+    def test_initiatoren_and_ids_without_duplicates(self, sample_vorgang, sample_autor):
+        spd = Autor(organisation="Fraktion SPD")
+        newer = sample_vorgang.model_copy(update={"initiatoren": [sample_autor, spd], "ids": ["17/10266", "V-001"]})
+
+        merged = merge_vorgaenge(sample_vorgang, newer)
+
+        assert merged.initiatoren == [sample_autor, spd]
+        assert merged.ids == ["17/10266", "V-001"]
+
+    def test_merging_identical_builds_is_a_no_op(self, sample_vorgang):
+        assert merge_vorgaenge(sample_vorgang, sample_vorgang.model_copy()) == sample_vorgang
+
+
+class TestCoalescingBuffer:
+    def test_second_build_merged(self, clock, sample_vorgang):
+        buffer = CoalescingBuffer(10, clock=clock)
+
+        assert buffer.add(sample_vorgang, "V-001") is False
+        assert buffer.add(sample_vorgang.model_copy(update={"titel": "Neu"}), "V-001") is True
+
+        [(vorgang, ids)] = buffer.pop_all()
+        assert vorgang.titel == "Neu"
+        assert ids == ["V-001"]
+        assert len(buffer) == 0
+
+    def test_pop_due_waits_for_window(self, clock, sample_vorgang):
+        buffer = CoalescingBuffer(10, clock=clock)
+        buffer.add(sample_vorgang, "V-001")
+
+        clock.now = 9.9
+        assert buffer.pop_due() == []
+        clock.now = 10.0
+        assert [v for v, _ in buffer.pop_due()] == [sample_vorgang]
+        assert len(buffer) == 0
+
+    def test_window_counts_from_first_build(self, clock, sample_vorgang):
+        buffer = CoalescingBuffer(10, clock=clock)
+        buffer.add(sample_vorgang, "V-001")
+        clock.now = 8
+        buffer.add(sample_vorgang, "V-002")
+
+        clock.now = 10
+        [(_, ids)] = buffer.pop_due()
+
+        assert ids == ["V-001", "V-002"]
+
+    def test_distinct_vorgaenge_held_separately(self, clock, sample_vorgang):
+        buffer = CoalescingBuffer(10, clock=clock)
+        other = sample_vorgang.model_copy(update={"api_id": "00000000-0000-0000-0000-000000000001"})
+
+        buffer.add(sample_vorgang, "V-001")
+        assert buffer.add(other, "V-002") is False
+
+        assert len(buffer.pop_all()) == 2
@@ -0,0 +1,70 @@
+"""Tests for the AIMD submission concurrency limit."""
+
+import threading
+
+from bawue_scraper.concurrency import AimdLimiter
+
+
+def _complete(limiter: AimdLimiter, latency_s: float = 0.1, ok: bool = True) -> None:
+    limiter.acquire()
+    limiter.release(latency_s, ok)
+
+
+class TestAimdLimiter:
+    def test_grows_by_one_per_window_of_healthy_completions(self):
+        limiter = AimdLimiter(8)
+
+        _complete(limiter)
+        assert limiter.limit == 2
+        _complete(limiter)
+        _complete(limiter)
+        assert limiter.limit == 3
+
+    def test_never_exceeds_maximum(self):
+        limiter = AimdLimiter(2)
+
+        for _ in range(10):
+            _complete(limiter)
+
+        assert limiter.limit == 2
+
+    def test_failure_halves_limit(self):
+        limiter = AimdLimiter(16, initial=8)
+
+        _complete(limiter, ok=False)
+
+        assert limiter.limit == 4
+
+    def test_latency_spike_halves_limit(self):
+        limiter = AimdLimiter(16, initial=8)
+        _complete(limiter, latency_s=0.1)
+
+        _complete(limiter, latency_s=1.0)
+
+        assert limiter.limit == 4
+
+    def test_burst_of_failures_decreases_once(self):
+        limiter = AimdLimiter(16, initial=8)
+        _complete(limiter, latency_s=10)
+
+        for _ in range(4):
+            _complete(limiter, ok=False)
+
+        assert limiter.limit == 4
+
+    def test_limit_never_below_one(self):
+        limiter = AimdLimiter(4)
+
+        _complete(limiter, ok=False)
+
+        assert limiter.limit == 1
+
+    def test_acquire_blocks_at_limit(self):
+        limiter = AimdLimiter(4, initial=1)
+        limiter.acquire()
+        acquired = threading.Event()
+        threading.Thread(target=lambda: (limiter.acquire(), acquired.set()), daemon=True).start()
+
+        assert not acquired.wait(0.05)
+        limiter.release(0.1, True)
+        assert acquired.wait(1)
@@ -4,10 +4,15 @@ import pytest
 
 from bawue_scraper.domain.enums import Dokumententyp, Stationstyp, Vorgangstyp
 from bawue_scraper.mapping.enum_mapper import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
     VORGANGSTYP_MAP,
+    VORGANGSTYP_PRIORITY,
     map_dokumententyp,
     map_stationstyp,
     map_vorgangstyp,
+    vorgangstyp_priority,
 )
 
 
@@ -59,6 +64,23 @@ class TestVorgangstypMapping:
         assert len(VORGANGSTYP_MAP) == 32
 
 
+class TestVorgangstypPriority:
+    @pytest.mark.parametrize(
+        "parlis_typ,expected",
+        [
+            ("Gesetzgebung", PRIORITY_HIGH),
+            ("Antrag", PRIORITY_NORMAL),
+            ("Kleine Anfrage", PRIORITY_LOW),
+            ("Unbekannter Typ", PRIORITY_NORMAL),
+        ],
+    )
+    def test_priority_classes(self, parlis_typ, expected):
+        assert vorgangstyp_priority(parlis_typ) == expected
+
+    def test_priority_keys_are_known_vorgangstypen(self):
+        assert set(VORGANGSTYP_PRIORITY) <= set(VORGANGSTYP_MAP)
+
+
 class TestStationstypMapping:
     @pytest.mark.parametrize(
         "text,initiator,expected",
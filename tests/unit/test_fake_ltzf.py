@@ -0,0 +1,121 @@
+"""Tests for the local LTZF stand-in, driven through the real LtzfClient."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+from bawue_scraper.adapters.http_transport import RetryPolicy
+from bawue_scraper.adapters.ltzf_client import LtzfClient
+from bawue_scraper.adapters.sqlite_outbox import SqliteOutbox
+from bawue_scraper.testing.fake_ltzf import FakeLtzfServer, Faults
+
+FAST_RETRIES = RetryPolicy(
+    connection_backoff_s=(0.01, 0.01, 0.01),
+    server_error_backoff_s=(0.01, 0.01, 0.01),
+    rate_limit_default_s=0.01,
+)
+
+
+@pytest.fixture()
+def client(fake_ltzf_config):
+    return LtzfClient(fake_ltzf_config, retry_policy=FAST_RETRIES)
+
+
+class TestFakeLtzfEndpoints:
+    def test_stores_vorgang(self, client, fake_ltzf, sample_vorgang):
+        assert client.submit_vorgang(sample_vorgang) is True
+
+        assert fake_ltzf.vorgaenge[str(sample_vorgang.api_id)]["titel"] == sample_vorgang.titel
+        assert fake_ltzf.status_counts() == {201: 1}
+
+    def test_identical_vorgang_answered_with_conflict(self, client, fake_ltzf, sample_vorgang):
+        client.submit_vorgang(sample_vorgang)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert [s.status for s in fake_ltzf.submissions] == [201, 409]
+
+    def test_stores_sitzungen_per_date(self, client, fake_ltzf, sample_sitzung):
+        datum = date.today()
+
+        assert client.submit_sitzungen(datum, [sample_sitzung]) is True
+        assert len(fake_ltzf.kalender[("BW", datum.isoformat())]) == 1
+
+    def test_rejects_dates_after_collector_scope(self, fake_ltzf, sample_sitzung):
+        datum = date.today() + timedelta(days=3)
+        resp = requests.put(
+            f"{fake_ltzf.url}/api/v2/kalender/BW/{datum.isoformat()}",
+            json=[sample_sitzung.model_dump(mode="json")],
+            headers={"X-API-Key": "test-api-key"},
+        )
+        assert resp.status_code == 403
+
+    def test_invalid_payload_rejected(self, fake_ltzf):
+        resp = requests.put(
+            f"{fake_ltzf.url}/api/v2/vorgang",
+            json={"titel": "ohne Pflichtfelder"},
+            headers={"X-API-Key": "test-api-key"},
+        )
+        assert resp.status_code == 400
+        assert "error" in resp.json()
+
+    def test_wrong_api_key_rejected(self, fake_ltzf, sample_vorgang):
+        resp = requests.put(f"{fake_ltzf.url}/api/v2/vorgang", data=b"{}", headers={"X-API-Key": "wrong"})
+        assert resp.status_code == 401
+
+    def test_decodes_compressed_bodies(self, fake_ltzf_config, fake_ltzf, sample_vorgang, monkeypatch):
+        monkeypatch.setattr(fake_ltzf_config, "ltzf_request_compression", "gzip")
+        monkeypatch.setattr(fake_ltzf_config, "ltzf_compression_min_bytes", 1)
+
+        assert LtzfClient(fake_ltzf_config).submit_vorgang(sample_vorgang) is True
+        assert fake_ltzf.submissions[0].headers["Content-Encoding"] == "gzip"
+        assert str(sample_vorgang.api_id) in fake_ltzf.vorgaenge
+
+    def test_accepts_chunked_bodies(self, fake_ltzf, sample_vorgang):
+        body = sample_vorgang.model_dump_json().encode()
+        chunks = (body[i : i + 100] for i in range(0, len(body), 100))
+
+        resp = requests.put(f"{fake_ltzf.url}/api/v2/vorgang", data=chunks, headers={"X-API-Key": "test-api-key"})
+
+        assert resp.status_code == 201
+        assert fake_ltzf.submissions[0].payload == json.loads(body)
+
+
+class TestFakeLtzfFaults:
+    def test_scripted_server_errors_are_retried(self, client, fake_ltzf, sample_vorgang):
+        fake_ltzf.fail_next(503, times=2)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert [s.status for s in fake_ltzf.submissions] == [503, 503, 201]
+
+    def test_rate_limit_sends_retry_after(self, client, fake_ltzf, sample_vorgang):
+        fake_ltzf.fail_next(429, retry_after_s=0)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert client.counters()["retries"] == 1
+
+    def test_dropped_connection_is_retried(self, client, fake_ltzf, sample_vorgang):
+        fake_ltzf.drop_next()
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert [s.status for s in fake_ltzf.submissions] == [0, 201]
+
+    def test_persistent_outage_goes_to_outbox(self, fake_ltzf_config, fake_ltzf, sample_vorgang):
+        fake_ltzf.faults = Faults(error_rate=1.0)
+        client = LtzfClient(fake_ltzf_config, SqliteOutbox(fake_ltzf_config), retry_policy=FAST_RETRIES)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert fake_ltzf.vorgaenge == {}
+
+        fake_ltzf.faults = Faults()
+        assert client.replay_pending() == 1
+        assert str(sample_vorgang.api_id) in fake_ltzf.vorgaenge
+
+    def test_random_faults_follow_their_rates(self):
+        server = FakeLtzfServer(faults=Faults(error_rate=0.25, rate_limit_rate=0.25), seed=1)
+        outcomes = [server._next_fault() for _ in range(2000)]
+
+        assert 400 < sum(o == (503, None) for o in outcomes) < 600
+        assert 400 < sum(o == (429, 1.0) for o in outcomes) < 600
+        server.stop()
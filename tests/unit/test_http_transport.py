@@ -0,0 +1,184 @@
+"""Tests for the shared HTTP transport (retries, Retry-After, circuit breaker)."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import responses
+
+from bawue_scraper.adapters.http_transport import CircuitOpenError, HttpTransport, RetryPolicy, _parse_retry_after
+
+URL = "http://ltzf.example/api/v2/vorgang"
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of sleeping."""
+    recorded: list[float] = []
+    monkeypatch.setattr("bawue_scraper.adapters.http_transport.time.sleep", recorded.append)
+    return recorded
+
+
+class TestRetries:
+    @responses.activate
+    def test_server_errors_use_backoff_schedule(self, sleeps):
+        for _ in range(4):
+            responses.put(URL, status=500)
+        transport = HttpTransport(breaker_threshold=10)
+
+        resp = transport.request("PUT", URL)
+
+        assert resp.status_code == 500
+        assert sleeps == [5.0, 10.0, 20.0]
+        assert transport.counters().retries == 3
+
+    @responses.activate
+    def test_connection_errors_retried_then_raised(self, sleeps):
+        responses.put(URL, body=requests.ConnectionError("refused"))
+        transport = HttpTransport(breaker_threshold=10)
+
+        with pytest.raises(requests.ConnectionError):
+            transport.request("PUT", URL)
+        assert sleeps == [2.0, 4.0, 8.0]
+
+    @responses.activate
+    def test_body_factory_called_for_every_attempt(self, sleeps):
+        responses.put(URL, status=503)
+        responses.put(URL, status=201)
+        body = MagicMock(return_value=b"{}")
+
+        resp = HttpTransport(breaker_threshold=10).request("PUT", URL, body=body)
+
+        assert resp.status_code == 201
+        assert body.call_count == 2
+        assert responses.calls[1].request.body == b"{}"
+
+    @responses.activate
+    def test_rate_limit_honours_retry_after(self, sleeps):
+        responses.put(URL, status=429, headers={"Retry-After": "7"})
+        responses.put(URL, status=201)
+
+        resp = HttpTransport().request("PUT", URL)
+
+        assert resp.status_code == 201
+        assert sleeps == [7.0]
+
+    @responses.activate
+    def test_retry_after_is_capped(self, sleeps):
+        responses.put(URL, status=429, headers={"Retry-After": "86400"})
+        responses.put(URL, status=201)
+
+        HttpTransport(policy=RetryPolicy(max_retry_after_s=60)).request("PUT", URL)
+
+        assert sleeps == [60]
+
+    @responses.activate
+    def test_client_error_returned_without_retry(self, sleeps):
+        responses.put(URL, status=404)
+
+        assert HttpTransport().request("PUT", URL).status_code == 404
+        assert sleeps == []
+
+    @responses.activate
+    def test_no_retry_past_deadline(self, sleeps):
+        responses.put(URL, status=503)
+        transport = HttpTransport(policy=RetryPolicy(server_error_backoff_s=(0.01, 5.0)), breaker_threshold=10)
+
+        resp = transport.request("PUT", URL, deadline=time.monotonic() + 1)
+
+        assert resp.status_code == 503
+        assert sleeps == [0.01]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_timeout_capped_to_deadline(self, monkeypatch):
+        responses.get(URL, status=200)
+        transport = HttpTransport(timeout_s=60)
+        send = transport.session.send
+        captured = {}
+
+        def spy(request, **kwargs):
+            captured.update(kwargs)
+            return send(request, **kwargs)
+
+        monkeypatch.setattr(transport.session, "send", spy)
+
+        transport.request("GET", URL, deadline=time.monotonic() + 5)
+
+        assert 0 < captured["timeout"] <= 5
+
+    @responses.activate
+    def test_passed_deadline_sends_nothing(self):
+        with pytest.raises(requests.Timeout):
+            HttpTransport().request("GET", URL, deadline=time.monotonic() - 1)
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_default_timeout_applied(self, monkeypatch):
+        responses.get(URL, status=200)
+        transport = HttpTransport(timeout_s=3)
+        send = transport.session.send
+        captured = {}
+
+        def spy(request, **kwargs):
+            captured.update(kwargs)
+            return send(request, **kwargs)
+
+        monkeypatch.setattr(transport.session, "send", spy)
+
+        transport.request("GET", URL)
+
+        assert captured["timeout"] == 3
+
+
+class TestCircuitBreaker:
+    @responses.activate
+    def test_opens_after_consecutive_failures_and_fails_fast(self, sleeps):
+        responses.put(URL, status=502)
+        transport = HttpTransport(breaker_threshold=2, breaker_cooldown_s=300)
+
+        assert transport.request("PUT", URL).status_code == 502
+        with pytest.raises(CircuitOpenError):
+            transport.request("PUT", URL)
+
+        assert len(responses.calls) == 2
+        counters = transport.counters()
+        assert counters.circuit_opened == 1
+        assert counters.circuit_rejected == 1
+
+    @responses.activate
+    def test_trial_request_after_cooldown_closes_circuit(self, sleeps, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("bawue_scraper.adapters.http_transport.time.monotonic", lambda: clock[0])
+        responses.put(URL, status=502)
+        responses.put(URL, status=201)
+        transport = HttpTransport(breaker_threshold=1, breaker_cooldown_s=300)
+        transport.request("PUT", URL)
+
+        clock[0] += 301
+        resp = transport.request("PUT", URL)
+
+        assert resp.status_code == 201
+        assert transport.counters().circuit_open_s == pytest.approx(301)
+
+    @responses.activate
+    def test_circuits_are_per_host(self, sleeps):
+        responses.put(URL, status=502)
+        responses.get("http://other.example/", status=200)
+        transport = HttpTransport(breaker_threshold=1)
+        transport.request("PUT", URL)
+
+        assert transport.request("GET", "http://other.example/").status_code == 200
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after("12") == 12
+
+    def test_http_date_in_the_past(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        assert _parse_retry_after(value) is None
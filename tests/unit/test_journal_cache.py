@@ -0,0 +1,108 @@
+"""Tests for the journal-based cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bawue_scraper.adapters.cache_manager import CacheManager
+from bawue_scraper.adapters.journal_cache import JournalCache
+
+
+@pytest.fixture()
+def cache_dir(tmp_cache_config):
+    return Path(tmp_cache_config.cache_dir)
+
+
+class TestJournalCache:
+    def test_mark_invalidate_and_replay(self, tmp_cache_config):
+        cache = JournalCache(tmp_cache_config)
+        cache.mark_processed("V-1")
+        cache.mark_processed_many(["V-2", "V-3"])
+        cache.invalidate("V-2")
+
+        reopened = JournalCache(tmp_cache_config)
+        assert [reopened.is_processed(v) for v in ("V-1", "V-2", "V-3")] == [True, False, True]
+
+    def test_one_record_per_change(self, tmp_cache_config, cache_dir):
+        cache = JournalCache(tmp_cache_config)
+        cache.mark_processed("V-1")
+        cache.mark_processed("V-1")
+        cache.invalidate("V-9")
+
+        lines = (cache_dir / "processed.journal").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [["+", "V-1"]]
+
+    def test_partial_last_record_skipped_and_cut(self, tmp_cache_config, cache_dir):
+        JournalCache(tmp_cache_config).mark_processed("V-1")
+        with (cache_dir / "processed.journal").open("a", encoding="utf-8") as f:
+            f.write('["+", "V-')
+
+        cache = JournalCache(tmp_cache_config)
+        cache.mark_processed("V-2")
+
+        reopened = JournalCache(tmp_cache_config)
+        assert reopened.is_processed("V-1") and reopened.is_processed("V-2")
+
+    def test_compaction_writes_snapshot_and_starts_new_journal(self, tmp_cache_config, cache_dir, monkeypatch):
+        monkeypatch.setattr(tmp_cache_config, "cache_compact_records", 3)
+        cache = JournalCache(tmp_cache_config)
+        cache.mark_processed_many(["V-1", "V-2", "V-3"])
+        cache.mark_processed("V-4")
+        cache.flush()
+
+        snapshot = json.loads((cache_dir / "processed.json").read_text(encoding="utf-8"))
+        assert snapshot == {"V-1": None, "V-2": None, "V-3": None}
+        assert not (cache_dir / "processed.journal.old").exists()
+        assert (cache_dir / "processed.journal").read_text(encoding="utf-8").splitlines() == ['["+", "V-4"]']
+        assert JournalCache(tmp_cache_config).is_processed("V-4")
+
+    def test_interrupted_compaction_recovered(self, tmp_cache_config, cache_dir):
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text('["V-1"]', encoding="utf-8")
+        (cache_dir / "processed.journal.old").write_text('["+", "V-2"]\n["-", "V-1"]\n', encoding="utf-8")
+        (cache_dir / "processed.journal").write_text('["+", "V-3"]\n', encoding="utf-8")
+
+        cache = JournalCache(tmp_cache_config)
+
+        assert [cache.is_processed(v) for v in ("V-1", "V-2", "V-3")] == [False, True, True]
+        assert not (cache_dir / "processed.journal.old").exists()
+        assert json.loads((cache_dir / "processed.json").read_text(encoding="utf-8")) == {"V-2": None, "V-3": None}
+
+    def test_reads_json_cache_snapshot(self, tmp_cache_config):
+        CacheManager(tmp_cache_config).mark_processed("V-1")
+
+        assert JournalCache(tmp_cache_config).is_processed("V-1")
+
+    def test_batch_appends_once_on_exit(self, tmp_cache_config, cache_dir):
+        cache = JournalCache(tmp_cache_config)
+        journal = cache_dir / "processed.journal"
+
+        with cache.batch():
+            cache.mark_processed("V-1")
+            cache.mark_processed("V-2")
+            cache.invalidate("V-1")
+            assert cache.filter_unprocessed(["V-1", "V-2"]) == ["V-1"]
+            assert journal.read_text(encoding="utf-8") == ""
+
+        lines = journal.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [["+", "V-1"], ["+", "V-2"], ["-", "V-1"]]
+        assert JournalCache(tmp_cache_config).is_processed("V-2")
+
+    def test_source_fingerprints_replayed(self, tmp_cache_config, cache_dir):
+        cache = JournalCache(tmp_cache_config)
+        cache.mark_processed("V-1", source_fingerprint="a")
+        cache.mark_processed("V-1")
+        cache.mark_processed("V-1", source_fingerprint="b")
+        cache.mark_processed("V-2")
+        cache.filter_unprocessed(["V-2"], source_fingerprints={"V-2": "c"})
+
+        lines = (cache_dir / "processed.journal").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            ["+", "V-1", "a"],
+            ["+", "V-1", "b"],
+            ["+", "V-2"],
+            ["+", "V-2", "c"],
+        ]
+        reopened = JournalCache(tmp_cache_config)
+        assert reopened.filter_unprocessed(["V-1", "V-2"], source_fingerprints={"V-1": "b", "V-2": "d"}) == ["V-2"]
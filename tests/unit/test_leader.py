@@ -0,0 +1,54 @@
+"""Tests for leader election on top of a RunLock."""
+
+import threading
+from unittest.mock import MagicMock
+
+from bawue_scraper.leader import LeaderLease
+
+
+class TestLeaderLease:
+    def test_acquire_renews_until_released(self):
+        lock = MagicMock()
+        lock.try_acquire.return_value = True
+        lock.renew.return_value = True
+        lease = LeaderLease(lock, "a", 0.03, on_lost=MagicMock())
+
+        assert lease.acquire()
+        threading.Event().wait(0.1)
+        lease.release()
+
+        assert lock.renew.call_count >= 2
+        lock.release.assert_called_once_with("a")
+
+    def test_refused_renewal_calls_on_lost(self):
+        lock = MagicMock()
+        lock.try_acquire.return_value = True
+        lock.renew.return_value = False
+        lost = threading.Event()
+        lease = LeaderLease(lock, "a", 0.03, on_lost=lost.set)
+
+        lease.acquire()
+
+        assert lost.wait(1)
+        lease.release()
+
+    def test_renewal_errors_tolerated_until_lease_expires(self):
+        lock = MagicMock()
+        lock.try_acquire.return_value = True
+        lock.renew.side_effect = OSError("disk busy")
+        lost = threading.Event()
+        lease = LeaderLease(lock, "a", 0.06, on_lost=lost.set)
+
+        lease.acquire()
+
+        assert not lost.wait(0.03)
+        assert lost.wait(1)
+        lease.release()
+
+    def test_wait_returns_false_when_stopped(self):
+        lock = MagicMock()
+        lock.try_acquire.return_value = False
+        stop = threading.Event()
+        stop.set()
+
+        assert not LeaderLease(lock, "a", 60, on_lost=MagicMock()).wait(stop)
@@ -1,14 +1,30 @@
 """Tests for the LTZF API client."""
 
+import gzip
+import json
 import logging
+import zlib
+from datetime import date, timedelta
 
 import pytest
+import requests
 import responses
+from responses import matchers
 
+from bawue_scraper.adapters.http_transport import RetryPolicy
 from bawue_scraper.adapters.ltzf_client import LtzfClient
+from bawue_scraper.adapters.sqlite_outbox import SqliteOutbox
 from bawue_scraper.config import Config
+from bawue_scraper.domain.serialization import to_json_bytes
 
 VORGANG_URL = "http://localhost:8080/api/v2/vorgang"
+KALENDER_URL = "http://localhost:8080/api/v2/kalender/BW"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Skip retry backoff sleeps."""
+    monkeypatch.setattr("bawue_scraper.adapters.http_transport.time.sleep", lambda s: None)
 
 
 class TestLtzfClientSubmitVorgang:
@@ -52,6 +68,20 @@ class TestLtzfClientSubmitVorgang:
         expected_body = sample_vorgang.model_dump(mode="json", exclude_none=True)
         assert sent_body == expected_body
 
+    def test_submit_vorgang_sets_timeout(self, config, sample_vorgang, monkeypatch):
+        monkeypatch.setattr(config, "ltzf_timeout_s", 12.5)
+        client = LtzfClient(config)
+        captured = {}
+
+        def fake_request(method, url, **kwargs):
+            captured.update(kwargs)
+            return type("Resp", (), {"status_code": 201})()
+
+        client._session.request = fake_request
+        client.submit_vorgang(sample_vorgang)
+
+        assert captured["timeout"] == 12.5
+
     @responses.activate
     @pytest.mark.parametrize("status_code", [400, 403, 500])
     def test_submit_vorgang_error_status_returns_false(self, config, sample_vorgang, status_code):
@@ -73,7 +103,7 @@ class TestLtzfClientSubmitVorgang:
 
         import requests as req
 
-        client._session.put = lambda *a, **kw: (_ for _ in ()).throw(req.ConnectionError("Connection refused"))
+        client._session.request = lambda *a, **kw: (_ for _ in ()).throw(req.ConnectionError("Connection refused"))
 
         with caplog.at_level(logging.ERROR):
             result = client.submit_vorgang(sample_vorgang)
@@ -84,6 +114,298 @@ class TestLtzfClientSubmitVorgang:
         assert "Traceback" not in caplog.text
 
 
+class TestLtzfClientSubmitSitzungen:
+    @responses.activate
+    def test_puts_sitzungen_of_the_date(self, config, sample_sitzung):
+        datum = date.today()
+        responses.put(f"{KALENDER_URL}/{datum.isoformat()}", status=201)
+
+        assert LtzfClient(config).submit_sitzungen(datum, [sample_sitzung]) is True
+
+        body = json.loads(responses.calls[0].request.body)
+        assert body == [sample_sitzung.model_dump(mode="json", exclude_none=True)]
+
+    @responses.activate
+    def test_dates_beyond_collector_scope_not_sent(self, config, sample_sitzung):
+        assert LtzfClient(config).submit_sitzungen(date.today() + timedelta(days=2), [sample_sitzung]) is False
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_rejected_submission_returns_false(self, config, sample_sitzung):
+        datum = date.today()
+        responses.put(f"{KALENDER_URL}/{datum.isoformat()}", status=422)
+
+        assert LtzfClient(config).submit_sitzungen(datum, [sample_sitzung]) is False
+
+    @responses.activate
+    def test_unavailable_backend_queues_in_outbox(self, config, sample_sitzung, tmp_path, monkeypatch):
+        datum = date.today()
+        responses.put(f"{KALENDER_URL}/{datum.isoformat()}", status=503)
+        monkeypatch.setattr(config, "cache_dir", str(tmp_path / "cache"))
+        outbox = SqliteOutbox(config)
+
+        assert LtzfClient(config, outbox=outbox).submit_sitzungen(datum, [sample_sitzung]) is True
+        assert outbox.count() == 1
+
+
+class TestLtzfClientReadVorgaenge:
+    @responses.activate
+    def test_pages_until_short_page(self, config, monkeypatch):
+        monkeypatch.setattr(LtzfClient, "_READ_PAGE_SIZE", 2)
+        responses.get(
+            VORGANG_URL,
+            match=[matchers.query_param_matcher({"p": "BW", "wp": "17", "per_page": "2"})],
+            json=[{"n": 1}, {"n": 2}],
+        )
+        responses.get(
+            VORGANG_URL,
+            match=[matchers.query_param_matcher({"p": "BW", "wp": "17", "per_page": "2", "page": "2"})],
+            json=[{"n": 3}],
+        )
+
+        assert [v["n"] for v in LtzfClient(config).iter_vorgaenge(17)] == [1, 2, 3]
+
+    @responses.activate
+    def test_follows_link_header(self, config, monkeypatch):
+        monkeypatch.setattr(LtzfClient, "_READ_PAGE_SIZE", 1)
+        next_url = f"{VORGANG_URL}?cursor=abc"
+        responses.get(
+            VORGANG_URL,
+            match=[matchers.query_param_matcher({"cursor": "abc"})],
+            status=204,
+        )
+        responses.get(VORGANG_URL, json=[{"n": 1}], headers={"Link": f'<{next_url}>; rel="next"'})
+
+        assert [v["n"] for v in LtzfClient(config).iter_vorgaenge(17)] == [1]
+        assert responses.calls[1].request.url == next_url
+
+    @responses.activate
+    def test_no_content_yields_nothing(self, config):
+        responses.get(VORGANG_URL, status=204)
+
+        assert list(LtzfClient(config).iter_vorgaenge(17)) == []
+
+    @responses.activate
+    def test_client_error_raises(self, config):
+        responses.get(VORGANG_URL, status=400)
+
+        with pytest.raises(requests.HTTPError):
+            list(LtzfClient(config).iter_vorgaenge(17))
+
+
+class TestLtzfClientRetries:
+    @responses.activate
+    def test_server_error_retried_until_success(self, config, sample_vorgang):
+        responses.put(VORGANG_URL, status=503)
+        responses.put(VORGANG_URL, status=201)
+        client = LtzfClient(config)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert len(responses.calls) == 2
+        assert client.counters()["retries"] == 1
+
+    @responses.activate
+    def test_client_error_not_retried(self, config, sample_vorgang):
+        responses.put(VORGANG_URL, status=400)
+        client = LtzfClient(config)
+
+        assert client.submit_vorgang(sample_vorgang) is False
+        assert len(responses.calls) == 1
+
+
+class TestLtzfClientOutbox:
+    @pytest.fixture()
+    def outbox(self, config, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "cache_dir", str(tmp_path / "cache"))
+        return SqliteOutbox(config)
+
+    @responses.activate
+    def test_unavailable_backend_queues_payload(self, config, sample_vorgang, outbox):
+        responses.put(VORGANG_URL, status=503)
+        client = LtzfClient(config, outbox=outbox)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        [entry] = outbox.due(10)
+        assert entry.key == f"vorgang:{sample_vorgang.api_id}"
+        assert json.loads(entry.body) == sample_vorgang.model_dump(mode="json", exclude_none=True)
+        assert client.counters()["outboxed"] == 1
+
+    @responses.activate
+    def test_retries_stop_in_time_to_queue_within_deadline(self, config, sample_vorgang, outbox, monkeypatch):
+        monkeypatch.setattr(config, "submission_deadline_s", 6.0)
+        responses.put(VORGANG_URL, status=503)
+        client = LtzfClient(config, outbox=outbox)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        # The 5 s backoff fits into the deadline, the 10 s one does not
+        assert len(responses.calls) == 2
+        assert outbox.count() == 1
+
+    @responses.activate
+    def test_client_error_not_queued(self, config, sample_vorgang, outbox):
+        responses.put(VORGANG_URL, status=422)
+        client = LtzfClient(config, outbox=outbox)
+
+        assert client.submit_vorgang(sample_vorgang) is False
+        assert outbox.count() == 0
+
+    @responses.activate
+    def test_replay_delivers_and_removes(self, config, sample_vorgang, outbox):
+        outbox.put("vorgang:1", VORGANG_URL, b'{"titel": "x"}')
+        responses.put(VORGANG_URL, status=201)
+        client = LtzfClient(config, outbox=outbox)
+
+        assert client.replay_pending() == 1
+        assert outbox.count() == 0
+        assert responses.calls[0].request.body == b'{"titel": "x"}'
+
+    @responses.activate
+    def test_replay_stops_while_backend_unavailable(self, config, outbox):
+        outbox.put("vorgang:1", VORGANG_URL, b"{}")
+        outbox.put("vorgang:2", VORGANG_URL, b"{}")
+        responses.put(VORGANG_URL, status=503)
+        client = LtzfClient(config, outbox=outbox)
+
+        assert client.replay_pending() == 0
+        assert outbox.count() == 2
+        # The failed entry is backed off; the second was not attempted
+        assert [e.key for e in outbox.due(10)] == ["vorgang:2"]
+
+    @responses.activate
+    def test_replay_drops_rejected_entry(self, config, outbox):
+        outbox.put("vorgang:1", VORGANG_URL, b"{}")
+        responses.put(VORGANG_URL, status=400)
+
+        assert LtzfClient(config, outbox=outbox).replay_pending() == 0
+        assert outbox.count() == 0
+
+
+class TestLtzfClientCompression:
+    @pytest.fixture()
+    def gzip_config(self, config, monkeypatch):
+        monkeypatch.setattr(config, "ltzf_request_compression", "gzip")
+        monkeypatch.setattr(config, "ltzf_compression_min_bytes", 0)
+        return config
+
+    @responses.activate
+    def test_large_body_sent_gzipped(self, gzip_config, sample_vorgang):
+        responses.put(VORGANG_URL, status=201)
+        client = LtzfClient(gzip_config)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        sent = json.loads(gzip.decompress(request.body))
+        assert sent == sample_vorgang.model_dump(mode="json", exclude_none=True)
+        counters = client.counters()
+        assert counters["bytes_sent"] == len(request.body)
+        assert counters["bytes_raw"] == len(gzip.decompress(request.body))
+
+    @responses.activate
+    def test_deflate_uses_zlib_format(self, gzip_config, sample_vorgang, monkeypatch):
+        monkeypatch.setattr(gzip_config, "ltzf_request_compression", "deflate")
+        responses.put(VORGANG_URL, status=201)
+
+        LtzfClient(gzip_config).submit_vorgang(sample_vorgang)
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "deflate"
+        assert json.loads(zlib.decompress(request.body))["titel"] == sample_vorgang.titel
+
+    @responses.activate
+    def test_small_body_sent_uncompressed(self, gzip_config, sample_vorgang, monkeypatch):
+        monkeypatch.setattr(gzip_config, "ltzf_compression_min_bytes", 10_000_000)
+        responses.put(VORGANG_URL, status=201)
+
+        LtzfClient(gzip_config).submit_vorgang(sample_vorgang)
+
+        assert "Content-Encoding" not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_unsupported_encoding_falls_back_to_uncompressed(self, gzip_config, sample_vorgang):
+        responses.put(VORGANG_URL, status=415)
+        responses.put(VORGANG_URL, status=201)
+        responses.put(VORGANG_URL, status=201)
+        client = LtzfClient(gzip_config)
+
+        assert client.submit_vorgang(sample_vorgang) is True
+        assert client.submit_vorgang(sample_vorgang) is True
+
+        encodings = [call.request.headers.get("Content-Encoding") for call in responses.calls]
+        assert encodings == ["gzip", None, None]
+
+
+class TestLtzfClientStreaming:
+    @pytest.fixture()
+    def stream_config(self, fake_ltzf_config, monkeypatch):
+        monkeypatch.setattr(fake_ltzf_config, "ltzf_stream_min_bytes", 1)
+        return fake_ltzf_config
+
+    @pytest.fixture()
+    def large_vorgang(self, sample_vorgang, sample_station, sample_dokument):
+        dokumente = [
+            sample_dokument.model_copy(update={"hash": f"hash-{i}", "volltext": "Beschlussempfehlung äöü " * 20_000})
+            for i in range(3)
+        ]
+        return sample_vorgang.model_copy(
+            update={"stationen": [sample_station.model_copy(update={"dokumente": dokumente})]}
+        )
+
+    def test_large_vorgang_sent_chunked(self, stream_config, fake_ltzf, large_vorgang):
+        client = LtzfClient(stream_config)
+
+        assert client.submit_vorgang(large_vorgang) is True
+
+        [submission] = fake_ltzf.submissions
+        assert submission.headers["Transfer-Encoding"] == "chunked"
+        assert submission.payload == large_vorgang.model_dump(mode="json", exclude_none=True)
+        assert client.counters()["streamed"] == 1
+
+    def test_small_vorgang_not_streamed(self, stream_config, fake_ltzf, sample_vorgang, monkeypatch):
+        monkeypatch.setattr(stream_config, "ltzf_stream_min_bytes", 10_000_000)
+
+        LtzfClient(stream_config).submit_vorgang(sample_vorgang)
+
+        [submission] = fake_ltzf.submissions
+        assert "Transfer-Encoding" not in submission.headers
+
+    def test_spooled_body_sent_with_length(self, stream_config, fake_ltzf, large_vorgang, monkeypatch):
+        monkeypatch.setattr(stream_config, "ltzf_stream_spool", True)
+        monkeypatch.setattr(stream_config, "ltzf_request_compression", "gzip")
+        client = LtzfClient(stream_config)
+
+        assert client.submit_vorgang(large_vorgang) is True
+
+        [submission] = fake_ltzf.submissions
+        assert int(submission.headers["Content-Length"]) == submission.body_bytes
+        assert submission.headers["Content-Encoding"] == "gzip"
+        assert submission.payload["titel"] == large_vorgang.titel
+        counters = client.counters()
+        assert counters["bytes_sent"] == submission.body_bytes < counters["bytes_raw"]
+
+    @pytest.mark.parametrize("spool", [False, True])
+    def test_retry_resends_whole_body(self, stream_config, fake_ltzf, large_vorgang, monkeypatch, spool):
+        monkeypatch.setattr(stream_config, "ltzf_stream_spool", spool)
+        fake_ltzf.fail_next(503)
+        client = LtzfClient(stream_config, retry_policy=RetryPolicy(server_error_backoff_s=(0.01,)))
+
+        assert client.submit_vorgang(large_vorgang) is True
+
+        assert [s.status for s in fake_ltzf.submissions] == [503, 201]
+        assert fake_ltzf.submissions[0].body_bytes == fake_ltzf.submissions[1].body_bytes
+
+    def test_unavailable_backend_queues_assembled_body(self, stream_config, fake_ltzf, large_vorgang):
+        fake_ltzf.fail_next(503, times=10)
+        outbox = SqliteOutbox(stream_config)
+        client = LtzfClient(stream_config, outbox=outbox, retry_policy=RetryPolicy(server_error_backoff_s=()))
+
+        assert client.submit_vorgang(large_vorgang) is True
+
+        [entry] = outbox.due(10)
+        assert entry.body == to_json_bytes(large_vorgang)
+
+
 class TestLtzfClientRedirectPolicy:
     def test_redirects_disabled_by_default(self, config):
         """Default config should set max_redirects=0 to prevent API key leakage."""
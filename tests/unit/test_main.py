@@ -1,34 +1,72 @@
 """Tests for CLI argument wiring in __main__.py."""
 
+import signal
 from datetime import date
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from bawue_scraper.__main__ import main
+from bawue_scraper.__main__ import EXIT_DRAINED, EXIT_OK, main
 
 
 @pytest.fixture()
-def wired_main():
+def wired_main(mocker):
     """Patch all adapter classes for main() testing."""
+    # One more patch in the with statement below would exceed Python's limit of nested blocks
+    mock_revalidation = mocker.patch("bawue_scraper.__main__.SqliteRevalidationStore")
     with (
         patch("bawue_scraper.__main__.Config") as mock_config_cls,
-        patch("bawue_scraper.__main__.ParlisAdapter"),
+        patch("bawue_scraper.__main__.ParlisAdapter") as mock_parlis,
         patch("bawue_scraper.__main__.PdfExtractor"),
         patch("bawue_scraper.__main__.IcsAdapter"),
         patch("bawue_scraper.__main__.LtzfClient") as mock_ltzf,
         patch("bawue_scraper.__main__.LoggingLtzfClient") as mock_logging_ltzf,
-        patch("bawue_scraper.__main__.CacheManager"),
+        patch("bawue_scraper.__main__.NdjsonFileSink") as mock_sink,
+        patch("bawue_scraper.__main__.upload_exports") as mock_upload,
+        patch("bawue_scraper.__main__.bootstrap_cache") as mock_bootstrap,
+        patch("bawue_scraper.__main__.CacheManager") as mock_cache_manager,
+        patch("bawue_scraper.__main__.SqliteCache") as mock_sqlite_cache,
+        patch("bawue_scraper.__main__.JournalCache") as mock_journal_cache,
+        patch("bawue_scraper.__main__.FileCheckpoint"),
+        patch("bawue_scraper.__main__.SqliteWorkQueue") as mock_queue_cls,
+        patch("bawue_scraper.__main__.SqliteRateLimiter"),
+        patch("bawue_scraper.__main__.SqliteOutbox"),
+        patch("bawue_scraper.__main__.SqliteFingerprintStore"),
+        patch("bawue_scraper.__main__.FileRunLock") as mock_lock_cls,
         patch("bawue_scraper.__main__.Orchestrator") as mock_orch_cls,
+        patch("bawue_scraper.__main__.Scheduler") as mock_scheduler_cls,
     ):
-        mock_config_cls.return_value = MagicMock(log_level="INFO", ltzf_mode="dry-run", scrape_lookback_days=7)
-        mock_orch_cls.return_value = MagicMock()
+        mock_config_cls.return_value = MagicMock(
+            log_level="INFO",
+            ltzf_mode="dry-run",
+            scrape_lookback_days=7,
+            run_lock_backend="file",
+            run_lock_lease_s=60,
+            cache_backend="json",
+            revalidate_interval_days={"Gesetzgebung": 3.0},
+            revalidate_answer_due_days=21.0,
+        )
+        mock_lock_cls.return_value.try_acquire.return_value = True
+        mock_orch_cls.return_value = MagicMock(stop_requested=False)
         yield {
             "config_cls": mock_config_cls,
             "orch_cls": mock_orch_cls,
             "orch": mock_orch_cls.return_value,
+            "parlis": mock_parlis,
             "ltzf": mock_ltzf,
             "logging_ltzf": mock_logging_ltzf,
+            "sink": mock_sink,
+            "upload": mock_upload,
+            "bootstrap": mock_bootstrap,
+            "cache_manager": mock_cache_manager,
+            "sqlite_cache": mock_sqlite_cache,
+            "journal_cache": mock_journal_cache,
+            "revalidation": mock_revalidation,
+            "queue_cls": mock_queue_cls,
+            "scheduler_cls": mock_scheduler_cls,
+            "lock": mock_lock_cls.return_value,
         }
 
 
@@ -53,6 +91,11 @@ class TestMainWiresArgs:
 
         wired_main["orch"].run.assert_called_once_with()
 
+    def test_time_budget_passed_to_run(self, wired_main):
+        main(["--time-budget", "1800"])
+
+        wired_main["orch"].run.assert_called_once_with(time_budget_s=1800.0)
+
     def test_vorgaenge_only_with_type_passes_args(self, wired_main):
         main(["--vorgaenge-only", "--type", "Antrag"])
 
@@ -61,6 +104,142 @@ class TestMainWiresArgs:
         assert call_kwargs["vorgangstypen"] == ["Antrag"]
 
 
+class TestWorkQueueCommands:
+    def test_plan_command_enqueues_work(self, wired_main):
+        main(["--type", "Antrag", "plan"])
+
+        wired_main["orch"].plan_work.assert_called_once()
+        call_kwargs = wired_main["orch"].plan_work.call_args[1]
+        assert call_kwargs["vorgangstypen"] == ["Antrag"]
+        wired_main["orch"].run.assert_not_called()
+
+    def test_worker_command_runs_worker(self, wired_main):
+        main(["worker", "--worker-id", "w1", "--exit-when-empty"])
+
+        wired_main["orch"].run_worker.assert_called_once()
+        call_kwargs = wired_main["orch"].run_worker.call_args[1]
+        assert call_kwargs["worker_id"] == "w1"
+        assert call_kwargs["exit_when_empty"] is True
+        wired_main["orch"].run.assert_not_called()
+
+    def test_replay_command_replays_outbox(self, wired_main):
+        wired_main["logging_ltzf"].return_value.replay_pending.return_value = 3
+
+        main(["replay"])
+
+        wired_main["logging_ltzf"].return_value.replay_pending.assert_called_once_with()
+        wired_main["orch"].run.assert_not_called()
+
+    def test_bootstrap_command_loads_cache_from_ltzf(self, wired_main):
+        assert main(["bootstrap"]) == EXIT_OK
+
+        client = wired_main["ltzf"].return_value
+        wired_main["bootstrap"].assert_called_once()
+        assert wired_main["bootstrap"].call_args.args[0] is client.iter_vorgaenge.return_value
+        wired_main["orch"].run.assert_not_called()
+
+    def test_bootstrap_read_failure_exits_tempfail(self, wired_main):
+        wired_main["bootstrap"].side_effect = requests.ConnectionError("down")
+
+        assert main(["bootstrap"]) == EXIT_DRAINED
+
+    def test_upload_command_uploads_given_files_with_real_client(self, wired_main):
+        main(["upload", "--concurrency", "4", "a.ndjson.gz"])
+
+        args, kwargs = wired_main["upload"].call_args
+        assert args == ([Path("a.ndjson.gz")], wired_main["ltzf"].return_value)
+        assert kwargs["concurrency"] == 4
+        wired_main["orch_cls"].assert_not_called()
+        wired_main["lock"].try_acquire.assert_not_called()
+
+    def test_upload_builds_no_scraper_state(self, wired_main):
+        # The journal cache would truncate and compact the live journal of a running scraper
+        wired_main["config_cls"].return_value.cache_backend = "journal"
+
+        assert main(["upload", "a.ndjson.gz"]) == EXIT_OK
+
+        wired_main["upload"].assert_called_once()
+        for adapter in ("journal_cache", "cache_manager", "sqlite_cache", "revalidation", "parlis"):
+            wired_main[adapter].assert_not_called()
+
+
+class TestDaemonMode:
+    def test_daemon_runs_scheduler(self, wired_main):
+        main(["--daemon", "--vorgaenge-only", "--type", "Gesetzgebung"])
+
+        wired_main["scheduler_cls"].return_value.run_forever.assert_called_once()
+        call_kwargs = wired_main["scheduler_cls"].call_args[1]
+        assert call_kwargs["vorgangstypen"] == ["Gesetzgebung"]
+        assert call_kwargs["include_kalender"] is False
+        wired_main["orch"].run.assert_not_called()
+
+    def test_daemon_passes_time_budget_to_scheduler(self, wired_main):
+        main(["--daemon", "--time-budget", "1800"])
+
+        assert wired_main["scheduler_cls"].call_args.kwargs["time_budget_s"] == 1800.0
+
+    def test_daemon_rejects_date_range(self, wired_main):
+        with pytest.raises(SystemExit):
+            main(["--daemon", "--date-from", "01.01.2026"])
+
+
+class TestGracefulShutdown:
+    def test_sigterm_requests_stop_and_exits_tempfail(self, wired_main):
+        orch = wired_main["orch"]
+
+        def run(**kwargs):
+            signal.raise_signal(signal.SIGTERM)
+            orch.stop_requested = True
+
+        orch.run.side_effect = run
+
+        assert main([]) == EXIT_DRAINED
+        orch.request_stop.assert_called_once_with()
+
+    def test_handlers_restored_after_run(self, wired_main):
+        before = signal.getsignal(signal.SIGTERM)
+
+        assert main([]) == EXIT_OK
+        assert signal.getsignal(signal.SIGTERM) is before
+
+    def test_sigterm_stops_daemon_scheduler(self, wired_main):
+        scheduler = wired_main["scheduler_cls"].return_value
+        scheduler.run_forever.side_effect = lambda: signal.raise_signal(signal.SIGTERM)
+
+        main(["--daemon"])
+
+        scheduler.stop.assert_called_once_with()
+        wired_main["orch"].request_stop.assert_called_once_with()
+
+
+class TestRunLock:
+    def test_run_holds_and_releases_lock(self, wired_main):
+        assert main([]) == EXIT_OK
+        wired_main["orch"].run.assert_called_once()
+        wired_main["lock"].release.assert_called_once()
+
+    def test_run_exits_when_lock_is_held(self, wired_main):
+        wired_main["lock"].try_acquire.return_value = False
+
+        assert main([]) == EXIT_DRAINED
+        wired_main["orch"].run.assert_not_called()
+
+    def test_worker_does_not_take_lock(self, wired_main):
+        main(["worker", "--exit-when-empty"])
+
+        wired_main["lock"].try_acquire.assert_not_called()
+        wired_main["orch"].run_worker.assert_called_once()
+
+    def test_daemon_stands_by_until_lock_is_free(self, wired_main):
+        wired_main["config_cls"].return_value.run_lock_lease_s = 0.03
+        wired_main["lock"].try_acquire.side_effect = [False, False, True]
+
+        main(["--daemon"])
+
+        assert wired_main["lock"].try_acquire.call_count == 3
+        wired_main["scheduler_cls"].return_value.run_forever.assert_called_once()
+
+
 class TestLtzfModeWiring:
     def test_dry_run_mode_uses_logging_client(self, wired_main):
         main([])
@@ -74,3 +253,69 @@ class TestLtzfModeWiring:
 
         wired_main["ltzf"].assert_called_once()
         wired_main["logging_ltzf"].assert_not_called()
+
+    def test_file_mode_uses_ndjson_sink_and_flushes_it(self, wired_main):
+        wired_main["config_cls"].return_value = MagicMock(log_level="INFO", ltzf_mode="file")
+        main([])
+
+        wired_main["sink"].assert_called_once()
+        wired_main["sink"].return_value.flush.assert_called_once_with()
+        wired_main["logging_ltzf"].assert_not_called()
+
+
+class TestCacheBackend:
+    def test_json_backend_by_default(self, wired_main):
+        main([])
+
+        wired_main["cache_manager"].assert_called_once()
+        wired_main["sqlite_cache"].assert_not_called()
+        assert wired_main["orch_cls"].call_args.kwargs["cache"] is wired_main["cache_manager"].return_value
+
+    def test_sqlite_backend(self, wired_main):
+        wired_main["config_cls"].return_value.cache_backend = "sqlite"
+
+        main([])
+
+        wired_main["cache_manager"].assert_not_called()
+        assert wired_main["orch_cls"].call_args.kwargs["cache"] is wired_main["sqlite_cache"].return_value
+
+    def test_journal_backend(self, wired_main):
+        wired_main["config_cls"].return_value.cache_backend = "journal"
+
+        main([])
+
+        assert wired_main["orch_cls"].call_args.kwargs["cache"] is wired_main["journal_cache"].return_value
+
+    def test_journal_backend_refused_for_workers(self, wired_main):
+        wired_main["config_cls"].return_value.cache_backend = "journal"
+
+        with pytest.raises(SystemExit):
+            main(["worker", "--exit-when-empty"])
+
+        wired_main["journal_cache"].assert_not_called()
+        wired_main["orch"].run_worker.assert_not_called()
+
+    def test_journal_backend_refused_without_run_lock(self, wired_main):
+        wired_main["config_cls"].return_value.cache_backend = "journal"
+        wired_main["config_cls"].return_value.run_lock_backend = "none"
+
+        with pytest.raises(SystemExit):
+            main([])
+
+        wired_main["journal_cache"].assert_not_called()
+
+
+class TestRevalidationStore:
+    def test_store_wired_by_default(self, wired_main):
+        main([])
+
+        assert wired_main["orch_cls"].call_args.kwargs["revalidation"] is wired_main["revalidation"].return_value
+
+    def test_no_store_without_policies(self, wired_main):
+        wired_main["config_cls"].return_value.revalidate_interval_days = {}
+        wired_main["config_cls"].return_value.revalidate_answer_due_days = 0
+
+        main([])
+
+        wired_main["revalidation"].assert_not_called()
+        assert wired_main["orch_cls"].call_args.kwargs["revalidation"] is None
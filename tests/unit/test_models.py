@@ -1,6 +1,10 @@
 """Tests for domain models."""
 
+import json
+
+from bawue_scraper.domain.fingerprint import vorgang_fingerprint
 from bawue_scraper.domain.models import Vorgang
+from bawue_scraper.domain.serialization import iter_json_chunks, to_json_bytes
 
 
 class TestVorgang:
@@ -8,3 +12,51 @@ class TestVorgang:
         data = sample_vorgang.model_dump(mode="json")
         restored = Vorgang.model_validate(data)
         assert restored.titel == sample_vorgang.titel
+
+
+class TestToJsonBytes:
+    def test_matches_model_dump(self, sample_vorgang):
+        assert json.loads(to_json_bytes(sample_vorgang)) == sample_vorgang.model_dump(mode="json", exclude_none=True)
+
+    def test_utf8_without_escapes(self, sample_vorgang):
+        vorgang = sample_vorgang.model_copy(update={"titel": "Änderung des Straßengesetzes"})
+        assert "Änderung des Straßengesetzes".encode() in to_json_bytes(vorgang)
+
+
+class TestIterJsonChunks:
+    def test_concatenation_matches_to_json_bytes(self, sample_vorgang, sample_station, sample_dokument):
+        tricky = sample_dokument.model_copy(update={"volltext": 'Zitat "§ 3"\\n\tÄnderung\x01 ' * 50})
+        station = sample_station.model_copy(update={"dokumente": [sample_dokument, tricky], "stellungnahmen": [tricky]})
+        vorgang = sample_vorgang.model_copy(update={"stationen": [station, sample_station]})
+
+        assert b"".join(iter_json_chunks(vorgang, chunk_chars=7)) == to_json_bytes(vorgang)
+
+    def test_chunks_bounded_by_slice_size(self, sample_vorgang, sample_station, sample_dokument):
+        dokument = sample_dokument.model_copy(update={"volltext": "x" * 100_000})
+        vorgang = sample_vorgang.model_copy(
+            update={"stationen": [sample_station.model_copy(update={"dokumente": [dokument] * 5})]}
+        )
+
+        assert max(len(chunk) for chunk in iter_json_chunks(vorgang, chunk_chars=1000)) < 2000
+
+    def test_vorgang_without_stationen(self, sample_vorgang):
+        vorgang = sample_vorgang.model_copy(update={"stationen": []})
+
+        assert b"".join(iter_json_chunks(vorgang)) == to_json_bytes(vorgang)
+
+
+class TestVorgangFingerprint:
+    def test_stable_across_copies(self, sample_vorgang):
+        copy = Vorgang.model_validate(sample_vorgang.model_dump(mode="json"))
+        assert vorgang_fingerprint(copy) == vorgang_fingerprint(sample_vorgang)
+
+    def test_changes_with_content(self, sample_vorgang):
+        changed = sample_vorgang.model_copy(update={"titel": sample_vorgang.titel + " (neu)"})
+        assert vorgang_fingerprint(changed) != vorgang_fingerprint(sample_vorgang)
+
+    def test_streamed_hash_matches(self, sample_vorgang, sample_station, sample_dokument):
+        dokument = sample_dokument.model_copy(update={"volltext": "Ä" * 600_000})
+        station = sample_station.model_copy(update={"dokumente": [dokument, sample_dokument]})
+        vorgang = sample_vorgang.model_copy(update={"stationen": [station]})
+
+        assert vorgang_fingerprint(vorgang, stream_min_bytes=1) == vorgang_fingerprint(vorgang)
@@ -0,0 +1,64 @@
+"""Tests for the NDJSON file sink."""
+
+import gzip
+import json
+from datetime import date
+
+import pytest
+
+from bawue_scraper.adapters.ndjson_sink import NdjsonFileSink
+from bawue_scraper.config import Config
+
+
+@pytest.fixture()
+def sink_config(tmp_path, monkeypatch):
+    """Config pointing export_dir at a tmp_path."""
+    monkeypatch.setenv("EXPORT_DIR", str(tmp_path / "export"))
+    return Config()
+
+
+def _records(path):
+    with gzip.open(path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestNdjsonFileSink:
+    def test_writes_one_line_per_payload(self, sink_config, sample_vorgang, sample_sitzung, tmp_path):
+        sink = NdjsonFileSink(sink_config)
+        assert sink.submit_vorgang(sample_vorgang) is True
+        assert sink.submit_sitzungen(date(2026, 2, 5), [sample_sitzung]) is True
+        sink.flush()
+
+        [path] = list((tmp_path / "export").iterdir())
+        vorgang, kalender = _records(path)
+        assert vorgang == {"kind": "vorgang", "payload": sample_vorgang.model_dump(mode="json", exclude_none=True)}
+        assert kalender["kind"] == "kalender"
+        assert kalender["datum"] == "2026-02-05"
+        assert kalender["payload"] == [sample_sitzung.model_dump(mode="json", exclude_none=True)]
+
+    def test_open_file_is_marked_partial(self, sink_config, sample_vorgang, tmp_path):
+        sink = NdjsonFileSink(sink_config)
+        sink.submit_vorgang(sample_vorgang)
+
+        [open_file] = list((tmp_path / "export").iterdir())
+        assert open_file.name.endswith(".ndjson.gz.partial")
+
+        sink.flush()
+        [finished] = list((tmp_path / "export").iterdir())
+        assert finished.name.endswith(".ndjson.gz")
+
+    def test_rotates_at_size_limit(self, sink_config, sample_vorgang, tmp_path, monkeypatch):
+        monkeypatch.setattr(sink_config, "export_rotate_mb", 1e-6)  # one record per file
+        sink = NdjsonFileSink(sink_config)
+        for _ in range(3):
+            sink.submit_vorgang(sample_vorgang)
+        sink.flush()
+
+        files = sorted((tmp_path / "export").iterdir())
+        assert [len(_records(f)) for f in files] == [1, 1, 1]
+        assert sink.counters()["files"] == 3
+
+    def test_flush_without_writes_creates_no_file(self, sink_config, tmp_path):
+        NdjsonFileSink(sink_config).flush()
+
+        assert list((tmp_path / "export").iterdir()) == []
@@ -1,13 +1,26 @@
 """Tests for the pipeline orchestrator."""
 
 import logging
-from datetime import date, timedelta
-from unittest.mock import patch
+import threading
+from datetime import date, datetime, time, timedelta
+from time import monotonic
+from unittest.mock import ANY, patch
 
 import pytest
 
+from bawue_scraper.adapters.cache_manager import CacheManager
+from bawue_scraper.coalescing import CoalescingBuffer
 from bawue_scraper.domain.enums import Dokumententyp, Stationstyp, Vorgangstyp
-from bawue_scraper.orchestrator import DEFAULT_VORGANGSTYPEN, Orchestrator
+from bawue_scraper.domain.models import Sitzung
+from bawue_scraper.orchestrator import (
+    DEFAULT_VORGANGSTYPEN,
+    WORK_KIND_BUILD,
+    WORK_KIND_SEARCH,
+    Orchestrator,
+    RunStats,
+)
+from bawue_scraper.ports.checkpoint import PendingSearch
+from bawue_scraper.ports.work_queue import WorkUnit
 
 
 @pytest.fixture()
@@ -74,8 +87,8 @@ class TestRunVorgaenge:
 
         assert mock_ltzf_api.submit_vorgang.call_count == 2
         assert mock_cache.mark_processed.call_count == 2
-        mock_cache.mark_processed.assert_any_call("V-001")
-        mock_cache.mark_processed.assert_any_call("V-002")
+        mock_cache.mark_processed.assert_any_call("V-001", source_fingerprint=ANY)
+        mock_cache.mark_processed.assert_any_call("V-002", source_fingerprint=ANY)
 
     def test_skips_cached_vorgaenge(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
         mock_vorgang_source.search.return_value = [
@@ -92,7 +105,7 @@ class TestRunVorgaenge:
         )
 
         assert mock_ltzf_api.submit_vorgang.call_count == 1
-        mock_cache.mark_processed.assert_called_once_with("V-002")
+        mock_cache.mark_processed.assert_called_once_with("V-002", source_fingerprint=ANY)
 
     def test_continues_on_per_vorgang_error(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache, caplog):
         mock_vorgang_source.search.return_value = [
@@ -111,7 +124,7 @@ class TestRunVorgaenge:
 
         assert mock_ltzf_api.submit_vorgang.call_count == 2
         # Only V-002 marked as processed (V-001 errored)
-        mock_cache.mark_processed.assert_called_once_with("V-002")
+        mock_cache.mark_processed.assert_called_once_with("V-002", source_fingerprint=ANY)
         assert "V-001" in caplog.text
 
     def test_multiple_vorgangstypen(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
@@ -160,7 +173,7 @@ class TestRunVorgaenge:
         )
 
         # V-001 returned False, should NOT be marked as processed
-        mock_cache.mark_processed.assert_called_once_with("V-002")
+        mock_cache.mark_processed.assert_called_once_with("V-002", source_fingerprint=ANY)
 
     def test_failed_submit_counted_as_error(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache, caplog):
         mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
@@ -199,6 +212,832 @@ class TestRunVorgaenge:
         assert "2" in caplog.text  # submitted
 
 
+class TestDeadlines:
+    def test_hung_submission_counted_as_timeout(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache, monkeypatch
+    ):
+        monkeypatch.setattr(orchestrator._config, "submission_deadline_s", 0.05)
+        hang = threading.Event()
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: hang.wait() if v.ids == ["V-001"] else True
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+        hang.set()
+
+        assert stats.timeouts == 1
+        assert stats.submitted == 1
+        assert stats.errors == 0
+        mock_cache.mark_processed.assert_called_once_with("V-002", source_fingerprint=ANY)
+
+    def test_hung_extraction_abandons_vorgang(
+        self, orchestrator, mock_vorgang_source, mock_document_extractor, mock_ltzf_api, mock_cache, monkeypatch
+    ):
+        monkeypatch.setattr(orchestrator._config, "extraction_deadline_s", 0.05)
+        hang = threading.Event()
+        mock_document_extractor.extract_text.side_effect = lambda url: hang.wait()
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+        hang.set()
+
+        assert stats.timeouts == 1
+        mock_ltzf_api.submit_vorgang.assert_not_called()
+        mock_cache.mark_processed.assert_not_called()
+
+    def test_vorgang_deadline_covers_all_stages(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache, monkeypatch, caplog
+    ):
+        monkeypatch.setattr(orchestrator._config, "vorgang_deadline_s", 0.05)
+        hang = threading.Event()
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: hang.wait()
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+
+        with caplog.at_level(logging.INFO):
+            orchestrator.run_vorgaenge(
+                vorgangstypen=["Gesetzgebung"],
+                date_from=date(2026, 1, 1),
+                date_to=date(2026, 2, 1),
+            )
+        hang.set()
+
+        assert "timeouts=1" in caplog.text
+        assert "V-001" in caplog.text
+
+
+class TestGracefulStop:
+    def test_stop_defers_remaining_searches(self, orchestrator, mock_vorgang_source, mock_cache, mocker):
+        checkpoint = mocker.MagicMock()
+        checkpoint.load.return_value = []
+        orchestrator._checkpoint = checkpoint
+
+        def search(vorgangstyp, date_from, date_to):
+            orchestrator.request_stop()
+            return []
+
+        mock_vorgang_source.search.side_effect = search
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert orchestrator.stop_requested
+        assert mock_vorgang_source.search.call_count == 1
+        assert stats.deferred == 1
+        assert [p.vorgangstyp for p in checkpoint.save.call_args.args[0]] == ["Antrag"]
+        mock_cache.flush.assert_called_once()
+
+    def test_search_starting_after_stop_is_deferred(self, orchestrator, mock_vorgang_source, mocker):
+        checkpoint = mocker.MagicMock()
+        checkpoint.load.return_value = []
+        orchestrator._checkpoint = checkpoint
+        revalidation = mocker.MagicMock()
+        revalidation.due_since.return_value = {}
+        orchestrator._revalidation = revalidation
+        # The stop arrives after the loop's own check, before the search thread starts
+        cost = mocker.MagicMock()
+        type(cost).estimate_s = mocker.PropertyMock(side_effect=lambda: orchestrator.request_stop() or 0.0)
+        orchestrator._search_cost = cost
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        mock_vorgang_source.search.assert_not_called()
+        assert stats.deferred == 1
+        assert [p.vorgangstyp for p in checkpoint.save.call_args.args[0]] == ["Gesetzgebung"]
+        revalidation.clear_due.assert_not_called()
+
+    def test_in_flight_vorgang_finishes_within_grace(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.return_value = False
+
+        def submit(vorgang):
+            orchestrator.request_stop(grace_s=10)
+            return True
+
+        mock_ltzf_api.submit_vorgang.side_effect = submit
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert stats.submitted == 1
+        mock_cache.mark_processed.assert_called_once_with("V-001", source_fingerprint=ANY)
+
+    def test_in_flight_vorgang_abandoned_after_grace(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        hang = threading.Event()
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+
+        def submit(vorgang):
+            orchestrator.request_stop(grace_s=0.05)
+            hang.wait()
+            return True
+
+        mock_ltzf_api.submit_vorgang.side_effect = submit
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+        hang.set()
+
+        assert stats.timeouts == 1
+        mock_cache.mark_processed.assert_not_called()
+
+    def test_running_search_abandoned_after_grace(self, orchestrator, mock_vorgang_source, mocker):
+        hang = threading.Event()
+        checkpoint = mocker.MagicMock()
+        checkpoint.load.return_value = []
+        orchestrator._checkpoint = checkpoint
+
+        def search(vorgangstyp, date_from, date_to):
+            orchestrator.request_stop(grace_s=0.05)
+            hang.wait(5)
+            return []
+
+        mock_vorgang_source.search.side_effect = search
+
+        started = monotonic()
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+        elapsed = monotonic() - started
+        hang.set()
+
+        assert elapsed < 2
+        assert stats.deferred == 1
+        assert [p.vorgangstyp for p in checkpoint.save.call_args.args[0]] == ["Gesetzgebung"]
+
+    def test_running_search_unit_abandoned_after_grace(self, orchestrator, mock_vorgang_source, mocker):
+        hang = threading.Event()
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [
+            WorkUnit(
+                1,
+                WORK_KIND_SEARCH,
+                {"vorgangstyp": "Gesetzgebung", "date_from": "2026-01-01", "date_to": "2026-01-31"},
+                1,
+            ),
+        ]
+
+        def search(vorgangstyp, date_from, date_to):
+            orchestrator.request_stop(grace_s=0.05)
+            hang.wait(5)
+            return []
+
+        mock_vorgang_source.search.side_effect = search
+
+        started = monotonic()
+        orchestrator.run_worker(queue, "w1")
+        elapsed = monotonic() - started
+        hang.set()
+
+        assert elapsed < 2
+        queue.ack.assert_not_called()
+        assert queue.release.call_args.args[:2] == (1, "w1")
+
+    def test_stop_ends_worker_loop(self, orchestrator, mock_cache, mocker):
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = lambda worker_id, lease_s: orchestrator.request_stop()
+
+        orchestrator.run_worker(queue, worker_id="w1")
+
+        queue.lease.assert_called_once()
+        mock_cache.flush.assert_called_once()
+
+
+class TestPriorityAndTimeBudget:
+    def test_high_priority_types_run_first(self, orchestrator, mock_vorgang_source):
+        mock_vorgang_source.search.return_value = []
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Kleine Anfrage", "Antrag", "Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        searched = [c.args[0] for c in mock_vorgang_source.search.call_args_list]
+        assert searched == ["Gesetzgebung", "Antrag", "Kleine Anfrage"]
+
+    def test_exhausted_budget_defers_searches(self, orchestrator, mock_vorgang_source, mocker):
+        checkpoint = mocker.MagicMock()
+        checkpoint.load.return_value = []
+        orchestrator._checkpoint = checkpoint
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+            time_budget_s=0,
+        )
+
+        mock_vorgang_source.search.assert_not_called()
+        assert stats.deferred == 2
+        saved = checkpoint.save.call_args.args[0]
+        assert [p.vorgangstyp for p in saved] == ["Gesetzgebung", "Antrag"]
+
+    def test_budget_stops_before_record_that_does_not_fit(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = True
+        orchestrator._record_cost.observe(3600)  # records are known to take an hour
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+            time_budget_s=60,
+        )
+
+        mock_ltzf_api.submit_vorgang.assert_not_called()
+        assert stats.deferred == 1
+
+    def test_deferred_search_resumed_first_with_widened_range(self, orchestrator, mock_vorgang_source, mocker):
+        checkpoint = mocker.MagicMock()
+        checkpoint.load.return_value = [
+            PendingSearch("Antrag", date(2025, 12, 1), date(2025, 12, 31)),
+            PendingSearch("Kleine Anfrage", date(2025, 12, 1), date(2025, 12, 31)),
+        ]
+        orchestrator._checkpoint = checkpoint
+        mock_vorgang_source.search.return_value = []
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Große Anfrage", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        calls = [c.args for c in mock_vorgang_source.search.call_args_list]
+        assert calls[0] == ("Antrag", date(2025, 12, 1), date(2026, 2, 1))
+        assert calls[1] == ("Große Anfrage", date(2026, 1, 1), date(2026, 2, 1))
+        # Deferred searches for types not requested this run stay in the checkpoint
+        saved = checkpoint.save.call_args.args[0]
+        assert [p.vorgangstyp for p in saved] == ["Kleine Anfrage"]
+
+
+class TestSearchPrefetch:
+    def test_next_search_runs_while_records_are_submitted(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        next_searched = threading.Event()
+
+        def search(vorgangstyp, date_from, date_to):
+            if vorgangstyp == "Antrag":
+                next_searched.set()
+                return []
+            return [_make_raw_vorgang("V-001")]
+
+        mock_vorgang_source.search.side_effect = search
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: next_searched.wait(1)
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert stats.submitted == 1
+
+    def test_depth_zero_searches_one_type_at_a_time(
+        self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache, monkeypatch
+    ):
+        monkeypatch.setattr(orchestrator._config, "search_prefetch_depth", 0)
+        mock_vorgang_source.search.side_effect = lambda t, f, to: [_make_raw_vorgang(f"V-{t}")]
+        mock_cache.is_processed.return_value = False
+        searches_at_submit = []
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: searches_at_submit.append(
+            mock_vorgang_source.search.call_count
+        )
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert searches_at_submit == [1, 2]
+
+    def test_searches_run_one_at_a_time_in_the_background(self, orchestrator, mock_vorgang_source):
+        active, overlaps, threads = [], [], set()
+
+        def search(*args):
+            active.append(args[0])
+            overlaps.append(len(active) > 1)
+            threads.add(threading.current_thread())
+            active.remove(args[0])
+            return []
+
+        mock_vorgang_source.search.side_effect = search
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag", "Kleine Anfrage"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert overlaps == [False, False, False]
+        assert threading.main_thread() not in threads
+
+
+class TestFingerprints:
+    @pytest.fixture()
+    def store(self, orchestrator, mocker):
+        fingerprints = {}
+        store = mocker.MagicMock()
+        store.get.side_effect = fingerprints.get
+        store.put.side_effect = fingerprints.__setitem__
+        orchestrator._fingerprints = store
+        return fingerprints
+
+    def _run(self, orchestrator):
+        return orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+    def test_unchanged_payload_not_resubmitted(
+        self, orchestrator, store, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        first = self._run(orchestrator)
+        second = self._run(orchestrator)
+
+        assert first.submitted == 1
+        assert (second.submitted, second.unchanged) == (0, 1)
+        mock_ltzf_api.submit_vorgang.assert_called_once()
+        assert mock_cache.mark_processed.call_count == 2
+
+    def test_changed_payload_resubmitted(self, orchestrator, store, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = True
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001", titel="Alt")]
+        self._run(orchestrator)
+
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001", titel="Neu")]
+        stats = self._run(orchestrator)
+
+        assert stats.submitted == 1
+        assert mock_ltzf_api.submit_vorgang.call_count == 2
+
+    def test_failed_submission_not_fingerprinted(
+        self, orchestrator, store, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = False
+
+        self._run(orchestrator)
+
+        assert store == {}
+
+    def test_summary_reports_skipped_unchanged(self):
+        assert "skipped-unchanged=3" in RunStats(unchanged=3).summary()
+
+
+class TestOutboxReplay:
+    def test_outbox_replayed_before_new_submissions(self, orchestrator, mock_vorgang_source, mock_ltzf_api):
+        calls = []
+        mock_ltzf_api.replay_pending.side_effect = lambda: calls.append("replay") or 0
+        mock_vorgang_source.search.side_effect = lambda *args: calls.append("search") or []
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert calls[0] == "replay"
+
+
+class TestConcurrentSubmission:
+    @pytest.fixture()
+    def concurrent_orchestrator(
+        self, config, mock_vorgang_source, mock_document_extractor, mock_calendar_source, mock_ltzf_api, mock_cache
+    ):
+        config.ltzf_submit_concurrency = 4
+        return Orchestrator(
+            config=config,
+            vorgang_source=mock_vorgang_source,
+            document_extractor=mock_document_extractor,
+            calendar_source=mock_calendar_source,
+            ltzf_api=mock_ltzf_api,
+            cache=mock_cache,
+        )
+
+    def test_submissions_overlap(self, concurrent_orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        concurrent_orchestrator._submit_limiter._limit = 2
+        both_in_flight = threading.Barrier(2, timeout=1)
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: both_in_flight.wait() is not None
+
+        stats = concurrent_orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert stats.submitted == 2
+        assert stats.total == 2
+
+    def test_failures_and_skips_counted(self, concurrent_orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang(f"V-{i:03d}") for i in range(6)]
+        mock_cache.is_processed.side_effect = lambda vid: vid == "V-000"
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: v.ids != ["V-001"]
+
+        stats = concurrent_orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+        assert (stats.total, stats.skipped, stats.errors, stats.submitted) == (6, 1, 1, 4)
+
+
+class TestWorkQueueMode:
+    def test_plan_work_enqueues_type_by_month(self, orchestrator, mocker):
+        queue = mocker.MagicMock()
+
+        count = orchestrator.plan_work(queue, ["Gesetzgebung", "Antrag"], date(2026, 1, 15), date(2026, 2, 10))
+
+        assert count == 4
+        kinds = {c.args[0] for c in queue.enqueue.call_args_list}
+        assert kinds == {WORK_KIND_SEARCH}
+        first_payload = queue.enqueue.call_args_list[0].args[1]
+        assert first_payload == {"vorgangstyp": "Gesetzgebung", "date_from": "2026-01-15", "date_to": "2026-01-31"}
+
+    def test_search_unit_fans_out_build_units(self, orchestrator, mock_vorgang_source, mock_cache, mocker):
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [
+            WorkUnit(
+                1,
+                WORK_KIND_SEARCH,
+                {"vorgangstyp": "Gesetzgebung", "date_from": "2026-01-01", "date_to": "2026-01-31"},
+                1,
+            ),
+            None,
+        ]
+        queue.outstanding.return_value = 0
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.side_effect = lambda vid: vid == "V-001"
+
+        orchestrator.run_worker(queue, "w1", exit_when_empty=True)
+
+        queue.enqueue.assert_called_once()
+        assert queue.enqueue.call_args.args[0] == WORK_KIND_BUILD
+        assert queue.enqueue.call_args.kwargs["dedupe_key"] == "build:V-002"
+        queue.ack.assert_called_once_with(1, "w1")
+
+    def test_build_unit_submits_and_acks(self, orchestrator, mock_ltzf_api, mock_cache, mocker):
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [WorkUnit(7, WORK_KIND_BUILD, _make_raw_vorgang("V-001"), 1), None]
+        queue.outstanding.return_value = 0
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        stats = orchestrator.run_worker(queue, "w1", exit_when_empty=True)
+
+        assert stats.submitted == 1
+        mock_cache.mark_processed.assert_called_once_with("V-001", source_fingerprint=ANY)
+        queue.ack.assert_called_once_with(7, "w1")
+
+    def test_failed_build_unit_is_released(self, orchestrator, mock_ltzf_api, mock_cache, mocker):
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [WorkUnit(7, WORK_KIND_BUILD, _make_raw_vorgang("V-001"), 1), None]
+        queue.outstanding.return_value = 0
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = False
+
+        orchestrator.run_worker(queue, "w1", exit_when_empty=True)
+
+        queue.ack.assert_not_called()
+        queue.release.assert_called_once()
+        assert queue.release.call_args.args[:2] == (7, "w1")
+
+
+class TestCoalescing:
+    @pytest.fixture()
+    def coalescing_orchestrator(
+        self, config, mock_vorgang_source, mock_document_extractor, mock_calendar_source, mock_ltzf_api, mock_cache
+    ):
+        config.ltzf_coalesce_window_s = 3600
+        processed = set()
+        mock_cache.is_processed.side_effect = processed.__contains__
+        mock_cache.mark_processed.side_effect = lambda vorgang_id, **_: processed.add(vorgang_id)
+        mock_cache.mark_processed_many.side_effect = lambda vorgang_ids, **_: processed.update(vorgang_ids)
+        return Orchestrator(
+            config=config,
+            vorgang_source=mock_vorgang_source,
+            document_extractor=mock_document_extractor,
+            calendar_source=mock_calendar_source,
+            ltzf_api=mock_ltzf_api,
+            cache=mock_cache,
+        )
+
+    def _run(self, orchestrator):
+        return orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"],
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+    def test_vorgang_found_twice_submitted_once(
+        self, coalescing_orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        first, second = _make_raw_vorgang("V-001")["fundstellen_parsed"]
+        mock_vorgang_source.search.side_effect = [
+            [_make_raw_vorgang("V-001", fundstellen=[first])],
+            [_make_raw_vorgang("V-001", fundstellen=[second])],
+        ]
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        stats = self._run(coalescing_orchestrator)
+
+        mock_ltzf_api.submit_vorgang.assert_called_once()
+        assert len(mock_ltzf_api.submit_vorgang.call_args.args[0].stationen) == 2
+        mock_cache.mark_processed_many.assert_called_once_with(["V-001"], source_fingerprints={"V-001": ANY})
+        assert (stats.total, stats.submitted, stats.coalesced) == (2, 1, 1)
+
+    def test_held_vorgang_found_again_not_rebuilt(
+        self, coalescing_orchestrator, mock_vorgang_source, mock_document_extractor, mock_ltzf_api
+    ):
+        mock_vorgang_source.search.side_effect = [[_make_raw_vorgang("V-001")], [_make_raw_vorgang("V-001")]]
+        mock_document_extractor.extract_text.side_effect = None
+        mock_document_extractor.extract_text.return_value = "Volltext"
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        stats = self._run(coalescing_orchestrator)
+
+        mock_document_extractor.extract_text.assert_called_once()
+        mock_ltzf_api.submit_vorgang.assert_called_once()
+        assert (stats.total, stats.submitted, stats.skipped) == (2, 1, 1)
+
+    def test_held_build_unit_not_rebuilt(self, coalescing_orchestrator, mock_document_extractor, mock_ltzf_api, mocker):
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [
+            WorkUnit(1, WORK_KIND_BUILD, _make_raw_vorgang("V-001"), 1),
+            WorkUnit(2, WORK_KIND_BUILD, _make_raw_vorgang("V-001"), 1),
+            None,
+        ]
+        queue.outstanding.return_value = 0
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        stats = coalescing_orchestrator.run_worker(queue, "w1", exit_when_empty=True)
+
+        mock_document_extractor.extract_text.assert_called_once()
+        assert (stats.submitted, stats.skipped) == (1, 1)
+
+    def test_failed_submission_leaves_vorgang_unprocessed(
+        self, coalescing_orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        mock_vorgang_source.search.side_effect = [[_make_raw_vorgang("V-001")], [_make_raw_vorgang("V-001")]]
+        mock_ltzf_api.submit_vorgang.return_value = False
+
+        stats = self._run(coalescing_orchestrator)
+
+        assert stats.errors == 1
+        mock_cache.mark_processed_many.assert_not_called()
+        mock_cache.mark_processed.assert_not_called()
+
+    def test_held_vorgaenge_submitted_before_cache_flush(
+        self, coalescing_orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        calls = []
+        mock_vorgang_source.search.side_effect = [[_make_raw_vorgang("V-001")], []]
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: calls.append("submit") or True
+        mock_cache.flush.side_effect = lambda: calls.append("flush")
+
+        self._run(coalescing_orchestrator)
+
+        assert calls == ["submit", "flush"]
+
+    def test_worker_does_not_coalesce(self, coalescing_orchestrator, mock_ltzf_api, mocker):
+        calls = []
+        queue = mocker.MagicMock()
+        queue.lease.side_effect = [WorkUnit(1, WORK_KIND_BUILD, _make_raw_vorgang("V-001"), 1), None]
+        queue.outstanding.return_value = 0
+        queue.ack.side_effect = lambda *args: calls.append("ack")
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: calls.append("submit") or True
+
+        stats = coalescing_orchestrator.run_worker(queue, "w1", exit_when_empty=True)
+
+        # The build is submitted before its unit is acked, so a crashing worker cannot lose it
+        assert calls == ["submit", "ack"]
+        assert (stats.submitted, stats.coalesced) == (1, 0)
+
+    def test_summary_reports_coalesced(self):
+        assert "coalesced=2" in RunStats(coalesced=2).summary()
+
+
+class TestCacheBatches:
+    def _run(self, orchestrator, vorgangstypen=("Gesetzgebung",)):
+        return orchestrator.run_vorgaenge(
+            vorgangstypen=list(vorgangstypen),
+            date_from=date(2026, 1, 1),
+            date_to=date(2026, 2, 1),
+        )
+
+    def test_search_results_looked_up_in_one_call(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang(f"V-00{i}") for i in (1, 2, 3)]
+        mock_cache.is_processed.side_effect = lambda vid: vid == "V-002"
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        stats = self._run(orchestrator)
+
+        mock_cache.filter_unprocessed.assert_called_once_with(["V-001", "V-002", "V-003"], source_fingerprints=ANY)
+        assert (stats.total, stats.skipped, stats.submitted) == (3, 1, 2)
+
+    def test_each_search_runs_in_a_batch(self, orchestrator, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        calls = []
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+        mock_cache.batch.return_value.__enter__.side_effect = lambda: calls.append("begin")
+        mock_cache.batch.return_value.__exit__.side_effect = lambda *exc: calls.append("commit")
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: calls.append("submit") or True
+
+        self._run(orchestrator, vorgangstypen=("Gesetzgebung", "Antrag"))
+
+        assert calls == ["begin", "submit", "commit", "begin", "submit", "commit"]
+
+    def test_batch_committed_at_interval(self, orchestrator, config, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        calls = []
+        config.cache_commit_interval_s = 0
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.return_value = False
+        mock_cache.flush.side_effect = lambda: calls.append("flush")
+        mock_ltzf_api.submit_vorgang.side_effect = lambda v: calls.append("submit") or True
+
+        self._run(orchestrator)
+
+        assert calls[:4] == ["submit", "flush", "submit", "flush"]
+
+
+class TestSourceChanges:
+    @pytest.fixture()
+    def cached_orchestrator(
+        self, config, tmp_path, mock_vorgang_source, mock_document_extractor, mock_calendar_source, mock_ltzf_api
+    ):
+        config.cache_dir = str(tmp_path / "cache")
+        return Orchestrator(
+            config=config,
+            vorgang_source=mock_vorgang_source,
+            document_extractor=mock_document_extractor,
+            calendar_source=mock_calendar_source,
+            ltzf_api=mock_ltzf_api,
+            cache=CacheManager(config),
+        )
+
+    def _run(self, orchestrator):
+        return orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1)
+        )
+
+    def test_vorgang_rebuilt_when_fundstelle_added(self, cached_orchestrator, mock_vorgang_source, mock_ltzf_api):
+        first, second = _make_raw_vorgang("V-001")["fundstellen_parsed"]
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001", fundstellen=[first])]
+        assert self._run(cached_orchestrator).submitted == 1
+        # Same Fundstellen: skipped
+        assert self._run(cached_orchestrator).skipped == 1
+        # PARLIS lists a new Fundstelle: built and submitted again
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001", fundstellen=[second, first])]
+        assert self._run(cached_orchestrator).submitted == 1
+        assert len(mock_ltzf_api.submit_vorgang.call_args.args[0].stationen) == 2
+        # Order of the Fundstellen does not matter
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001", fundstellen=[first, second])]
+        assert self._run(cached_orchestrator).skipped == 1
+
+    def test_bootstrapped_vorgang_adopts_fingerprint(self, cached_orchestrator, mock_vorgang_source, mock_ltzf_api):
+        cached_orchestrator._cache.mark_processed("V-001")
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+
+        stats = self._run(cached_orchestrator)
+
+        assert stats.skipped == 1
+        mock_ltzf_api.submit_vorgang.assert_not_called()
+
+
+class TestRevalidation:
+    @pytest.fixture()
+    def revalidation(self, orchestrator, mocker):
+        store = mocker.MagicMock()
+        store.due_since.return_value = {"Gesetzgebung": date(2025, 11, 20)}
+        store.clear_due.return_value = 0
+        orchestrator._revalidation = store
+        return store
+
+    def test_due_type_searched_from_earliest_due(self, orchestrator, revalidation, mock_vorgang_source):
+        mock_vorgang_source.search.return_value = []
+
+        orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung", "Antrag"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1)
+        )
+
+        searched = {call.args[0]: call.args[1] for call in mock_vorgang_source.search.call_args_list}
+        assert searched == {"Gesetzgebung": date(2025, 11, 20), "Antrag": date(2026, 1, 1)}
+
+    def test_found_records_verified_then_unseen_due_cleared(
+        self, orchestrator, revalidation, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        calls = []
+        revalidation.record.side_effect = lambda verifications: calls.append(
+            ("record", [v.vorgang_id for v in verifications])
+        )
+        revalidation.clear_due.side_effect = lambda *args, seen: calls.append(("clear", args[:3], seen)) or 0
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001"), _make_raw_vorgang("V-002")]
+        mock_cache.is_processed.side_effect = lambda vid: vid == "V-001"
+        mock_ltzf_api.submit_vorgang.return_value = True
+
+        orchestrator.run_vorgaenge(vorgangstypen=["Gesetzgebung"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1))
+
+        assert calls == [
+            ("record", ["V-001"]),
+            ("record", ["V-002"]),
+            ("clear", ("Gesetzgebung", date(2025, 11, 20), date(2026, 2, 1)), {"V-001", "V-002"}),
+        ]
+
+    def test_failed_rebuild_stays_due(self, orchestrator, revalidation, mock_vorgang_source, mock_ltzf_api, mock_cache):
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = False
+
+        stats = orchestrator.run_vorgaenge(
+            vorgangstypen=["Gesetzgebung"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1)
+        )
+
+        assert stats.errors == 1
+        revalidation.record.assert_not_called()
+        assert revalidation.clear_due.call_args.kwargs["seen"] == {"V-001"}
+
+    def test_coalesced_records_verified_after_submission(
+        self, orchestrator, revalidation, mock_vorgang_source, mock_ltzf_api, mock_cache
+    ):
+        orchestrator._coalescer = CoalescingBuffer(300)
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+        mock_cache.is_processed.return_value = False
+        mock_ltzf_api.submit_vorgang.return_value = True
+        recorded = []
+        revalidation.record.side_effect = lambda verifications: recorded.extend(v.vorgang_id for v in verifications)
+
+        orchestrator.run_vorgaenge(vorgangstypen=["Gesetzgebung"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1))
+
+        assert recorded == ["V-001"]
+
+    def test_deferred_search_not_cleared(self, orchestrator, revalidation, mock_vorgang_source, mock_cache):
+        orchestrator._config.scrape_time_budget_s = 0
+        mock_vorgang_source.search.return_value = [_make_raw_vorgang("V-001")]
+
+        orchestrator.run_vorgaenge(vorgangstypen=["Gesetzgebung"], date_from=date(2026, 1, 1), date_to=date(2026, 2, 1))
+
+        revalidation.clear_due.assert_not_called()
+
+    def test_plan_work_widens_due_type(self, orchestrator, revalidation, mocker):
+        queue = mocker.MagicMock()
+
+        orchestrator.plan_work(queue, ["Gesetzgebung", "Antrag"], date(2026, 1, 15), date(2026, 1, 31))
+
+        starts = [(call.args[1]["vorgangstyp"], call.args[1]["date_from"]) for call in queue.enqueue.call_args_list]
+        assert starts == [
+            ("Gesetzgebung", "2025-11-20"),
+            ("Gesetzgebung", "2025-12-01"),
+            ("Gesetzgebung", "2026-01-01"),
+            ("Antrag", "2026-01-15"),
+        ]
+
+
 class TestDefaultVorgangstypen:
     def test_contains_all_parlis_types(self):
         assert "Gesetzgebung" in DEFAULT_VORGANGSTYPEN
@@ -209,6 +1048,83 @@ class TestDefaultVorgangstypen:
         assert len(DEFAULT_VORGANGSTYPEN) == 32
 
 
+class TestRunKalender:
+    @staticmethod
+    def _sitzung(sample_sitzung, days_ahead: int, hour: int = 10, nummer: int = 1) -> Sitzung:
+        termin = datetime.combine(date.today() + timedelta(days=days_ahead), time(hour))
+        return sample_sitzung.model_copy(update={"termin": termin, "nummer": nummer})
+
+    def test_one_submission_per_date(self, orchestrator, sample_sitzung, mock_calendar_source, mock_ltzf_api):
+        later = self._sitzung(sample_sitzung, -1, hour=14, nummer=2)
+        earlier = self._sitzung(sample_sitzung, -1, hour=9, nummer=1)
+        today = self._sitzung(sample_sitzung, 0)
+        mock_calendar_source.fetch_sessions.return_value = [today, later, earlier]
+        mock_ltzf_api.submit_sitzungen.return_value = True
+
+        stats = orchestrator.run_kalender()
+
+        assert (stats.total, stats.submitted) == (2, 2)
+        calls = mock_ltzf_api.submit_sitzungen.call_args_list
+        assert calls[0].args == (date.today() - timedelta(days=1), [earlier, later])
+        assert calls[1].args == (date.today(), [today])
+
+    def test_dates_beyond_collector_scope_skipped(
+        self, orchestrator, sample_sitzung, mock_calendar_source, mock_ltzf_api
+    ):
+        mock_calendar_source.fetch_sessions.return_value = [
+            self._sitzung(sample_sitzung, 1),
+            self._sitzung(sample_sitzung, 2),
+        ]
+        mock_ltzf_api.submit_sitzungen.return_value = True
+
+        stats = orchestrator.run_kalender()
+
+        assert (stats.submitted, stats.skipped) == (1, 1)
+        assert mock_ltzf_api.submit_sitzungen.call_args.args[0] == date.today() + timedelta(days=1)
+
+    def test_unchanged_date_not_resubmitted(
+        self, orchestrator, sample_sitzung, mock_calendar_source, mock_ltzf_api, mocker
+    ):
+        fingerprints = {}
+        orchestrator._fingerprints = mocker.MagicMock()
+        orchestrator._fingerprints.get.side_effect = fingerprints.get
+        orchestrator._fingerprints.put.side_effect = fingerprints.__setitem__
+        mock_calendar_source.fetch_sessions.return_value = [self._sitzung(sample_sitzung, 0)]
+        mock_ltzf_api.submit_sitzungen.return_value = True
+
+        orchestrator.run_kalender()
+        second = orchestrator.run_kalender()
+
+        assert (second.submitted, second.unchanged) == (0, 1)
+        mock_ltzf_api.submit_sitzungen.assert_called_once()
+        assert list(fingerprints) == [f"kalender:{date.today().isoformat()}"]
+
+    def test_failed_date_counted_and_others_continue(
+        self, orchestrator, sample_sitzung, mock_calendar_source, mock_ltzf_api
+    ):
+        mock_calendar_source.fetch_sessions.return_value = [
+            self._sitzung(sample_sitzung, -2),
+            self._sitzung(sample_sitzung, -1),
+            self._sitzung(sample_sitzung, 0),
+        ]
+        mock_ltzf_api.submit_sitzungen.side_effect = [False, RuntimeError("boom"), True]
+
+        stats = orchestrator.run_kalender()
+
+        assert (stats.submitted, stats.errors) == (1, 2)
+
+    def test_stop_leaves_remaining_dates(self, orchestrator, sample_sitzung, mock_calendar_source, mock_ltzf_api):
+        mock_calendar_source.fetch_sessions.return_value = [
+            self._sitzung(sample_sitzung, -1),
+            self._sitzung(sample_sitzung, 0),
+        ]
+        mock_ltzf_api.submit_sitzungen.side_effect = lambda *_: orchestrator.request_stop() or True
+
+        stats = orchestrator.run_kalender()
+
+        assert (stats.submitted, stats.deferred) == (1, 1)
+
+
 class TestRun:
     def test_run_delegates_to_run_vorgaenge(self, orchestrator, mock_vorgang_source, mock_cache):
         mock_vorgang_source.search.return_value = []
@@ -3,6 +3,7 @@
 from datetime import date
 
 import pytest
+import requests
 import responses
 
 from bawue_scraper.adapters.parlis_adapter import ParlisAdapter
@@ -358,3 +359,41 @@ class TestDateSubdivision:
         # Only 1 GET to BASE_URL (session establishment), not 3
         session_calls = [c for c in responses.calls if c.request.method == "GET" and c.request.url == BASE_URL]
         assert len(session_calls) == 1
+
+
+class TestSessionReuse:
+    @responses.activate
+    def test_session_reused_across_searches(self, adapter):
+        _mock_search(SAMPLE_HTML_RECORD, item_count=0)
+        responses.add(responses.POST, BROWSE_URL, json={"report_id": "rpt-2", "item_count": 0}, status=200)
+
+        adapter.search("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1))
+        adapter.search("Antrag", date(2026, 1, 1), date(2026, 2, 1))
+
+        session_calls = [c for c in responses.calls if c.request.method == "GET" and c.request.url == BASE_URL]
+        assert len(session_calls) == 1
+
+    @responses.activate
+    def test_session_reestablished_after_ttl(self, adapter, monkeypatch):
+        monkeypatch.setattr(adapter._config, "parlis_session_ttl_s", 0)
+        _mock_search(SAMPLE_HTML_RECORD, item_count=0)
+        _mock_search(SAMPLE_HTML_RECORD, item_count=0)
+
+        adapter.search("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1))
+        adapter.search("Antrag", date(2026, 1, 1), date(2026, 2, 1))
+
+        session_calls = [c for c in responses.calls if c.request.method == "GET" and c.request.url == BASE_URL]
+        assert len(session_calls) == 2
+
+    @responses.activate
+    def test_session_reestablished_after_request_error(self, adapter):
+        responses.add(responses.GET, BASE_URL, body="<html></html>", status=200)
+        responses.add(responses.POST, BROWSE_URL, status=500)
+        _mock_search(SAMPLE_HTML_RECORD, item_count=0)
+
+        with pytest.raises(requests.HTTPError):
+            adapter.search("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1))
+        adapter.search("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1))
+
+        session_calls = [c for c in responses.calls if c.request.method == "GET" and c.request.url == BASE_URL]
+        assert len(session_calls) == 2
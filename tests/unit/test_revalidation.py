@@ -0,0 +1,67 @@
+"""Tests for the revalidation policy."""
+
+from datetime import date, datetime
+
+import pytest
+
+from bawue_scraper.revalidation import RevalidationPolicy
+
+DAY_S = 86400.0
+NOW = datetime(2026, 3, 1).timestamp()
+
+
+def _raw(vorgangstyp: str, *fundstellen: tuple[str, str]) -> dict:
+    """A raw Vorgang with (station_typ, datum) Fundstellen."""
+    return {
+        "vorgangs_id": "V-1",
+        "Vorgangstyp": vorgangstyp,
+        "Initiative": "Fraktion GRÜNE",
+        "fundstellen_parsed": [
+            {"raw": f"{station_typ} {datum}", "station_typ": station_typ, "datum": datum}
+            for station_typ, datum in fundstellen
+        ],
+    }
+
+
+@pytest.fixture()
+def policy(config):
+    config.revalidate_interval_days = {"Gesetzgebung": 3.0}
+    config.revalidate_answer_due_days = 21.0
+    return RevalidationPolicy(config)
+
+
+class TestRevalidationPolicy:
+    def test_open_gesetzgebung_rechecked_after_interval(self, policy):
+        raw = _raw("Gesetzgebung", ("Erste Beratung", "05.02.2026"), ("Gesetzentwurf", "04.02.2026"))
+
+        verification = policy.verify(raw, NOW)
+
+        assert (verification.vorgang_id, verification.vorgangstyp) == ("V-1", "Gesetzgebung")
+        assert verification.since == date(2026, 2, 4)
+        assert verification.due_at == NOW + 3 * DAY_S
+
+    @pytest.mark.parametrize("terminal", ["Inkrafttreten", "Ablehnung"])
+    def test_terminal_station_freezes(self, policy, terminal):
+        raw = _raw("Gesetzgebung", ("Gesetzentwurf", "04.02.2026"), (terminal, "20.02.2026"))
+
+        assert policy.verify(raw, NOW).due_at is None
+
+    def test_type_without_interval_not_rechecked(self, policy):
+        assert policy.verify(_raw("Antrag", ("Antrag", "04.02.2026")), NOW).due_at is None
+
+    def test_kleine_anfrage_rechecked_once_when_answer_due(self, policy):
+        raw = _raw("Kleine Anfrage", ("Kleine Anfrage", "20.02.2026"))
+
+        assert policy.verify(raw, NOW).due_at == datetime(2026, 3, 13).timestamp()
+        # Checked after the answer was due and still unanswered: frozen
+        assert policy.verify(raw, datetime(2026, 3, 14).timestamp()).due_at is None
+
+    def test_answered_kleine_anfrage_frozen(self, policy):
+        raw = _raw("Kleine Anfrage", ("Kleine Anfrage und Antwort", "20.02.2026"))
+
+        assert policy.verify(raw, NOW).due_at is None
+
+    def test_since_falls_back_to_today_without_dates(self, policy):
+        raw = _raw("Gesetzgebung", ("Gesetzentwurf", "unbekannt"))
+
+        assert policy.verify(raw, NOW).since == date(2026, 3, 1)
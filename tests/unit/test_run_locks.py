@@ -0,0 +1,46 @@
+"""Tests for the file and SQLite run locks."""
+
+import pytest
+
+from bawue_scraper.adapters.run_locks import FileRunLock, SqliteRunLock
+
+
+@pytest.mark.parametrize("lock_cls", [FileRunLock, SqliteRunLock])
+class TestRunLocks:
+    def test_second_process_cannot_acquire(self, lock_cls, tmp_cache_config):
+        leader, standby = lock_cls(tmp_cache_config), lock_cls(tmp_cache_config)
+
+        assert leader.try_acquire("a", 60)
+        assert not standby.try_acquire("b", 60)
+
+    def test_release_lets_standby_take_over(self, lock_cls, tmp_cache_config):
+        leader, standby = lock_cls(tmp_cache_config), lock_cls(tmp_cache_config)
+        leader.try_acquire("a", 60)
+
+        leader.release("a")
+
+        assert standby.try_acquire("b", 60)
+
+    def test_reacquire_by_holder_succeeds(self, lock_cls, tmp_cache_config):
+        lock = lock_cls(tmp_cache_config)
+
+        assert lock.try_acquire("a", 60)
+        assert lock.try_acquire("a", 60)
+        assert lock.renew("a", 60)
+
+
+class TestSqliteRunLock:
+    def test_expired_lease_is_taken_over(self, tmp_cache_config):
+        leader, standby = SqliteRunLock(tmp_cache_config), SqliteRunLock(tmp_cache_config)
+        leader.try_acquire("a", -1)
+
+        assert standby.try_acquire("b", 60)
+        assert not leader.renew("a", 60)
+
+    def test_release_by_non_holder_keeps_lease(self, tmp_cache_config):
+        leader, standby = SqliteRunLock(tmp_cache_config), SqliteRunLock(tmp_cache_config)
+        leader.try_acquire("a", 60)
+
+        standby.release("b")
+
+        assert not standby.try_acquire("b", 60)
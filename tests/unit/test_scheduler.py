@@ -0,0 +1,107 @@
+"""Tests for the daemon-mode scheduler."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from bawue_scraper.scheduler import KALENDER_KEY, Scheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def scheduler_config(config, monkeypatch):
+    monkeypatch.setattr(config, "scrape_interval_hours", 24)
+    monkeypatch.setattr(config, "scrape_jitter_s", 0.0)
+    monkeypatch.setattr(config, "vorgangstyp_interval_hours", {"Kleine Anfrage": 48})
+    return config
+
+
+class TestScheduler:
+    def test_everything_due_on_start(self, scheduler_config):
+        scheduler = Scheduler(scheduler_config, MagicMock(), ["Gesetzgebung", "Kleine Anfrage"], clock=FakeClock())
+        assert scheduler.due() == ["Gesetzgebung", "Kleine Anfrage", KALENDER_KEY]
+
+    def test_run_pending_runs_due_types_in_one_cycle(self, scheduler_config):
+        orchestrator = MagicMock()
+        scheduler = Scheduler(
+            scheduler_config,
+            orchestrator,
+            ["Gesetzgebung", "Kleine Anfrage"],
+            include_kalender=False,
+            clock=FakeClock(),
+        )
+
+        scheduler.run_pending()
+
+        orchestrator.run_vorgaenge.assert_called_once()
+        assert orchestrator.run_vorgaenge.call_args.kwargs["vorgangstypen"] == ["Gesetzgebung", "Kleine Anfrage"]
+        assert scheduler.due() == []
+
+    def test_time_budget_passed_to_each_cycle(self, scheduler_config):
+        orchestrator = MagicMock()
+        scheduler = Scheduler(
+            scheduler_config,
+            orchestrator,
+            ["Gesetzgebung"],
+            include_kalender=False,
+            time_budget_s=1800.0,
+            clock=FakeClock(),
+        )
+
+        scheduler.run_pending()
+
+        assert orchestrator.run_vorgaenge.call_args.kwargs["time_budget_s"] == 1800.0
+
+    def test_per_type_cadence(self, scheduler_config):
+        clock = FakeClock()
+        orchestrator = MagicMock()
+        scheduler = Scheduler(
+            scheduler_config, orchestrator, ["Gesetzgebung", "Kleine Anfrage"], include_kalender=False, clock=clock
+        )
+        scheduler.run_pending()
+
+        clock.now += 24 * 3600
+        assert scheduler.due() == ["Gesetzgebung"]
+        scheduler.run_pending()
+        assert orchestrator.run_vorgaenge.call_args.kwargs["vorgangstypen"] == ["Gesetzgebung"]
+
+        clock.now += 24 * 3600
+        assert scheduler.due() == ["Gesetzgebung", "Kleine Anfrage"]
+
+    def test_jitter_delays_next_run(self, scheduler_config, monkeypatch):
+        monkeypatch.setattr(scheduler_config, "scrape_jitter_s", 600.0)
+        monkeypatch.setattr("bawue_scraper.scheduler.random.uniform", lambda a, b: b)
+        scheduler = Scheduler(
+            scheduler_config, MagicMock(), ["Gesetzgebung"], include_kalender=False, clock=FakeClock()
+        )
+
+        scheduler.run_pending()
+
+        assert scheduler.seconds_until_next() == 24 * 3600 + 600
+
+    def test_failed_cycle_does_not_raise(self, scheduler_config):
+        orchestrator = MagicMock()
+        orchestrator.run_vorgaenge.side_effect = RuntimeError("PARLIS down")
+        orchestrator.run_kalender.side_effect = NotImplementedError
+        scheduler = Scheduler(scheduler_config, orchestrator, ["Gesetzgebung"], clock=FakeClock())
+
+        scheduler.run_pending()
+
+        orchestrator.run_kalender.assert_called_once()
+        assert scheduler.due() == []
+
+    def test_stop_ends_run_forever(self, scheduler_config):
+        orchestrator = MagicMock()
+        scheduler = Scheduler(scheduler_config, orchestrator, ["Gesetzgebung"], clock=FakeClock())
+        orchestrator.run_kalender.side_effect = lambda: scheduler.stop()
+
+        scheduler.run_forever()
+
+        orchestrator.run_vorgaenge.assert_called_once()
@@ -0,0 +1,203 @@
+"""Tests for the SQLite-backed cache."""
+
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from bawue_scraper.adapters.sqlite_cache import SqliteCache
+from bawue_scraper.config import Config
+
+
+def _open_cache(config: Config) -> None:
+    """Open the cache, as a separate scraper process starting at the same time would."""
+    SqliteCache(config)
+
+
+class TestSqliteCache:
+    def test_mark_processed_then_is_processed(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+        assert cache.is_processed("V-1") is False
+
+        cache.mark_processed("V-1")
+        cache.mark_processed("V-1")
+
+        assert cache.is_processed("V-1") is True
+
+    def test_invalidate(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed("V-1")
+
+        cache.invalidate("V-1")
+        cache.invalidate("V-2")
+
+        assert cache.is_processed("V-1") is False
+
+    def test_mark_processed_many_persists(self, tmp_cache_config):
+        SqliteCache(tmp_cache_config).mark_processed_many(["V-1", "V-2", "V-1"])
+
+        cache = SqliteCache(tmp_cache_config)
+        assert cache.is_processed("V-1") and cache.is_processed("V-2")
+
+    def test_mark_processed_many_rolls_back_on_error(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+
+        def ids():
+            yield "V-1"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.mark_processed_many(ids())
+        assert cache.is_processed("V-1") is False
+
+    def test_filter_unprocessed_across_chunks(self, tmp_cache_config, monkeypatch):
+        monkeypatch.setattr("bawue_scraper.adapters.sqlite_cache._LOOKUP_CHUNK", 2)
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed_many(["V-2", "V-4"])
+
+        assert cache.filter_unprocessed(["V-1", "V-2", "V-3", "V-4", "V-5"]) == ["V-1", "V-3", "V-5"]
+
+    def test_changed_source_counts_as_unprocessed(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed("V-1", source_fingerprint="a")
+        cache.mark_processed("V-1")
+        cache.mark_processed("V-2")
+
+        reopened = SqliteCache(tmp_cache_config)
+        assert reopened.filter_unprocessed(["V-1", "V-2"], source_fingerprints={"V-1": "b", "V-2": "c"}) == ["V-1"]
+        # V-2 had no fingerprint and adopted "c"
+        assert reopened.filter_unprocessed(["V-2"], source_fingerprints={"V-2": "d"}) == ["V-2"]
+
+    def test_adds_fingerprint_column_to_existing_database(self, tmp_cache_config):
+        import sqlite3
+
+        cache_dir = Path(tmp_cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        with sqlite3.connect(cache_dir / "processed.sqlite3") as conn:
+            conn.execute(
+                "CREATE TABLE processed (vorgang_id TEXT PRIMARY KEY, processed_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            conn.execute("INSERT INTO processed VALUES ('V-1', 0)")
+
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed("V-1", source_fingerprint="a")
+
+        assert cache.filter_unprocessed(["V-1"], source_fingerprints={"V-1": "b"}) == ["V-1"]
+
+    def test_database_in_wal_mode(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestJsonMigration:
+    def test_imports_source_fingerprints(self, tmp_cache_config):
+        cache_dir = Path(tmp_cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text(json.dumps({"V-1": "a", "V-2": None}), encoding="utf-8")
+
+        cache = SqliteCache(tmp_cache_config)
+
+        assert cache.filter_unprocessed(["V-1", "V-3"], source_fingerprints={"V-1": "b"}) == ["V-1", "V-3"]
+        assert cache.is_processed("V-2") is True
+
+    def test_imports_json_ids_once(self, tmp_cache_config):
+        cache_dir = Path(tmp_cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text(json.dumps(["V-1", "V-2"]), encoding="utf-8")
+
+        cache = SqliteCache(tmp_cache_config)
+        cache.invalidate("V-2")
+
+        assert not (cache_dir / "processed.json").exists()
+        assert (cache_dir / "processed.json.migrated").exists()
+        # A second start does not import the set-aside file again
+        cache = SqliteCache(tmp_cache_config)
+        assert cache.is_processed("V-1") is True
+        assert cache.is_processed("V-2") is False
+
+    def test_concurrent_starts_migrate_once(self, tmp_cache_config):
+        cache_dir = Path(tmp_cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text(
+            json.dumps({f"V-{i:05d}": None for i in range(20000)}), encoding="utf-8"
+        )
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_open_cache, args=(tmp_cache_config,)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+        assert not (cache_dir / "processed.json").exists()
+        assert (cache_dir / "processed.json.migrated").exists()
+        cache = SqliteCache(tmp_cache_config)
+        assert cache.filter_unprocessed(["V-00000", "V-19999", "V-20000"]) == ["V-20000"]
+
+    def test_corrupt_json_left_in_place(self, tmp_cache_config):
+        cache_dir = Path(tmp_cache_config.cache_dir)
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "processed.json").write_text("{not json", encoding="utf-8")
+
+        cache = SqliteCache(tmp_cache_config)
+
+        assert cache.is_processed("V-1") is False
+        assert (cache_dir / "processed.json").exists()
+
+
+class TestBatch:
+    def test_changes_committed_on_exit(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed("V-1")
+
+        with cache.batch():
+            cache.mark_processed("V-2")
+            cache.invalidate("V-1")
+            # Visible to this instance at once, but not yet in the database
+            assert (cache.is_processed("V-1"), cache.is_processed("V-2")) == (False, True)
+            assert cache.filter_unprocessed(["V-1", "V-2"]) == ["V-1"]
+            assert SqliteCache(tmp_cache_config).is_processed("V-2") is False
+
+        reopened = SqliteCache(tmp_cache_config)
+        assert (reopened.is_processed("V-1"), reopened.is_processed("V-2")) == (False, True)
+
+    def test_flush_is_a_commit_point(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+
+        with cache.batch():
+            cache.mark_processed("V-1")
+            cache.flush()
+            assert SqliteCache(tmp_cache_config).is_processed("V-1") is True
+
+    def test_nested_batch_commits_with_outermost(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+
+        with cache.batch():
+            with cache.batch():
+                cache.mark_processed("V-1")
+            assert SqliteCache(tmp_cache_config).is_processed("V-1") is False
+
+        assert SqliteCache(tmp_cache_config).is_processed("V-1") is True
+
+    def test_pending_fingerprints_compared(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+        cache.mark_processed("V-1", source_fingerprint="a")
+
+        with cache.batch():
+            cache.mark_processed("V-1", source_fingerprint="b")
+            cache.mark_processed("V-1")
+            assert cache.filter_unprocessed(["V-1"], source_fingerprints={"V-1": "a"}) == ["V-1"]
+
+        assert SqliteCache(tmp_cache_config).filter_unprocessed(["V-1"], source_fingerprints={"V-1": "b"}) == []
+
+    def test_commits_on_exception(self, tmp_cache_config):
+        cache = SqliteCache(tmp_cache_config)
+
+        with pytest.raises(RuntimeError), cache.batch():
+            cache.mark_processed("V-1")
+            raise RuntimeError("boom")
+
+        assert SqliteCache(tmp_cache_config).is_processed("V-1") is True
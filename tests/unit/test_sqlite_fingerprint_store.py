@@ -0,0 +1,15 @@
+"""Tests for the SQLite-backed fingerprint store."""
+
+from bawue_scraper.adapters.sqlite_fingerprint_store import SqliteFingerprintStore
+
+
+class TestSqliteFingerprintStore:
+    def test_unknown_api_id_returns_none(self, tmp_cache_config):
+        assert SqliteFingerprintStore(tmp_cache_config).get("a") is None
+
+    def test_put_overwrites_and_persists(self, tmp_cache_config):
+        store = SqliteFingerprintStore(tmp_cache_config)
+        store.put("a", "1")
+        store.put("a", "2")
+
+        assert SqliteFingerprintStore(tmp_cache_config).get("a") == "2"
@@ -0,0 +1,45 @@
+"""Tests for the SQLite-backed submission outbox."""
+
+from bawue_scraper.adapters.sqlite_outbox import SqliteOutbox
+
+URL = "http://localhost:8080/api/v2/vorgang"
+
+
+class TestSqliteOutbox:
+    def test_put_then_due(self, tmp_cache_config):
+        outbox = SqliteOutbox(tmp_cache_config)
+        outbox.put("vorgang:1", URL, b'{"a": 1}')
+
+        [entry] = outbox.due(10)
+
+        assert (entry.key, entry.url, entry.body, entry.attempts) == ("vorgang:1", URL, b'{"a": 1}', 0)
+
+    def test_put_replaces_entry_with_same_key(self, tmp_cache_config):
+        outbox = SqliteOutbox(tmp_cache_config)
+        outbox.put("vorgang:1", URL, b"old")
+        outbox.put("vorgang:1", URL, b"new")
+
+        assert outbox.count() == 1
+        assert outbox.due(10)[0].body == b"new"
+
+    def test_deferred_entry_not_due(self, tmp_cache_config):
+        outbox = SqliteOutbox(tmp_cache_config)
+        outbox.put("vorgang:1", URL, b"{}")
+
+        outbox.defer("vorgang:1", "HTTP 503")
+
+        assert outbox.due(10) == []
+        assert outbox.count() == 1
+
+    def test_remove(self, tmp_cache_config):
+        outbox = SqliteOutbox(tmp_cache_config)
+        outbox.put("vorgang:1", URL, b"{}")
+
+        outbox.remove("vorgang:1")
+
+        assert outbox.count() == 0
+
+    def test_survives_reopen(self, tmp_cache_config):
+        SqliteOutbox(tmp_cache_config).put("vorgang:1", URL, b"{}")
+
+        assert SqliteOutbox(tmp_cache_config).count() == 1
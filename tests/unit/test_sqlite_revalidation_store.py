@@ -0,0 +1,53 @@
+"""Tests for the SQLite-backed revalidation store."""
+
+from datetime import date
+
+from bawue_scraper.adapters.sqlite_revalidation_store import SqliteRevalidationStore
+from bawue_scraper.ports.revalidation_store import Verification
+
+
+class TestSqliteRevalidationStore:
+    def test_due_since_per_vorgangstyp(self, tmp_cache_config):
+        store = SqliteRevalidationStore(tmp_cache_config)
+        store.record(
+            [
+                Verification("V-1", "Gesetzgebung", date(2026, 3, 1), 100.0),
+                Verification("V-2", "Gesetzgebung", date(2026, 1, 15), 200.0),
+                Verification("V-3", "Gesetzgebung", date(2025, 6, 1), 900.0),
+                Verification("V-4", "Antrag", date(2025, 1, 1), None),
+            ]
+        )
+
+        assert SqliteRevalidationStore(tmp_cache_config).due_since(500.0) == {"Gesetzgebung": date(2026, 1, 15)}
+
+    def test_record_replaces_entry(self, tmp_cache_config):
+        store = SqliteRevalidationStore(tmp_cache_config)
+        store.record([Verification("V-1", "Gesetzgebung", date(2026, 1, 1), 100.0)])
+        store.record([Verification("V-1", "Gesetzgebung", date(2026, 1, 1), 1000.0)])
+
+        assert store.due_since(500.0) == {}
+
+    def test_clear_due_only_within_searched_range(self, tmp_cache_config):
+        store = SqliteRevalidationStore(tmp_cache_config)
+        store.record(
+            [
+                Verification("V-1", "Gesetzgebung", date(2026, 1, 10), 100.0),
+                Verification("V-2", "Gesetzgebung", date(2025, 12, 1), 100.0),
+                Verification("V-3", "Antrag", date(2026, 1, 10), 100.0),
+            ]
+        )
+
+        assert store.clear_due("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1), 500.0, seen=()) == 1
+        assert store.due_since(500.0) == {"Gesetzgebung": date(2025, 12, 1), "Antrag": date(2026, 1, 10)}
+
+    def test_clear_due_keeps_seen_entries(self, tmp_cache_config):
+        store = SqliteRevalidationStore(tmp_cache_config)
+        store.record(
+            [
+                Verification("V-1", "Gesetzgebung", date(2026, 1, 10), 100.0),
+                Verification("V-2", "Gesetzgebung", date(2026, 1, 20), 100.0),
+            ]
+        )
+
+        assert store.clear_due("Gesetzgebung", date(2026, 1, 1), date(2026, 2, 1), 500.0, seen={"V-1"}) == 1
+        assert store.due_since(500.0) == {"Gesetzgebung": date(2026, 1, 10)}
@@ -0,0 +1,112 @@
+"""Tests for the SQLite-backed work queue."""
+
+import pytest
+
+from bawue_scraper.adapters.sqlite_work_queue import SqliteWorkQueue
+
+
+@pytest.fixture()
+def queue_config(tmp_cache_config, monkeypatch):
+    """``tmp_cache_config`` with units failed after their second attempt."""
+    monkeypatch.setattr(tmp_cache_config, "work_queue_max_attempts", 2)
+    return tmp_cache_config
+
+
+class TestSqliteWorkQueue:
+    def test_lease_returns_none_when_empty(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        assert queue.lease("w1", 60) is None
+
+    def test_enqueue_then_lease_and_ack(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("search", {"vorgangstyp": "Gesetzgebung"})
+
+        unit = queue.lease("w1", 60)
+        assert unit is not None
+        assert unit.kind == "search"
+        assert unit.payload == {"vorgangstyp": "Gesetzgebung"}
+        assert unit.attempts == 1
+        assert queue.outstanding() == 1
+
+        queue.ack(unit.unit_id, "w1")
+        assert queue.outstanding() == 0
+        assert queue.lease("w1", 60) is None
+
+    def test_leased_unit_not_handed_out_twice(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("search", {})
+
+        assert queue.lease("w1", 60) is not None
+        assert queue.lease("w2", 60) is None
+
+    def test_expired_lease_is_requeued(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("search", {})
+
+        first = queue.lease("w1", -1)  # already expired, as if the worker crashed
+        second = queue.lease("w2", 60)
+
+        assert second is not None
+        assert second.unit_id == first.unit_id
+        assert second.attempts == 2
+
+    def test_release_requeues_until_max_attempts(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("build", {})
+
+        unit = queue.lease("w1", 60)
+        queue.release(unit.unit_id, "w1", "boom")
+        unit = queue.lease("w1", 60)
+        assert unit is not None
+
+        queue.release(unit.unit_id, "w1", "boom")
+        assert queue.lease("w1", 60) is None
+        assert queue.outstanding() == 0
+
+    def test_expired_lease_fails_after_max_attempts(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("build", {})
+
+        queue.lease("w1", -1)
+        queue.lease("w2", -1)
+
+        assert queue.lease("w3", 60) is None
+        assert queue.outstanding() == 0
+
+    def test_late_release_does_not_touch_new_lease(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("build", {})
+        unit = queue.lease("w1", -1)
+        queue.lease("w2", 60)
+
+        queue.release(unit.unit_id, "w1", "boom")
+        queue.ack(unit.unit_id, "w1")
+
+        assert queue.outstanding() == 1
+        queue.ack(unit.unit_id, "w2")
+        assert queue.outstanding() == 0
+
+    def test_dedupe_key_prevents_duplicate_pending_units(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("build", {"n": 1}, dedupe_key="build:V-001")
+        queue.enqueue("build", {"n": 2}, dedupe_key="build:V-001")
+
+        assert queue.outstanding() == 1
+
+    def test_dedupe_key_reopens_done_unit(self, queue_config):
+        queue = SqliteWorkQueue(queue_config)
+        queue.enqueue("search", {}, dedupe_key="search:A")
+        queue.ack(queue.lease("w1", 60).unit_id, "w1")
+
+        queue.enqueue("search", {}, dedupe_key="search:A")
+
+        assert queue.outstanding() == 1
+
+    def test_queue_shared_between_instances(self, queue_config):
+        planner = SqliteWorkQueue(queue_config)
+        worker = SqliteWorkQueue(queue_config)
+        planner.enqueue("search", {"x": 1})
+
+        unit = worker.lease("w1", 60)
+        assert unit is not None
+        assert unit.payload == {"x": 1}
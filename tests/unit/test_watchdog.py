@@ -0,0 +1,41 @@
+"""Tests for stage deadlines."""
+
+import math
+import threading
+import time
+
+import pytest
+
+from bawue_scraper.watchdog import DeadlineExceeded, run_with_deadline
+
+
+class TestRunWithDeadline:
+    def test_returns_result(self):
+        assert run_with_deadline(lambda: 42, 1.0, "stage") == 42
+
+    def test_propagates_exception(self):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_with_deadline(fail, 1.0, "stage")
+
+    def test_raises_on_timeout_without_waiting_for_the_work(self):
+        release = threading.Event()
+
+        with pytest.raises(DeadlineExceeded, match="PDF extraction"):
+            run_with_deadline(release.wait, 0.05, "PDF extraction")
+        release.set()
+
+    @pytest.mark.parametrize("deadline_s", [None, 0])
+    def test_no_deadline_runs_inline(self, deadline_s):
+        assert run_with_deadline(threading.current_thread, deadline_s, "stage") is threading.current_thread()
+
+    def test_cutoff_moved_earlier_interrupts_wait(self):
+        release = threading.Event()
+        cutoff = {"at": math.inf}
+        threading.Timer(0.05, lambda: cutoff.update(at=time.monotonic())).start()
+
+        with pytest.raises(DeadlineExceeded, match="cut off"):
+            run_with_deadline(release.wait, 60, "stage", cutoff=lambda: cutoff["at"])
+        release.set()